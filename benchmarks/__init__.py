@@ -0,0 +1,10 @@
+"""
+Спільні бенчмарки лабораторних 2-6: час, пропускна здатність, пам'ять, профілі cProfile.
+
+Модулі лабораторних імпортуються без запуску інтерактивної частини (див. labs.py),
+кожне навантаження виконується в окремому процесі, а результати зберігаються в JSON
+і порівнюються з базовими. Запуск: python -m benchmarks --help
+"""
+from .baseline import BASELINE_PATH, compare, load_results
+from .measure import run_case, run_isolated
+from .workloads import WORKLOADS, Workload
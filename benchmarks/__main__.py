@@ -0,0 +1,112 @@
+"""
+Запуск: python -m benchmarks (з кореня репозиторію).
+
+Приклади:
+    python -m benchmarks --list
+    python -m benchmarks --quick -o results.json
+    python -m benchmarks --only "lab3.*" --param 1 --profile profiles/
+    python -m benchmarks --save-baseline                  # записати benchmarks/baseline.json
+    python -m benchmarks --baseline --max-slowdown 0.2    # порівняти; код виходу 1 при регресії
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+
+from .baseline import BASELINE_PATH, compare, load_results, print_comparison
+from .measure import run_case, run_isolated
+from .workloads import WORKLOADS
+
+
+def _parse_param(text):
+    return float(text) if "." in text else int(text)
+
+
+def select_cases(patterns, params, quick):
+    """[(назва навантаження, параметр), ...] за фільтрами командного рядка."""
+    cases = []
+    for name, workload in WORKLOADS.items():
+        if patterns and not any(fnmatch.fnmatch(name, p) for p in patterns):
+            continue
+        values = params or (workload.params[:1] if quick else workload.params)
+        cases.extend((name, value) for value in values)
+    return cases
+
+
+def _size(value):
+    return "-" if value is None else f"{value / 2 ** 20:.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Бенчмарки та профілювання лабораторних 2-6")
+    parser.add_argument("--list", action="store_true", help="показати навантаження та параметри")
+    parser.add_argument("--only", nargs="+", metavar="PATTERN", help="навантаження за шаблоном (lab3.*)")
+    parser.add_argument("--param", nargs="+", type=_parse_param,
+                        help="власні значення параметра замість стандартних")
+    parser.add_argument("--quick", action="store_true", help="лише найменший параметр кожного навантаження")
+    parser.add_argument("--repeat", type=int, default=5, help="вимірюваних прогонів на випадок")
+    parser.add_argument("-o", "--output", help="записати результати в JSON")
+    parser.add_argument("--profile", metavar="DIR", help="записати .prof-файл cProfile для кожного випадку")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="виконувати в поточному процесі (RSS тоді накопичується між випадками)")
+    parser.add_argument("--baseline", nargs="?", const=BASELINE_PATH, help="порівняти з базовими результатами")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE_PATH, help="зберегти результати як базові")
+    parser.add_argument("--max-slowdown", type=float, default=0.25,
+                        help="допустиме падіння пропускної здатності (частка)")
+    parser.add_argument("--max-memory-growth", type=float, default=0.25,
+                        help="допустиме зростання піку tracemalloc (частка)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, workload in WORKLOADS.items():
+            print(f"{name:<28} {workload.unit:<14} {workload.params}  - {workload.description}")
+        return 0
+
+    cases = select_cases(args.only, args.param, args.quick)
+    if not cases:
+        print("[!] Жодне навантаження не відповідає фільтрам.", file=sys.stderr)
+        return 2
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except ValueError as exc:
+            print(f"[!] {exc}", file=sys.stderr)
+            return 2
+
+    measure = run_case if args.no_isolate else run_isolated
+    print(f"{'ВИПАДОК':<36} | {'КРАЩИЙ, c':>10} | {'ОДИНИЦЬ/с':>14} | {'RSS, MB':>8} | {'TRACEMALLOC, MB':>15}")
+    print("-" * 95)
+    results = []
+    for name, param in cases:
+        result = measure(name, param, args.repeat, args.profile)
+        results.append(result)
+        print(f"{result['id']:<36} | {result['wall_s']['min']:>10.4f} | {result['throughput']:>14,.0f} | "
+              f"{_size(result['peak_rss_bytes']):>8} | {_size(result['tracemalloc_peak_bytes']):>15}", flush=True)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"[+] Результати записано в {path}")
+
+    if baseline is not None:
+        rows = compare(baseline, results, args.max_slowdown, args.max_memory_growth)
+        if print_comparison(rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
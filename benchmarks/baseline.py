@@ -0,0 +1,61 @@
+"""
+Порівняння результатів з базовими (збереженими раніше на тому самому комп'ютері).
+
+Регресія - падіння пропускної здатності більше ніж на max_slowdown або зростання піку
+tracemalloc більше ніж на max_memory_growth (і щонайменше на MEMORY_SLACK байтів,
+щоб не реагувати на шум у кілька кілобайтів). Пікова RSS виводиться для довідки:
+вона включає інтерпретатор та імпортовані бібліотеки і надто шумна для порогу.
+"""
+import json
+import os
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+MEMORY_SLACK = 1 << 20
+
+
+def load_results(path: str) -> dict:
+    """Результати з JSON-файлу: {ідентифікатор випадку: результат}."""
+    if not os.path.exists(path):
+        raise ValueError(f"Помилка: Файл базових результатів {path} не знайдено (створіть його з --save-baseline).")
+    with open(path, encoding="utf-8") as f:
+        return {result["id"]: result for result in json.load(f)["results"]}
+
+
+def compare(baseline: dict, results: list, max_slowdown: float = 0.25, max_memory_growth: float = 0.25) -> list:
+    """
+    Порівнює results з baseline. Повертає рядки
+    (випадок, зміна пропускної здатності, зміна піку пам'яті, список порушень);
+    для випадків без базового результату зміни - None.
+    """
+    rows = []
+    for result in results:
+        base = baseline.get(result["id"])
+        if base is None:
+            rows.append((result["id"], None, None, []))
+            continue
+        problems = []
+        speed = result["throughput"] / base["throughput"] - 1
+        if speed < -max_slowdown:
+            problems.append(f"пропускна здатність {speed:+.0%}")
+
+        old_mem, new_mem = base["tracemalloc_peak_bytes"], result["tracemalloc_peak_bytes"]
+        memory = new_mem / old_mem - 1 if old_mem else 0.0
+        if memory > max_memory_growth and new_mem - old_mem > MEMORY_SLACK:
+            problems.append(f"пам'ять {memory:+.0%}")
+        rows.append((result["id"], speed, memory, problems))
+    return rows
+
+
+def print_comparison(rows: list) -> bool:
+    """Виводить таблицю порівняння. Повертає True, якщо є регресії."""
+    print("\n{:<36} | {:>9} | {:>8} | РЕЗУЛЬТАТ".format("ВИПАДОК", "ШВИДКІСТЬ", "ПАМ'ЯТЬ"))
+    print("-" * 80)
+    failed = False
+    for case, speed, memory, problems in rows:
+        if speed is None:
+            print(f"{case:<36} | {'-':>9} | {'-':>8} | новий випадок")
+            continue
+        failed = failed or bool(problems)
+        verdict = "РЕГРЕСІЯ: " + ", ".join(problems) if problems else "ok"
+        print(f"{case:<36} | {speed:>+9.1%} | {memory:>+8.1%} | {verdict}")
+    return failed
@@ -0,0 +1,47 @@
+"""
+Імпорт модулів лабораторних робіт без запуску інтерактивної частини.
+
+Скрипти лабораторних імпортують сусідні модулі за коротким ім'ям (from fast_stego import ...),
+тому папка лабораторної додається на початок sys.path. Інтерактивний код усіх скриптів
+захищений if __name__ == "__main__", а block_input() гарантує, що випадковий виклик
+input() у вимірюванні завершиться помилкою, а не зависанням.
+"""
+import builtins
+import contextlib
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def lab_dir(lab: str) -> str:
+    """Шлях до папки лабораторної ('lab02', 'lab03', ...)."""
+    path = os.path.join(ROOT, lab)
+    if not os.path.isdir(path):
+        raise ValueError(f"Помилка: Папку лабораторної {lab} не знайдено.")
+    return path
+
+
+def load(lab: str, module: str):
+    """Імпортує module з папки лабораторної lab."""
+    path = lab_dir(lab)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return importlib.import_module(module)
+
+
+def _no_input(prompt=""):
+    raise RuntimeError(f"Бенчмарк не підтримує інтерактивне введення (запит: {prompt!r}).")
+
+
+def block_input():
+    """Замінює builtins.input, щоб інтерактивний код не чекав на введення."""
+    builtins.input = _no_input
+
+
+@contextlib.contextmanager
+def quiet():
+    """Приглушує вивід функцій лабораторних (print у hide_message, secure_search тощо)."""
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
@@ -0,0 +1,106 @@
+"""
+Вимірювання одного навантаження: час, пропускна здатність, пам'ять, профіль.
+
+run_case виконується в окремому процесі (див. run_isolated), тому пікова RSS
+процесу належить саме цьому навантаженню, а не попереднім.
+Порядок вимірювань:
+  1. prepare та один прогрівальний прогін;
+  2. repeat прогонів із замірами часу (без tracemalloc - він сповільнює виділення пам'яті);
+  3. пікова RSS процесу після замірів часу;
+  4. один прогін під tracemalloc: пік виділеної Python пам'яті та рядки коду,
+     що утримують найбільше пам'яті після прогону;
+  5. за потреби - один прогін під cProfile із записом .prof-файлу.
+"""
+import cProfile
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from .labs import block_input, quiet
+from .workloads import WORKLOADS
+
+try:
+    import resource
+except ImportError:  # Windows: пікова RSS недоступна
+    resource = None
+
+TRACEMALLOC_TOP = 5
+
+
+def peak_rss() -> int:
+    """Пікова RSS поточного процесу в байтах (None, якщо недоступно)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux повертає кілобайти, macOS - байти
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def case_id(name: str, param) -> str:
+    return f"{name}[{param}]"
+
+
+def run_case(name: str, param, repeat: int = 5, profile_dir: str = None) -> dict:
+    """Вимірює одне навантаження з параметром param. Повертає словник результатів."""
+    block_input()
+    workload = WORKLOADS[name]
+    rss_start = peak_rss()
+    with tempfile.TemporaryDirectory() as tmp:
+        with quiet():
+            run, amount = workload.prepare(param, tmp)
+            run()
+
+        times = []
+        for _ in range(repeat):
+            with quiet():
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+        rss = peak_rss()
+
+        tracemalloc.start()
+        with quiet():
+            run()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        top = [{"line": str(stat.traceback[0]), "bytes": stat.size}
+               for stat in snapshot.statistics("lineno")[:TRACEMALLOC_TOP]]
+
+        profile_path = None
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+            profile_path = os.path.join(profile_dir, f"{case_id(name, param)}.prof")
+            profiler = cProfile.Profile()
+            with quiet():
+                profiler.runcall(run)
+            profiler.dump_stats(profile_path)
+
+    median = statistics.median(times)
+    return {
+        "id": case_id(name, param),
+        "workload": name,
+        "param": param,
+        "unit": workload.unit,
+        "amount": amount,
+        "repeat": repeat,
+        "wall_s": {"min": min(times), "median": median, "max": max(times)},
+        # Найкращий прогін найменше залежить від фонового навантаження - за ним порівнюємо з базою
+        "throughput": amount / min(times) if min(times) else None,
+        "peak_rss_bytes": rss,
+        "start_rss_bytes": rss_start,
+        "tracemalloc_peak_bytes": traced_peak,
+        "tracemalloc_top": top,
+        "profile": profile_path,
+    }
+
+
+def run_isolated(name: str, param, repeat: int = 5, profile_dir: str = None) -> dict:
+    """run_case у новому процесі (spawn): чиста пам'ять і власна пікова RSS."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(run_case, name, param, repeat, profile_dir).result()
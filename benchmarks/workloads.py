@@ -0,0 +1,177 @@
+"""
+Параметризовані навантаження для основних функцій лабораторних 2-6.
+
+Кожне навантаження має функцію prepare(param, tmp): вона імпортує потрібний модуль,
+готує вхідні дані в тимчасовій папці tmp і повертає (run, amount), де run() - один
+прогін вимірюваної роботи без аргументів, а amount - обсяг роботи за прогін
+в одиницях unit (для пропускної здатності).
+"""
+import os
+import random
+
+from .labs import load
+
+TEXT_SAMPLE = "Курка чи яйце, що було раніше? Захист інформації 2025! "
+SECRET = "Сховане повідомлення: Курка чи яйце 12312"
+
+
+class Workload:
+    """Опис навантаження: лабораторна, одиниця обсягу, параметри за замовчуванням."""
+
+    def __init__(self, name, lab, unit, params, prepare, description):
+        self.name = name
+        self.lab = lab
+        self.unit = unit
+        self.params = params
+        self.prepare = prepare
+        self.description = description
+
+
+def _text(chars):
+    return (TEXT_SAMPLE * (chars // len(TEXT_SAMPLE) + 1))[:chars]
+
+
+# --- lab02: шифри Цезаря та Віженера ---
+
+def _lab2(func_name, module="lab2", args=()):
+    def prepare(chars, tmp):
+        func = getattr(load("lab02", module), func_name)
+        text = _text(chars)
+        return (lambda: func(text, *args)), chars
+    return prepare
+
+
+# --- lab03: LSB-стеганографія ---
+
+def _make_cover(path, megapixels):
+    from PIL import Image
+    import numpy as np
+
+    side = int((megapixels * 1_000_000) ** 0.5)
+    rng = np.random.default_rng(2025)
+    Image.fromarray(rng.integers(0, 256, (side, side, 3), dtype=np.uint8), 'RGB').save(path)
+    return side * side
+
+
+def _lab3_hide(module):
+    def prepare(megapixels, tmp):
+        hide_message = load("lab03", module).hide_message
+        cover, stego = os.path.join(tmp, "cover.png"), os.path.join(tmp, "stego.png")
+        pixels = _make_cover(cover, megapixels)
+        return (lambda: hide_message(cover, stego, SECRET)), pixels
+    return prepare
+
+
+def _lab3_extract(module):
+    def prepare(megapixels, tmp):
+        lab = load("lab03", module)
+        cover, stego = os.path.join(tmp, "cover.png"), os.path.join(tmp, "stego.png")
+        pixels = _make_cover(cover, megapixels)
+        lab.hide_message(cover, stego, SECRET)
+        return (lambda: lab.extract_message(stego)), pixels
+    return prepare
+
+
+# --- lab04: підпис файлів ---
+
+def _make_file(path, megabytes):
+    size = int(megabytes * (1 << 20))
+    block = random.Random(2025).randbytes(1 << 20)
+    with open(path, "wb") as f:
+        for start in range(0, size, len(block)):
+            f.write(block[:size - start])
+    return size
+
+
+def _lab4(func_name):
+    def prepare(megabytes, tmp):
+        lab = load("lab04", "lab_4_kozhan")
+        path = os.path.join(tmp, "document.bin")
+        size = _make_file(path, megabytes)
+        private_key = lab.derive_private_key("Кожан", "01012000", "secret")
+        if func_name == "sign_file":
+            return (lambda: lab.sign_file(path, private_key)), size
+        signature = lab.sign_file(path, private_key)
+        public_key = lab.public_key_from_private(private_key)
+        return (lambda: lab.verify_file(path, signature, public_key, private_key)), size
+    return prepare
+
+
+# --- lab05: шифрування Fernet з ключем з пароля ---
+
+def _lab5_encrypt(calls, tmp):
+    encryptor = load("lab05", "lab_5_kozan").MessageEncryptor(use_key_cache=False)
+
+    def run():
+        for _ in range(calls):
+            encryptor.encrypt(SECRET, "КОЖАН")
+    return run, calls
+
+
+def _lab5_decrypt(calls, tmp):
+    encryptor = load("lab05", "lab_5_kozan").MessageEncryptor(use_key_cache=False)
+    tokens = [encryptor.encrypt(SECRET, "КОЖАН") for _ in range(calls)]
+
+    def run():
+        for token in tokens:
+            encryptor.decrypt(token, "КОЖАН")
+    return run, calls
+
+
+# --- lab06: пошук співробітників ---
+
+DB_ROWS = 10_000
+
+
+def _lab6(func_name, cached=False):
+    def prepare(queries, tmp):
+        load("lab06", "employees_store").bulk_load(os.path.join(tmp, "bench.sqlite"), DB_ROWS)
+        lab = load("lab06", "lab_6_kozhan")
+        pool = load("lab06", "db_pool").ConnectionPool(os.path.join(tmp, "bench.sqlite"))
+        cache = load("lab06", "result_cache").SearchResultCache(pool) if cached else None
+        names = [row[0] for row in pool.connection().execute("SELECT name FROM employees LIMIT 1000")]
+        rng = random.Random(1)
+        # Приблизно половина прізвищ відсутня в БД
+        terms = [rng.choice(names) if rng.random() < 0.5 else f"Absent{i}" for i in range(queries)]
+        search = getattr(lab, func_name)
+
+        def run():
+            for term in terms:
+                if cached:
+                    search(term, cache=cache)
+                else:
+                    search(term, pool=pool)
+        return run, queries
+    return prepare
+
+
+WORKLOADS = {w.name: w for w in [
+    Workload("lab2.caesar", "lab02", "символів", [10_000, 100_000, 1_000_000],
+             _lab2("caesar_cipher", args=(8,)), "lab2.caesar_cipher"),
+    Workload("lab2.vigenere", "lab02", "символів", [10_000, 100_000, 1_000_000],
+             _lab2("vigenere_cipher", args=("КОЖАН",)), "lab2.vigenere_cipher"),
+    Workload("lab2.fast_vigenere", "lab02", "символів", [10_000, 1_000_000, 10_000_000],
+             _lab2("fast_vigenere", "fast_cipher", ("КОЖАН",)), "fast_cipher.fast_vigenere"),
+    Workload("lab3.hide", "lab03", "пікселів", [0.25, 1],
+             _lab3_hide("lab_3_kozhan"), "lab_3_kozhan.hide_message"),
+    Workload("lab3.extract", "lab03", "пікселів", [0.25, 1],
+             _lab3_extract("lab_3_kozhan"), "lab_3_kozhan.extract_message"),
+    Workload("lab3.fast_hide", "lab03", "пікселів", [0.25, 1, 4],
+             _lab3_hide("fast_stego"), "fast_stego.hide_message"),
+    Workload("lab3.fast_extract", "lab03", "пікселів", [0.25, 1, 4],
+             _lab3_extract("fast_stego"), "fast_stego.extract_message"),
+    Workload("lab4.sign", "lab04", "байтів", [1, 16, 64],
+             _lab4("sign_file"), "lab_4_kozhan.sign_file (МБ)"),
+    Workload("lab4.verify", "lab04", "байтів", [1, 16, 64],
+             _lab4("verify_file"), "lab_4_kozhan.verify_file (МБ)"),
+    Workload("lab5.encrypt", "lab05", "викликів KDF", [1, 4],
+             _lab5_encrypt, "MessageEncryptor.encrypt без кешу ключів"),
+    Workload("lab5.decrypt", "lab05", "викликів KDF", [1, 4],
+             _lab5_decrypt, "MessageEncryptor.decrypt без кешу ключів"),
+    Workload("lab6.vulnerable_search", "lab06", "запитів", [100, 1000, 10_000],
+             _lab6("vulnerable_search"), f"vulnerable_search з пулом ({DB_ROWS} рядків)"),
+    Workload("lab6.secure_search", "lab06", "запитів", [100, 1000, 10_000],
+             _lab6("secure_search"), f"secure_search з пулом ({DB_ROWS} рядків)"),
+    Workload("lab6.secure_search_cached", "lab06", "запитів", [100, 1000, 10_000],
+             _lab6("secure_search", cached=True), "secure_search з кешем результатів"),
+]}
@@ -0,0 +1,407 @@
+"""
+Пакетний аудит паролів за тією ж 10-бальною шкалою, що й runAnalysis у lab_1_kozhan.html.
+
+analyze(name, dob, password) повертає (оцінка, рекомендації) - ті самі значення й тексти,
+що показує сторінка. audit_csv перевіряє мільйони записів (name, dob, password) з CSV
+потоково (пам'ять не залежить від розміру файлу) у кількох процесах.
+Додатково пароль можна перевірити за списком витоків (load_leak_list): компактна
+множина 64-бітних відбитків або фільтр Блума.
+
+Приклади:
+    python password_audit.py users.csv -o report.csv
+    python password_audit.py users.csv --leaks rockyou.txt --leak-index bloom --workers 4
+"""
+import argparse
+import csv
+import hashlib
+import io
+import math
+import os
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import MAXYEAR, date
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy відбитки сортуються через список Python
+    np = None
+
+COMMON_DICTIONARY = ("password", "qwerty", "admin", "123456", "login", "master", "football")
+
+# Класи символів як у JS: лише ASCII-літери та цифри
+_UPPER = re.compile(r"[A-Z]")
+_LOWER = re.compile(r"[a-z]")
+_DIGIT = re.compile(r"[0-9]")
+_OTHER = re.compile(r"[^A-Za-z0-9]")
+
+# Пробільні символи, які прибирає String.prototype.trim()
+_JS_WHITESPACE = ("\t\n\v\f\r          "
+                  "        　﻿")
+_ISO_DATE = re.compile(r"(\d{4,})-(\d{2})-(\d{2})")
+_DOTTED_DATE = re.compile(r"(\d{1,2})[./](\d{1,2})[./](\d{4})")
+# Обробник помилок декодування для CSV та списків витоків (чужі байти не зупиняють обробку)
+ENCODING_ERRORS = "surrogateescape"
+
+MSG_SHORT = "Пароль занадто короткий. Використовуйте мінімум 8 символів."
+MSG_VARIETY = "Додайте різноманітні символи: великі літери, цифри та знаки (!@#$)."
+MSG_DICTIONARY = "Знайдено просте словникове слово (напр. 'qwerty', 'admin')."
+MSG_LEAKED = "Пароль знайдено у списку витоків."
+MSG_DAY_MONTH = "Пароль містить день та місяць вашого народження."
+
+# Короткі коди зауважень для звіту
+ISSUES = ("short", "variety", "dictionary", "leaked", "name", "year", "day-month")
+
+
+def js_length(text: str) -> int:
+    """Довжина рядка в JS (кодові одиниці UTF-16: емодзі рахується як 2 символи)."""
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
+def normalize_dob(dob: str) -> str:
+    """
+    Дата народження у форматі поля <input type="date"> (РРРР-ММ-ДД) або '' для некоректної.
+    Для CSV додатково приймається ДД.ММ.РРРР та ДД/ММ/РРРР.
+    """
+    dob = dob.strip()
+    if not dob:
+        return ""
+    m = _ISO_DATE.fullmatch(dob)
+    if m:
+        year, month, day = m.groups()
+    else:
+        m = _DOTTED_DATE.fullmatch(dob)
+        if not m:
+            return ""
+        day, month, year = m.groups()
+    # Неіснуючі дати (2000-02-31) відкидаються; роки після 9999 (поле date їх допускає)
+    # перевіряються на рівноцінному році того самого 400-річного григоріанського циклу
+    check_year = int(year) if int(year) <= MAXYEAR else 2000 + int(year) % 400
+    try:
+        date(check_year, int(month), int(day))
+    except ValueError:
+        return ""
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def analyze_issues(name: str, dob: str, password: str, leaks=None) -> tuple:
+    """
+    Оцінка пароля як у runAnalysis. Повертає (оцінка, [(код, рекомендація), ...]).
+    dob - у форматі РРРР-ММ-ДД або ''. leaks - необов'язковий індекс витоків
+    (будь-який об'єкт з оператором in); пароль зі списку витоків оцінюється
+    так само, як пароль зі словниковим словом.
+    """
+    if not password:
+        raise ValueError("Будь ласка, введіть пароль.")
+    name = name.strip(_JS_WHITESPACE)
+    score = 0
+    issues = []
+    pass_lower = password.lower()
+
+    # 1. Довжина
+    length = js_length(password)
+    if length >= 12:
+        score += 3
+    elif length >= 8:
+        score += 1
+    else:
+        issues.append(("short", MSG_SHORT))
+
+    # 2. Складність символів
+    variety = (bool(_UPPER.search(password)) + bool(_LOWER.search(password))
+               + bool(_DIGIT.search(password)) + bool(_OTHER.search(password)))
+    if variety >= 3:
+        score += 3
+    else:
+        issues.append(("variety", MSG_VARIETY))
+
+    # 3. Словник (та список витоків)
+    is_common = any(word in pass_lower for word in COMMON_DICTIONARY)
+    leaked = leaks is not None and password in leaks
+    if is_common or leaked:
+        score -= 2
+        if is_common:
+            issues.append(("dictionary", MSG_DICTIONARY))
+        if leaked:
+            issues.append(("leaked", MSG_LEAKED))
+    else:
+        score += 1
+
+    # 4. Персональні дані
+    personal = False
+    if name and name.lower() in pass_lower:
+        personal = True
+        issues.append(("name", f'Не використовуйте своє ім\'я ("{name}") у паролі.'))
+    if dob:
+        year, month, day = dob.split("-")
+        if year in password:
+            personal = True
+            issues.append(("year", f"Пароль містить ваш рік народження ({year})."))
+        if day + month in password or day + "." + month in password:
+            personal = True
+            issues.append(("day-month", MSG_DAY_MONTH))
+    score += -5 if personal else 3
+
+    return min(10, max(1, score)), issues
+
+
+def analyze(name: str, dob: str, password: str, leaks=None) -> tuple:
+    """(оцінка, [рекомендації]) - те саме, що показує сторінка lab_1_kozhan.html."""
+    score, issues = analyze_issues(name, dob, password, leaks)
+    return score, [message for _, message in issues]
+
+
+class FingerprintSet:
+    """
+    Компактна множина паролів: відсортований масив 64-бітних відбитків (blake2b).
+    8 байтів на запис (у звичайному set рядків - понад 60), хибні збіги практично
+    неможливі (~n / 2^64).
+    """
+
+    def __init__(self, fingerprints: array):
+        if np is not None:
+            # Сортування на місці, без тимчасового списку з мільйонів int
+            np.frombuffer(fingerprints, dtype=np.uint64).sort()
+            self._items = fingerprints
+        else:
+            self._items = array("Q", sorted(fingerprints))
+
+    @staticmethod
+    def fingerprint(password: str) -> int:
+        digest = hashlib.blake2b(password.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    @classmethod
+    def from_iterable(cls, passwords):
+        items = array("Q")
+        for password in passwords:
+            items.append(cls.fingerprint(password))
+        return cls(items)
+
+    def __contains__(self, password: str) -> bool:
+        fp = self.fingerprint(password)
+        i = bisect_left(self._items, fp)
+        return i < len(self._items) and self._items[i] == fp
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def nbytes(self) -> int:
+        return self._items.itemsize * len(self._items)
+
+
+class BloomFilter:
+    """
+    Фільтр Блума: приблизно 1.44 * log2(1 / error_rate) біт на запис
+    (для 0.1% - 1.8 байта). Відсутні паролі можуть з імовірністю error_rate
+    вважатися знайденими, але знайдений пароль ніколи не буде пропущено.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, password: str):
+        # Подвійне хешування: k позицій з двох 64-бітних половин одного blake2b
+        digest = hashlib.blake2b(password.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, password: str):
+        bits = self._bits
+        for pos in self._positions(password):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, password: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(password))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+def _iter_leaks(path: str):
+    with open(path, encoding="utf-8", errors=ENCODING_ERRORS, newline="") as f:
+        for line in f:
+            password = line.rstrip("\r\n")
+            if password:
+                yield password
+
+
+def load_leak_list(path: str, kind: str = "set", error_rate: float = 0.001):
+    """
+    Завантажує список витоків (один пароль на рядок) у FingerprintSet (kind="set")
+    або BloomFilter (kind="bloom"). Файл читається потоково.
+    """
+    if kind == "set":
+        return FingerprintSet.from_iterable(_iter_leaks(path))
+    if kind == "bloom":
+        # Розмір фільтра залежить від кількості записів, тому спершу рахуємо рядки
+        with open(path, "rb") as f:
+            capacity = sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b"")) + 1
+        bloom = BloomFilter(capacity, error_rate)
+        for password in _iter_leaks(path):
+            bloom.add(password)
+        return bloom
+    raise ValueError(f"Помилка: Невідомий тип індексу витоків: {kind}")
+
+
+# --- Пакетна обробка CSV ---
+
+_worker_leaks = None
+
+
+def _init_worker(leaks):
+    global _worker_leaks
+    _worker_leaks = leaks
+
+
+def audit_rows(rows: list, leaks=None) -> list:
+    """
+    Оцінює пакет записів [(номер рядка, name, dob, password), ...].
+    Повертає [(номер рядка, name, оцінка, коди зауважень), ...]; для порожнього пароля оцінка None.
+    """
+    if leaks is None:
+        leaks = _worker_leaks
+    results = []
+    for lineno, name, dob, password in rows:
+        if not password:
+            results.append((lineno, name, None, ("empty",)))
+            continue
+        score, issues = analyze_issues(name, normalize_dob(dob), password, leaks)
+        results.append((lineno, name, score, tuple(code for code, _ in issues)))
+    return results
+
+
+def read_records(stream, batch_size: int = 10_000):
+    """
+    Генератор пакетів (номер рядка, name, dob, password) з CSV.
+    Колонки шукаються за заголовком name/dob/password; без заголовка - перші три колонки по порядку.
+    """
+    reader = csv.reader(stream)
+    first = next(reader, None)
+    if first is None:
+        return
+    header = [column.strip().lower() for column in first]
+    if {"name", "dob", "password"} <= set(header):
+        columns = (header.index("name"), header.index("dob"), header.index("password"))
+        rows = reader
+        lineno = 2
+    else:
+        columns = (0, 1, 2)
+        rows = _chain_first(first, reader)
+        lineno = 1
+
+    batch = []
+    i_name, i_dob, i_pass = columns
+    width = max(columns) + 1
+    for row in rows:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        batch.append((lineno, row[i_name], row[i_dob], row[i_pass]))
+        lineno += 1
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _chain_first(first, rest):
+    yield first
+    yield from rest
+
+
+def audit_csv(stream, leaks=None, workers: int = None, batch_size: int = 10_000):
+    """
+    Потоковий аудит CSV. Повертає генератор результатів audit_rows у порядку рядків файлу.
+    Пакети обробляються в ProcessPoolExecutor; одночасно в роботі не більше 2 * workers
+    пакетів, тому великий файл не зчитується в пам'ять наперед.
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = read_records(stream, batch_size)
+    if workers == 1:
+        for batch in batches:
+            yield from audit_rows(batch, leaks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(leaks,)) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(audit_rows, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетний аудит паролів (шкала lab_1_kozhan.html)")
+    parser.add_argument("input", help="CSV з колонками name, dob, password ('-' - stdin)")
+    parser.add_argument("-o", "--output", default="-", help="звіт CSV (за замовчуванням stdout)")
+    parser.add_argument("--leaks", help="список витоків, один пароль на рядок")
+    parser.add_argument("--leak-index", choices=["set", "bloom"], default="set",
+                        help="set - 8 байтів на запис без хибних збігів, bloom - ~2 байти з похибкою")
+    parser.add_argument("--error-rate", type=float, default=0.001, help="похибка фільтра Блума")
+    parser.add_argument("--workers", type=int, default=None, help="процесів (за замовчуванням - усі ядра)")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    leaks = None
+    if args.leaks:
+        start = time.perf_counter()
+        leaks = load_leak_list(args.leaks, args.leak_index, args.error_rate)
+        print(f"[-] Витоків: {len(leaks)}, індекс {args.leak_index}: {leaks.nbytes / 2 ** 20:.1f} MB, "
+              f"{time.perf_counter() - start:.1f} c", file=sys.stderr)
+
+    # Некоректні байти UTF-8 не зупиняють аудит: вони проходять до звіту без змін
+    src = (io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors=ENCODING_ERRORS, newline="")
+           if args.input == "-" else open(args.input, encoding="utf-8", errors=ENCODING_ERRORS, newline=""))
+    if args.output == "-":
+        sys.stdout.reconfigure(encoding="utf-8", errors=ENCODING_ERRORS, newline="")
+        dst = sys.stdout
+    else:
+        dst = open(args.output, "w", encoding="utf-8", errors=ENCODING_ERRORS, newline="")
+    scores = Counter()
+    issues = Counter()
+    start = time.perf_counter()
+    try:
+        writer = csv.writer(dst)
+        writer.writerow(["line", "name", "score", "issues"])
+        for lineno, name, score, codes in audit_csv(src, leaks, args.workers, args.batch_size):
+            writer.writerow([lineno, name, "" if score is None else score, ";".join(codes)])
+            scores[score] += 1
+            issues.update(codes)
+    finally:
+        if args.input != "-":
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    elapsed = time.perf_counter() - start
+    total = sum(scores.values())
+    print(f"[-] Записів: {total} за {elapsed:.2f} c ({total / elapsed if elapsed else 0:,.0f} записів/с)",
+          file=sys.stderr)
+    print("    Оцінки: " + ", ".join(f"{s}: {scores[s]}" for s in sorted(scores, key=lambda s: (s is None, s))),
+          file=sys.stderr)
+    print("    Зауваження: " + ", ".join(f"{code}: {issues[code]}" for code in ISSUES + ("empty",) if issues[code]),
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
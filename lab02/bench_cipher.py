@@ -0,0 +1,83 @@
+"""
+Порівняння швидкодії: оригінальні caesar_cipher / vigenere_cipher з lab2.py
+проти табличного рушія fast_cipher.py на текстах 1 KB, 1 MB та 100 MB.
+
+Запуск:
+    python bench_cipher.py
+    python bench_cipher.py --sizes 1K 10M --legacy-max 1M
+
+Оригінальні функції мають квадратичну поведінку (result += ...),
+тому для них за замовчуванням пропускаються розміри понад --legacy-max.
+"""
+import argparse
+import random
+import time
+
+from lab2 import caesar_cipher, vigenere_cipher, get_ukrainian_alphabet
+from fast_cipher import fast_caesar, fast_vigenere
+
+UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text):
+    """'1K' -> 1024, '100M' -> 104857600."""
+    text = text.strip().upper()
+    if text[-1] in UNITS:
+        return int(text[:-1]) * UNITS[text[-1]]
+    return int(text)
+
+
+def make_corpus(size, seed=2025):
+    """Генерує псевдо-текст: літери алфавіту, пробіли, цифри та розділові знаки."""
+    rnd = random.Random(seed)
+    symbols = get_ukrainian_alphabet() + ".,!?-0123456789\n"
+    # Блок 64 KB повторюється - генерувати 100 MB випадково було б надто довго
+    block = "".join(rnd.choice(symbols) for _ in range(min(size, 64 * 1024)))
+    reps = size // len(block) + 1
+    return (block * reps)[:size]
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк шифрів Цезаря/Віженера")
+    parser.add_argument("--sizes", nargs="+", default=["1K", "1M", "100M"])
+    parser.add_argument("--legacy-max", default="1M",
+                        help="максимальний розмір для оригінальних функцій")
+    parser.add_argument("--shift", type=int, default=8)
+    parser.add_argument("--key", default="КОЖАН")
+    args = parser.parse_args()
+
+    legacy_max = parse_size(args.legacy_max)
+    cases = [
+        ("Цезар", caesar_cipher, fast_caesar, args.shift),
+        ("Віженер", vigenere_cipher, fast_vigenere, args.key),
+    ]
+
+    print(f"{'ШИФР':<10} | {'РОЗМІР':>8} | {'ОРИГІНАЛ, c':>12} | {'ШВИДКИЙ, c':>12} | {'MB/c':>8} | {'ПРИСКОРЕННЯ':>11}")
+    print("-" * 76)
+    for label in args.sizes:
+        size = parse_size(label)
+        text = make_corpus(size)
+        for name, legacy, fast, key in cases:
+            t_fast, fast_out = measure(fast, text, key)
+            mbps = size / (1024 ** 2) / t_fast if t_fast else float("inf")
+
+            if size <= legacy_max:
+                t_old, old_out = measure(legacy, text, key)
+                if old_out != fast_out:
+                    raise SystemExit(f"[!] Розбіжність результатів: {name}, {label}")
+                speedup = f"x{t_old / t_fast:.1f}"
+                old_col = f"{t_old:.4f}"
+            else:
+                old_col, speedup = "пропущено", "-"
+
+            print(f"{name:<10} | {label:>8} | {old_col:>12} | {t_fast:>12.4f} | {mbps:>8.1f} | {speedup:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Автоматичний криптоаналіз шифрів Цезаря та Віженера для алфавіту get_ukrainian_alphabet().
+
+Перевіряє на практиці висновки lab2.py про стійкість шифрів:
+  * Цезар   -> перебір усіх зсувів з оцінкою хі-квадрат відносно частот української мови;
+  * Віженер -> оцінка довжини ключа (індекс збігів відбирає кандидатів,
+               метод Касіскі обирає серед них), потім відновлення зсуву
+               кожного стовпця тим самим хі-квадрат.
+
+Усі підрахунки - гістограми NumPy (np.bincount) над поданням тексту у вигляді
+масиву індексів та його "стовпцями" (reshape без копіювання), без циклів
+Python по символах. Оцінка кандидатів довжини ключа розподіляється між
+процесами (ProcessPoolExecutor).
+
+Алфавіт lab2 чутливий до регістру (великі + малі літери + пробіл), тому модель
+частот покриває всі його символи: частота літери ділиться між малою та великою
+формою, окремо враховується частка пробілів.
+
+Приклади:
+    python cryptanalysis.py caesar -i secret.txt
+    python cryptanalysis.py vigenere -i secret.txt --max-key-len 30 --workers 4
+"""
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from fast_cipher import ALPHABET, N, CODEC, fast_caesar, fast_vigenere
+
+# Частоти літер української мови (%, малі літери в порядку алфавіту lab2)
+UKRAINIAN_FREQ = {
+    "а": 8.01, "б": 1.67, "в": 5.23, "г": 1.66, "ґ": 0.01, "д": 3.19, "е": 4.71,
+    "є": 0.53, "ж": 0.87, "з": 2.14, "и": 6.20, "і": 5.63, "ї": 0.88, "й": 1.16,
+    "к": 3.85, "л": 3.74, "м": 3.15, "н": 6.72, "о": 9.12, "п": 2.80, "р": 4.74,
+    "с": 4.13, "т": 5.54, "у": 3.70, "ф": 0.24, "х": 1.09, "ц": 0.93, "ч": 1.48,
+    "ш": 0.81, "щ": 0.64, "ь": 1.77, "ю": 0.76, "я": 2.44,
+}
+SPACE_SHARE = 0.14  # частка пробілів серед символів алфавіту
+UPPER_SHARE = 0.03  # частка великих літер серед усіх літер
+
+# Максимум символів для методу Касіскі (сортування триграм - найдорожча частина)
+KASISKI_SAMPLE = 1 << 20
+
+
+def expected_distribution():
+    """Очікувана ймовірність кожного з N символів алфавіту у відкритому тексті."""
+    probs = np.zeros(N)
+    total = sum(UKRAINIAN_FREQ.values())
+    for ch, freq in UKRAINIAN_FREQ.items():
+        share = freq / total * (1 - SPACE_SHARE)
+        probs[ALPHABET.index(ch)] = share * (1 - UPPER_SHARE)
+        probs[ALPHABET.index(ch.upper())] = share * UPPER_SHARE
+    probs[ALPHABET.index(" ")] = SPACE_SHARE
+    return probs
+
+
+EXPECTED = expected_distribution()
+
+# Індекси для "прокрутки" гістограми: ROLL[s, i] = (i + s) % N
+ROLL = (np.arange(N)[None, :] + np.arange(N)[:, None]) % N
+
+# Байт cp1251 -> індекс у алфавіті (255 для символів поза алфавітом)
+_INDEX_LUT = np.full(256, 255, dtype=np.uint8)
+_INDEX_LUT[np.frombuffer(ALPHABET.encode(CODEC), dtype=np.uint8)] = np.arange(N, dtype=np.uint8)
+
+
+def text_to_indices(text):
+    """Текст -> масив індексів літер алфавіту (інші символи відкидаються)."""
+    raw = text.encode(CODEC, errors="replace")
+    idx = _INDEX_LUT[np.frombuffer(raw, dtype=np.uint8)]
+    return idx[idx != 255].astype(np.intp)
+
+
+def chi_squared_shifts(counts):
+    """
+    Хі-квадрат для кожного можливого зсуву.
+    counts - гістограма (..., N); результат - (..., N), де [..., s] відповідає зсуву s.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    n = counts.sum(axis=-1, keepdims=True)
+    # Розшифрування зсувом s: відкритий символ i мав у шифротексті індекс (i + s) % N
+    observed = counts[..., ROLL]
+    expected = n[..., None] * EXPECTED
+    with np.errstate(invalid="ignore", divide="ignore"):
+        chi = ((observed - expected) ** 2 / expected).sum(axis=-1)
+    return np.nan_to_num(chi, nan=np.inf)
+
+
+def column_histograms(idx, key_len):
+    """Гістограми всіх стовпців для довжини ключа key_len: масив (key_len, N)."""
+    usable = len(idx) - len(idx) % key_len
+    # Кожен рядок reshape - один період ключа, стовпець j - символи з однаковим зсувом
+    cols = idx[:usable].reshape(-1, key_len)
+    flat = cols + np.arange(key_len) * N
+    hist = np.bincount(flat.ravel(), minlength=key_len * N).reshape(key_len, N)
+    # Хвіст, що не вмістився в повний період
+    tail = idx[usable:]
+    if len(tail):
+        hist[np.arange(len(tail)), tail] += 1
+    return hist
+
+
+def index_of_coincidence(hist):
+    """Індекс збігів для кожного рядка гістограми (..., N)."""
+    hist = np.asarray(hist, dtype=np.float64)
+    n = hist.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ic = (hist * (hist - 1)).sum(axis=-1) / (n * (n - 1))
+    return np.nan_to_num(ic)
+
+
+def kasiski_scores(idx, max_key_len):
+    """
+    Метод Касіскі: відстані між повторами триграм.
+    Повертає масив (max_key_len + 1), де [L] - частка відстаней, кратних L.
+    """
+    sample = idx[:KASISKI_SAMPLE]
+    scores = np.zeros(max_key_len + 1)
+    if len(sample) < 4:
+        return scores
+    codes = (sample[:-2] * N + sample[1:-1]) * N + sample[2:]
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    same = sorted_codes[1:] == sorted_codes[:-1]
+    # Відстань між сусідніми входженнями однієї триграми
+    distances = (order[1:] - order[:-1])[same]
+    if not len(distances):
+        return scores
+    lengths = np.arange(1, max_key_len + 1)
+    scores[1:] = (distances[None, :] % lengths[:, None] == 0).mean(axis=1)
+    return scores
+
+
+# --- Паралельна оцінка довжин ключа ---
+
+_shared_idx = None
+
+
+def _init_worker(idx):
+    global _shared_idx
+    _shared_idx = idx
+
+
+def _score_key_length(key_len):
+    """Середній індекс збігів стовпців для однієї довжини ключа (виконується у процесі-працівнику)."""
+    return key_len, float(index_of_coincidence(column_histograms(_shared_idx, key_len)).mean())
+
+
+def score_key_lengths(idx, max_key_len=20, workers=None):
+    """Повертає масив (max_key_len + 1) середніх IC; workers=1 - без процесів."""
+    lengths = range(1, max_key_len + 1)
+    ics = np.zeros(max_key_len + 1)
+    if workers == 1:
+        _init_worker(idx)
+        results = map(_score_key_length, lengths)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(idx,))
+        with pool:
+            results = list(pool.map(_score_key_length, lengths))
+    for key_len, ic in results:
+        ics[key_len] = ic
+    return ics
+
+
+def estimate_key_length(idx, max_key_len=20, workers=None):
+    """
+    Оцінка довжини ключа Віженера.
+    Кандидати - довжини, IC яких не нижчий за 80% максимального: кратні справжньої
+    довжини дають такий самий високий IC, а на коротких текстах IC зміщений
+    на користь довгих ключів. Серед кандидатів обирається довжина з найбільшою
+    часткою Касіскі (відстані, кратні 2L, - підмножина кратних L, тому кратні
+    не перемагають справжню довжину); за рівної частки - найменша довжина.
+    Повертає (довжина, масив IC, масив Касіскі).
+    """
+    max_key_len = max(1, min(max_key_len, len(idx) // 2))
+    ics = score_key_lengths(idx, max_key_len, workers)
+    kasiski = kasiski_scores(idx, max_key_len)
+    threshold = ics[1:].max() * 0.8
+    candidates = [L for L in range(1, max_key_len + 1) if ics[L] >= threshold]
+    best = max(candidates, key=lambda L: (kasiski[L], -L))
+    return best, ics, kasiski
+
+
+def crack_caesar(text):
+    """
+    Перебір усіх N зсувів.
+    Повертає (найкращий зсув, відкритий текст, список (зсув, хі-квадрат) за зростанням).
+    """
+    idx = text_to_indices(text)
+    chi = chi_squared_shifts(np.bincount(idx, minlength=N))
+    ranking = [(int(s), float(chi[s])) for s in np.argsort(chi)]
+    shift = ranking[0][0]
+    return shift, fast_caesar(text, shift, decrypt=True), ranking
+
+
+def crack_vigenere(text, max_key_len=20, key_len=None, workers=None):
+    """
+    Відновлення ключа Віженера.
+    Повертає (ключ, відкритий текст, довжина ключа).
+    """
+    idx = text_to_indices(text)
+    if key_len is None:
+        key_len = estimate_key_length(idx, max_key_len, workers)[0]
+    chi = chi_squared_shifts(column_histograms(idx, key_len))
+    shifts = chi.argmin(axis=1)
+    key = "".join(ALPHABET[s] for s in shifts)
+    return key, fast_vigenere(text, key, decrypt=True), key_len
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Злам шифрів Цезаря/Віженера частотним аналізом")
+    parser.add_argument("cipher", choices=["caesar", "vigenere"])
+    parser.add_argument("-i", "--input", default="-", help="файл із шифротекстом (за замовчуванням stdin)")
+    parser.add_argument("--max-key-len", type=int, default=20)
+    parser.add_argument("--key-len", type=int, help="відома довжина ключа (пропускає оцінку)")
+    parser.add_argument("--workers", type=int, help="кількість процесів (1 - без паралелізму)")
+    parser.add_argument("--preview", type=int, default=200, help="скільки символів відкритого тексту показати")
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            text = f.read()
+
+    if args.cipher == "caesar":
+        shift, plain, ranking = crack_caesar(text)
+        print(f"[+] Зсув: {shift}")
+        print("[i] Найкращі кандидати:", ", ".join(f"{s} ({chi:.0f})" for s, chi in ranking[:5]))
+    else:
+        idx = text_to_indices(text)
+        key_len = args.key_len
+        if key_len is None:
+            key_len, ics, kasiski = estimate_key_length(idx, args.max_key_len, args.workers)
+            print(f"{'L':>3} | {'IC':>7} | {'Касіскі':>7}")
+            for L in range(1, len(ics)):
+                print(f"{L:>3} | {ics[L]:.5f} | {kasiski[L]:.3f}")
+        key, plain, key_len = crack_vigenere(text, key_len=key_len)
+        print(f"[+] Довжина ключа: {key_len}")
+        print(f"[+] Ключ: \"{key}\"")
+
+    print("\n--- ВІДНОВЛЕНИЙ ТЕКСТ ---")
+    print(plain[:args.preview])
+
+
+if __name__ == "__main__":
+    main()
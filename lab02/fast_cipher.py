@@ -0,0 +1,175 @@
+"""
+Швидкий (табличний) рушій шифрів Цезаря та Віженера.
+
+Дає ті самі результати, що й caesar_cipher / vigenere_cipher з lab2.py,
+але без alphabet.index() для кожного символу та без конкатенації рядків:
+  * Цезар  -> одна таблиця перекладу на зсув + translate (C-швидкість);
+  * Віженер -> літери розбиваються на "стовпці" з кроком довжини ключа,
+    кожен стовпець перекладається власною таблицею, результат збирається в bytearray.
+
+Весь український алфавіт (разом з Ґ, Є, І, Ї) вміщується в однобайтове
+кодування cp1251, тому основний шлях працює з bytes і таблицями на 256 байтів.
+Якщо текст містить символи поза cp1251 (емодзі, ієрогліфи тощо),
+використовується запасний шлях на str.translate з тим самим результатом.
+
+Якщо встановлено NumPy, Віженер для bytes виконується повністю векторно
+(таблиця індексів + cumsum для позиції в ключі) блоками по BLOCK_SIZE байтів.
+Без NumPy працює чистий Python-варіант - результат однаковий.
+"""
+import re
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий
+    np = None
+
+from lab2 import get_ukrainian_alphabet
+
+ALPHABET = get_ukrainian_alphabet()
+N = len(ALPHABET)
+
+# Індекс символу за O(1) замість alphabet.index(char)
+CHAR_INDEX = {ch: i for i, ch in enumerate(ALPHABET)}
+
+CODEC = "cp1251"
+BYTE_ALPHABET = ALPHABET.encode(CODEC)
+# Байти, що НЕ є літерами алфавіту (для швидкого видалення через bytes.translate)
+FOREIGN_BYTES = bytes(b for b in range(256) if b not in BYTE_ALPHABET)
+
+# Розбиття тексту на серії "своїх" та "чужих" символів.
+# Дужки у шаблоні залишають роздільники у результаті re.split.
+_FOREIGN_RUNS = re.compile(f"([^{re.escape(ALPHABET)}]+)")
+_FOREIGN_BYTE_RUNS = re.compile(b"([" + re.escape(FOREIGN_BYTES) + b"]+)")
+
+# Розмір блоку для векторного шляху: обмежує тимчасові масиви NumPy
+BLOCK_SIZE = 1 << 22
+
+if np is not None:
+    # Байт cp1251 -> індекс у алфавіті (NOT_LETTER для "чужих" байтів)
+    NOT_LETTER = 255
+    _INDEX_LUT = np.full(256, NOT_LETTER, dtype=np.uint8)
+    _INDEX_LUT[np.frombuffer(BYTE_ALPHABET, dtype=np.uint8)] = np.arange(N, dtype=np.uint8)
+    _ALPHA_ARR = np.frombuffer(BYTE_ALPHABET, dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def shift_table(shift):
+    """Таблиця для str.translate: кожна літера -> літера зі зсувом."""
+    shift %= N
+    return str.maketrans(ALPHABET, ALPHABET[shift:] + ALPHABET[:shift])
+
+
+@lru_cache(maxsize=None)
+def byte_shift_table(shift):
+    """Таблиця на 256 байтів для bytes.translate (літери в кодуванні cp1251)."""
+    shift %= N
+    return bytes.maketrans(BYTE_ALPHABET, BYTE_ALPHABET[shift:] + BYTE_ALPHABET[:shift])
+
+
+def key_shifts(key, decrypt=False):
+    """Перетворює ключ Віженера на список зсувів (символи поза алфавітом ігноруються)."""
+    shifts = [CHAR_INDEX[k] for k in key if k in CHAR_INDEX]
+    if decrypt:
+        shifts = [-s for s in shifts]
+    return shifts
+
+
+def _encode(text):
+    """Повертає text у cp1251 або None, якщо там є символи поза кодуванням."""
+    try:
+        return text.encode(CODEC)
+    except UnicodeEncodeError:
+        return None
+
+
+def fast_caesar(text, shift, decrypt=False):
+    """Аналог caesar_cipher: один прохід translate по готовій таблиці."""
+    if decrypt:
+        shift = -shift
+    raw = _encode(text)
+    if raw is None:
+        return text.translate(shift_table(shift))
+    return raw.translate(byte_shift_table(shift)).decode(CODEC)
+
+
+def vigenere_letters(letters, shifts, offset=0):
+    """
+    Шифрує послідовність, що складається ЛИШЕ з літер алфавіту (str або bytes cp1251).
+    offset - позиція в ключі, з якої починається послідовність
+    (потрібно, щоб продовжувати ключ між частинами тексту).
+    """
+    k = len(shifts)
+    is_bytes = isinstance(letters, (bytes, bytearray))
+    table = byte_shift_table if is_bytes else shift_table
+
+    if k == 1:
+        return letters.translate(table(shifts[0]))
+
+    out = bytearray(len(letters)) if is_bytes else [""] * len(letters)
+    for j in range(k):
+        # Літери letters[j], letters[j+k], ... шифруються одним і тим самим зсувом
+        out[j::k] = letters[j::k].translate(table(shifts[(offset + j) % k]))
+    return bytes(out) if is_bytes else "".join(out)
+
+
+def _vigenere_runs(data, letters, shifts, offset, runs_pattern):
+    """Шифрує літери та розкладає їх назад між незмінними "чужими" символами."""
+    encrypted = vigenere_letters(letters, shifts, offset)
+    parts = runs_pattern.split(data)
+    pos = 0
+    # Парні елементи - серії літер алфавіту, непарні - "чужі" символи (без змін)
+    for i in range(0, len(parts), 2):
+        size = len(parts[i])
+        parts[i] = encrypted[pos:pos + size]
+        pos += size
+    return data[:0].join(parts)
+
+
+def _vigenere_bytes_np(raw, shifts, offset):
+    """Векторний Віженер для bytes cp1251. Повертає (bytes, кількість літер)."""
+    key = np.array(shifts, dtype=np.int64) % N
+    k = len(key)
+    out = bytearray(len(raw))
+    view = memoryview(raw)
+    total = 0
+    for start in range(0, len(raw), BLOCK_SIZE):
+        arr = np.frombuffer(view[start:start + BLOCK_SIZE], dtype=np.uint8)
+        idx = _INDEX_LUT[arr]
+        is_letter = idx != NOT_LETTER
+        # Позиція кожної літери в ключі = кількість літер перед нею (+ зсув блоку)
+        key_pos = (np.cumsum(is_letter, dtype=np.int64) - 1 + offset + total) % k
+        new_idx = (idx.astype(np.int64) + key[key_pos]) % N
+        block = np.where(is_letter, _ALPHA_ARR[new_idx], arr)
+        out[start:start + len(arr)] = block.tobytes()
+        total += int(np.count_nonzero(is_letter))
+    return bytes(out), total
+
+
+def vigenere_with_offset(text, shifts, offset=0):
+    """
+    Віженер для готового списку зсувів, починаючи з позиції offset у ключі.
+    Повертає (шифротекст, кількість оброблених літер алфавіту).
+    """
+    raw = _encode(text)
+    if raw is not None and np is not None:
+        out, count = _vigenere_bytes_np(raw, shifts, offset)
+        return out.decode(CODEC), count
+    if raw is not None:
+        letters = raw.translate(None, FOREIGN_BYTES)
+        if len(letters) == len(raw):
+            return vigenere_letters(raw, shifts, offset).decode(CODEC), len(letters)
+        out = _vigenere_runs(raw, letters, shifts, offset, _FOREIGN_BYTE_RUNS)
+        return out.decode(CODEC), len(letters)
+
+    parts = _FOREIGN_RUNS.split(text)
+    letters = "".join(parts[0::2])
+    return _vigenere_runs(text, letters, shifts, offset, _FOREIGN_RUNS), len(letters)
+
+
+def fast_vigenere(text, key, decrypt=False):
+    """Аналог vigenere_cipher: періодичний прохід по стовпцях ключа."""
+    shifts = key_shifts(key, decrypt)
+    if not shifts:
+        return text
+    return vigenere_with_offset(text, shifts)[0]
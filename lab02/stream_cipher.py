@@ -0,0 +1,139 @@
+"""
+Потоковий режим шифрів Цезаря та Віженера для файлів і stdin/stdout.
+
+Дані обробляються фіксованими частинами (CHUNK_SIZE байтів) через ланцюжок
+генераторів: читання -> декодування UTF-8 -> шифрування -> кодування -> запис.
+Пам'ять не залежить від розміру входу, тому можна обробляти архіви логів,
+які не вміщуються в RAM.
+
+  * UTF-8 символ, розрізаний між двома частинами, "доклеюється" інкрементальним
+    декодером і не псується;
+  * позиція в ключі Віженера переноситься між частинами, тому результат
+    ідентичний шифруванню всього тексту за один раз;
+  * байти, що не є коректним UTF-8 (бінарні вставки, інше кодування), декодуються
+    через surrogateescape і записуються без змін, а не обривають обробку.
+
+Приклади:
+    python stream_cipher.py caesar 8 -i log.txt -o log.enc
+    python stream_cipher.py vigenere КОЖАН -d < log.enc > log.txt
+    cat big.txt | python stream_cipher.py vigenere КОЖАН | gzip > big.enc.gz
+"""
+import argparse
+import codecs
+import sys
+
+from fast_cipher import fast_caesar, key_shifts, vigenere_with_offset
+
+CHUNK_SIZE = 1 << 20  # 1 MB
+ENCODING = "utf-8"
+ERRORS = "surrogateescape"
+
+
+def read_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Читає бінарний потік частинами фіксованого розміру."""
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    while True:
+        n = stream.readinto(buf)
+        if not n:
+            break
+        yield bytes(view[:n])
+
+
+def decode_chunks(chunks, encoding=ENCODING):
+    """Перетворює байтові частини на текст, не розриваючи багатобайтові символи."""
+    decoder = codecs.getincrementaldecoder(encoding)(ERRORS)
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def encode_chunks(texts, encoding=ENCODING):
+    """Зворотне перетворення тексту в байти (некоректні вхідні байти відновлюються як були)."""
+    for text in texts:
+        yield text.encode(encoding, ERRORS)
+
+
+def caesar_stream(texts, shift, decrypt=False):
+    """Цезар не має стану між частинами - кожна частина шифрується окремо."""
+    for text in texts:
+        yield fast_caesar(text, shift, decrypt)
+
+
+def vigenere_stream(texts, key, decrypt=False):
+    """Віженер з перенесенням позиції ключа між частинами."""
+    shifts = key_shifts(key, decrypt)
+    offset = 0
+    for text in texts:
+        if not shifts:
+            yield text
+            continue
+        out, count = vigenere_with_offset(text, shifts, offset)
+        offset = (offset + count) % len(shifts)
+        yield out
+
+
+def cipher_stream(chunks, cipher, key, decrypt=False, encoding=ENCODING):
+    """
+    Повний конвеєр над байтовими частинами: bytes -> bytes.
+    cipher - 'caesar' (key: int) або 'vigenere' (key: str).
+    """
+    texts = decode_chunks(chunks, encoding)
+    if cipher == "caesar":
+        texts = caesar_stream(texts, int(key), decrypt)
+    elif cipher == "vigenere":
+        texts = vigenere_stream(texts, key, decrypt)
+    else:
+        raise ValueError(f"Невідомий шифр: {cipher}")
+    return encode_chunks(texts, encoding)
+
+
+def process_stream(src, dst, cipher, key, decrypt=False, chunk_size=CHUNK_SIZE):
+    """Шифрує бінарний потік src у бінарний потік dst. Повертає кількість записаних байтів."""
+    written = 0
+    for out in cipher_stream(read_chunks(src, chunk_size), cipher, key, decrypt):
+        dst.write(out)
+        written += len(out)
+    dst.flush()
+    return written
+
+
+def process_file(src_path, dst_path, cipher, key, decrypt=False, chunk_size=CHUNK_SIZE):
+    """Те саме для шляхів до файлів."""
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        return process_stream(src, dst, cipher, key, decrypt, chunk_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Потокове шифрування Цезаря/Віженера (UTF-8)")
+    parser.add_argument("cipher", choices=["caesar", "vigenere"])
+    parser.add_argument("key", help="зсув (Цезар) або слово-ключ (Віженер)")
+    parser.add_argument("-d", "--decrypt", action="store_true", help="розшифрувати")
+    parser.add_argument("-i", "--input", default="-", help="вхідний файл (за замовчуванням stdin)")
+    parser.add_argument("-o", "--output", default="-", help="вихідний файл (за замовчуванням stdout)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.cipher == "caesar":
+        try:
+            int(args.key)
+        except ValueError:
+            parser.error("Зсув для Цезаря має бути цілим числом!")
+
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    dst = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        process_stream(src, dst, args.cipher, args.key, args.decrypt, args.chunk_size)
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+
+
+if __name__ == "__main__":
+    main()
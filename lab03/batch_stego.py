@@ -0,0 +1,280 @@
+"""
+Пакетна стеганографія: розподіл великих файлів між багатьма зображеннями-контейнерами.
+
+Вбудовування:
+  1. для кожного контейнера з папки обчислюється ємність (без декодування пікселів);
+  2. кожен файл ділиться на пронумеровані фрагменти відповідно до ємності контейнерів;
+  3. PNG кодуються паралельно в ProcessPoolExecutor; кожен працівник читає з файлу
+     лише свій фрагмент, а в черзі одночасно не більше 2*workers завдань;
+  4. у вихідну папку записується manifest.json (які фрагменти в яких файлах).
+
+Витягування: усі зображення папки декодуються паралельно, фрагменти групуються
+за ідентифікатором файлу та збираються в правильному порядку.
+Маніфест не обов'язковий - уся потрібна інформація є в самих фрагментах,
+а маніфест додає імена файлів і перевірку SHA-256.
+
+Приклади:
+    python batch_stego.py embed archive.zip --covers covers/ --out stego/
+    python batch_stego.py extract stego/ --out restored/
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from fast_stego import capacity, extract_data, hide_data
+from payload_format import FLAG_FRAGMENT
+
+IMAGE_EXTENSIONS = ('.png', '.bmp', '.tif', '.tiff', '.gif', '.jpg', '.jpeg', '.webp')
+MANIFEST_NAME = 'manifest.json'
+
+# Заголовок фрагмента: ідентифікатор файлу, номер фрагмента, кількість фрагментів
+_FRAGMENT = struct.Struct('>16sII')
+FRAGMENT_HEADER_SIZE = _FRAGMENT.size
+HASH_CHUNK = 1 << 20
+
+
+def list_images(directory):
+    """Зображення папки у стабільному (алфавітному) порядку."""
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if name.lower().endswith(IMAGE_EXTENSIONS)]
+
+
+def stego_names(covers):
+    """
+    Імена вихідних PNG для контейнерів covers (без повторів).
+    Зазвичай це стем контейнера + .png; якщо стем повторюється (a.png і a.bmp),
+    до імені додається вихідне розширення (a.png.png, a.bmp.png), а за потреби - індекс.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in covers]
+    names, used = [], set()
+    for index, (path, stem) in enumerate(zip(covers, stems)):
+        name = stem + '.png'
+        if stems.count(stem) > 1:
+            name = os.path.basename(path) + '.png'
+        if name.lower() in used:
+            name = f"{stem}_{index}.png"
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+
+def plan_fragments(sizes, capacities):
+    """
+    Розподіляє файли між контейнерами.
+    sizes - розміри файлів; capacities - корисна ємність контейнерів (байтів на фрагмент).
+    Повертає для кожного файлу список (індекс контейнера, початок, кінець).
+    """
+    plan = []
+    cover = 0
+    for size in sizes:
+        pieces = []
+        pos = 0
+        # Порожній файл теж займає один фрагмент, щоб його можна було відновити
+        while pos < size or not pieces:
+            while cover < len(capacities) and capacities[cover] <= 0:
+                cover += 1
+            if cover >= len(capacities):
+                raise ValueError("Помилка: Сумарної ємності контейнерів недостатньо для всіх файлів.")
+            end = min(size, pos + capacities[cover])
+            pieces.append((cover, pos, end))
+            pos = end
+            cover += 1
+        plan.append(pieces)
+    return plan
+
+
+def file_sha256(path):
+    """SHA-256 файлу, прочитаного блоками по HASH_CHUNK байтів."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _embed_job(job):
+    """
+    Вбудовує один фрагмент (виконується у процесі-працівнику).
+    Працівник сам читає лише свій діапазон байтів [start, end) файлу payload_path.
+    """
+    cover_path, stego_path, payload_path, start, end, header, bits, alpha, key = job
+    with open(payload_path, 'rb') as f:
+        f.seek(start)
+        fragment = header + f.read(end - start)
+    used, _ = hide_data(cover_path, stego_path, fragment, FLAG_FRAGMENT, bits, alpha, key)
+    return stego_path, used
+
+
+def _extract_job(job):
+    """
+    Витягує фрагмент з одного зображення.
+    Повертає None, якщо фрагмента немає, або (шлях, текст помилки), якщо файл не читається.
+    """
+    stego_path, bits, alpha, key = job
+    try:
+        data, flags = extract_data(stego_path, bits, alpha, key)
+    except ValueError:
+        return None
+    except OSError as exc:
+        return stego_path, str(exc)
+    if not flags & FLAG_FRAGMENT or len(data) < FRAGMENT_HEADER_SIZE:
+        return None
+    file_id, seq, total = _FRAGMENT.unpack(data[:FRAGMENT_HEADER_SIZE])
+    return stego_path, file_id, seq, total, data[FRAGMENT_HEADER_SIZE:]
+
+
+def embed_files(payload_paths, cover_dir, out_dir, bits=1, alpha=False, key=None, workers=None):
+    """
+    Розподіляє файли payload_paths між контейнерами з cover_dir.
+    Результати та manifest.json записуються в out_dir. Повертає маніфест (dict).
+    """
+    covers = list_images(cover_dir)
+    names = stego_names(covers)
+    capacities = [capacity(path, bits, alpha) - FRAGMENT_HEADER_SIZE for path in covers]
+    sizes = [os.path.getsize(path) for path in payload_paths]
+    plan = plan_fragments(sizes, capacities)
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest = {"mode": {"bits": bits, "alpha": alpha, "keyed": key is not None}, "files": []}
+
+    def jobs():
+        for path, size, pieces in zip(payload_paths, sizes, plan):
+            file_id = uuid.uuid4().bytes
+            entry = {
+                "name": os.path.basename(path),
+                "id": file_id.hex(),
+                "size": size,
+                "sha256": file_sha256(path),
+                "fragments": [],
+            }
+            manifest["files"].append(entry)
+            for seq, (cover, start, end) in enumerate(pieces):
+                cover_path = covers[cover]
+                stego_path = os.path.join(out_dir, names[cover])
+                entry["fragments"].append({"seq": seq, "cover": os.path.basename(cover_path),
+                                           "stego": os.path.basename(stego_path), "size": end - start})
+                header = _FRAGMENT.pack(file_id, seq, len(pieces))
+                yield cover_path, stego_path, path, start, end, header, bits, alpha, key
+
+    # Не більше 2*workers завдань у черзі: фрагменти не накопичуються в пам'яті
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for job in jobs():
+            pending.append(pool.submit(_embed_job, job))
+            if len(pending) >= window:
+                stego_path, used = pending.popleft().result()
+                print(f"[+] {stego_path}: {used} біт")
+        while pending:
+            stego_path, used = pending.popleft().result()
+            print(f"[+] {stego_path}: {used} біт")
+
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def output_name(name, file_id, used):
+    """
+    Безпечне ім'я відновленого файлу в межах вихідної папки.
+    name береться з маніфесту (недовірені дані): від нього лишається тільки базове ім'я,
+    а порожні, '.', '..' та імена з нульовим байтом замінюються на <id>.bin.
+    Повтори в межах used отримують суфікс _N (a.txt, a_1.txt, ...).
+    """
+    name = os.path.basename(str(name).replace('\\', '/')) if name is not None else ''
+    if name in ('', '.', '..') or '\0' in name:
+        name = file_id + '.bin'
+    stem, ext = os.path.splitext(name)
+    candidate, n = name, 0
+    while candidate.lower() in used:
+        n += 1
+        candidate = f"{stem}_{n}{ext}"
+    used.add(candidate.lower())
+    return candidate
+
+
+def extract_files(stego_dir, out_dir, bits=1, alpha=False, key=None, workers=None):
+    """
+    Витягує та збирає всі файли, розподілені між зображеннями stego_dir.
+    Кожен файл записується, щойно надійшов його останній фрагмент, і звільняється з пам'яті.
+    Повертає список шляхів відновлених файлів.
+    """
+    manifest_path = os.path.join(stego_dir, MANIFEST_NAME)
+    known = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            known = {entry["id"]: entry for entry in json.load(f)["files"]}
+
+    os.makedirs(out_dir, exist_ok=True)
+    restored = []
+    used = set()
+
+    def write_file(file_id, total, chunks):
+        content = b''.join(chunks[seq] for seq in range(total))
+        entry = known.get(file_id)
+        if entry is not None and hashlib.sha256(content).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Помилка: Контрольна сума файлу {entry['name']} не збігається з маніфестом.")
+        name = output_name(entry["name"] if entry is not None else None, file_id, used)
+
+        out_path = os.path.join(out_dir, name)
+        with open(out_path, 'wb') as f:
+            f.write(content)
+        restored.append(out_path)
+        print(f"[+] Відновлено {out_path} ({len(content)} байт, {total} фрагм.)")
+
+    jobs = [(path, bits, alpha, key) for path in list_images(stego_dir)]
+    groups = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for found in pool.map(_extract_job, jobs, chunksize=max(1, len(jobs) // 64)):
+            if found is None:
+                continue
+            if len(found) == 2:
+                print(f"[!] {found[0]}: {found[1]}")
+                continue
+            _, file_id, seq, total, chunk = found
+            file_id = file_id.hex()
+            chunks = groups.setdefault(file_id, (total, {}))[1]
+            chunks[seq] = chunk
+            if len(chunks) == total and all(seq in chunks for seq in range(total)):
+                write_file(file_id, total, groups.pop(file_id)[1])
+
+    for file_id, (total, chunks) in groups.items():
+        missing = [seq for seq in range(total) if seq not in chunks]
+        raise ValueError(f"Помилка: Для файлу {file_id} бракує фрагментів {missing}.")
+    return restored
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетна LSB-стеганографія")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p):
+        p.add_argument("--out", required=True, help="вихідна папка")
+        p.add_argument("--bits", type=int, default=1, help="молодших бітів на канал (1-4)")
+        p.add_argument("--alpha", action="store_true", help="використовувати канал прозорості")
+        p.add_argument("--key", help="ключ псевдовипадкового порядку пікселів")
+        p.add_argument("--workers", type=int, help="кількість процесів (за замовчуванням - усі ядра)")
+
+    p_embed = sub.add_parser("embed", help="розподілити файли між контейнерами")
+    p_embed.add_argument("payloads", nargs="+")
+    p_embed.add_argument("--covers", required=True, help="папка з контейнерами")
+    add_common(p_embed)
+
+    p_extract = sub.add_parser("extract", help="зібрати файли з папки зображень")
+    p_extract.add_argument("stego_dir")
+    add_common(p_extract)
+
+    args = parser.parse_args(argv)
+    if args.command == "embed":
+        embed_files(args.payloads, args.covers, args.out, args.bits, args.alpha, args.key, args.workers)
+    else:
+        extract_files(args.stego_dir, args.out, args.bits, args.alpha, args.key, args.workers)
+
+
+if __name__ == "__main__":
+    main()
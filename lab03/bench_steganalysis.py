@@ -0,0 +1,109 @@
+"""
+Точність та швидкість стеганоаналізу (steganalysis.py).
+
+Еталон - вихід fast_stego.hide_message: у кожен синтетичний контейнер вбудовується текст
+заданої частки ємності (--rates), послідовно та з ключем (псевдовипадковий порядок пікселів).
+З --payload random замість тексту вбудовуються випадкові байти (hide_data) - так виглядають
+стиснені або зашифровані дані, для яких розрахований хі-квадрат.
+Для кожної частки виводиться середня оцінка RS, середня похибка та частка виявлених зображень
+(оцінка > --threshold); для частки 0 - це хибні тривоги на чистих контейнерах.
+Наприкінці вимірюється швидкість scan_directory (зображень/с та на годину).
+
+Запуск:
+    python bench_steganalysis.py
+    python bench_steganalysis.py --images 20 --side 1024 --workers 4
+    python bench_steganalysis.py --payload random
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+import fast_stego
+from steganalysis import DEFAULT_THRESHOLD, analyze_image, scan_directory
+
+ALPHABET = list("abcdefghijklmnopqrstuvwxyz 0123456789Курка чи яйце")
+
+
+def make_cover(path, side, seed):
+    """Гладке зображення з шумом сенсора - на випадковому шумі RS-аналіз не має сенсу."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:side, 0:side] / side
+    channels = [128 + 60 * np.sin((3 + seed % 5) * x + c + rng.random() * 3) * np.cos(4 * y + c)
+                + 30 * np.sin(20 * x * y + c) for c in range(3)]
+    pixels = np.stack(channels, axis=-1) + rng.normal(0, rng.uniform(1, 6), (side, side, 3))
+    Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), 'RGB').save(path)
+
+
+def make_message(rng, nbytes):
+    """Текст, що в UTF-8 займає не більше nbytes байтів."""
+    text = ''.join(rng.choice(ALPHABET, nbytes))
+    return text.encode('utf-8')[:nbytes].decode('utf-8', 'ignore')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк стеганоаналізу LSB")
+    parser.add_argument("--images", type=int, default=8, help="кількість контейнерів")
+    parser.add_argument("--side", type=int, default=512, help="розмір контейнера (пікселів)")
+    parser.add_argument("--rates", type=float, nargs="+", default=[0, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--payload", choices=["text", "random"], default="text",
+                        help="text - hide_message, random - hide_data з випадковими байтами")
+    parser.add_argument("--workers", type=int, help="процесів для scan_directory")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        covers = []
+        for i in range(args.images):
+            path = os.path.join(tmp, f"cover{i}.png")
+            make_cover(path, args.side, i)
+            covers.append(path)
+
+        print(f"Контейнерів: {args.images} x {args.side}x{args.side}, дані: {args.payload}, "
+              f"поріг {args.threshold:.0%}")
+        print(f"{'ЧАСТКА':>6} | {'ПОРЯДОК':>8} | {'ОЦІНКА RS':>9} | {'ПОХИБКА':>7} | {'ХІ-КВ.':>6} | {'ВИЯВЛЕНО':>8}")
+        print("-" * 60)
+        stego_dir = os.path.join(tmp, "stego")
+        os.makedirs(stego_dir)
+        for rate in args.rates:
+            for key in (None, "КОЖАН"):
+                if rate == 0 and key is not None:
+                    continue
+                estimates, chi_rates = [], []
+                for i, cover in enumerate(covers):
+                    target = cover
+                    if rate > 0:
+                        target = os.path.join(stego_dir, f"r{rate}_{key is not None}_{i}.png")
+                        # Заголовок формату займає кілька байтів ємності
+                        nbytes = max(1, int(fast_stego.capacity(cover) * rate) - 32)
+                        if args.payload == "random":
+                            fast_stego.hide_data(cover, target, rng.bytes(nbytes), key=key)
+                        else:
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                fast_stego.hide_message(cover, target, make_message(rng, nbytes), key=key)
+                    result = analyze_image(target)
+                    estimates.append(result["rate"])
+                    chi_rates.append(result["chi_rate"])
+                estimates = np.array(estimates)
+                detected = np.mean(estimates > args.threshold)
+                order = "ключ" if key else "рядки"
+                print(f"{rate:>6.0%} | {order:>8} | {estimates.mean():>9.3f} | "
+                      f"{np.abs(estimates - rate).mean():>7.3f} | {np.mean(chi_rates):>6.2f} | {detected:>8.0%}")
+
+        count = 0
+        start = time.perf_counter()
+        for _ in scan_directory(stego_dir, args.workers):
+            count += 1
+        elapsed = time.perf_counter() - start
+        print(f"\nscan_directory: {count} зображень за {elapsed:.2f} c "
+              f"({count / elapsed:.1f} зобр./с, {count / elapsed * 3600:,.0f} на годину)")
+
+
+if __name__ == "__main__":
+    main()
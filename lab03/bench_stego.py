@@ -0,0 +1,85 @@
+"""
+Порівняння швидкодії: hide_message / extract_message з lab_3_kozhan.py
+проти векторної версії fast_stego.py на зображеннях різного розміру.
+
+Запуск:
+    python bench_stego.py
+    python bench_stego.py --megapixels 0.25 1 4 24 --legacy-max 4
+
+Версія з циклами на великих зображеннях працює хвилинами,
+тому для неї за замовчуванням пропускаються розміри понад --legacy-max Мп.
+Для кожного розміру перевіряється, що у старому форматі (legacy=True)
+обидві версії дають однаковий PNG; час "нов." - для формату з заголовком.
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+import lab_3_kozhan as legacy
+import fast_stego
+
+MESSAGE = "Сховане повідомлення: Курка чи яйце 12312"
+
+
+def make_cover(path, megapixels, seed=2025):
+    """Створює випадкове RGB-зображення приблизно заданого розміру."""
+    side = int((megapixels * 1_000_000) ** 0.5)
+    rng = np.random.default_rng(seed)
+    Image.fromarray(rng.integers(0, 256, (side, side, 3), dtype=np.uint8), 'RGB').save(path)
+    return side
+
+
+def measure(func, *args):
+    """Час виконання функції (її вивід на екран приглушується)."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк LSB-стеганографії")
+    parser.add_argument("--megapixels", nargs="+", type=float, default=[0.25, 1, 4, 24])
+    parser.add_argument("--legacy-max", type=float, default=4,
+                        help="максимальний розмір (Мп) для версії з циклами")
+    parser.add_argument("--message-kb", type=int, default=1, help="розмір повідомлення, KB")
+    args = parser.parse_args()
+
+    message = (MESSAGE * (args.message_kb * 1024 // len(MESSAGE.encode('utf-8')) + 1))
+
+    print(f"{'Мп':>6} | {'СТОРОНА':>7} | {'HIDE стар.':>10} | {'HIDE нов.':>10} | {'EXTR стар.':>10} | {'EXTR нов.':>10}")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        for mp in args.megapixels:
+            cover = os.path.join(tmp, "cover.png")
+            old_png = os.path.join(tmp, "old.png")
+            new_png = os.path.join(tmp, "new.png")
+            side = make_cover(cover, mp)
+
+            t_hide_new = measure(fast_stego.hide_message, cover, new_png, message)
+            t_extr_new = measure(fast_stego.extract_message, new_png)
+
+            if mp <= args.legacy_max:
+                t_hide_old = measure(legacy.hide_message, cover, old_png, message)
+                t_extr_old = measure(legacy.extract_message, old_png)
+                # Векторна версія у старому форматі має дати той самий файл
+                same_png = os.path.join(tmp, "same.png")
+                measure(fast_stego.hide_message, cover, same_png, message, True)
+                with open(old_png, 'rb') as a, open(same_png, 'rb') as b:
+                    if a.read() != b.read():
+                        raise SystemExit(f"[!] PNG відрізняються для {mp} Мп")
+                hide_old, extr_old = f"{t_hide_old:>10.3f}", f"{t_extr_old:>10.3f}"
+            else:
+                hide_old = extr_old = f"{'пропущено':>10}"
+
+            print(f"{mp:>6} | {side:>7} | {hide_old} | {t_hide_new:>10.3f} | {extr_old} | {t_extr_new:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
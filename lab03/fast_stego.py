@@ -0,0 +1,281 @@
+"""
+Векторизована LSB-стеганографія на NumPy.
+
+За замовчуванням дані записуються у версійованому форматі з заголовком
+(див. payload_format.py): при витяганні читається лише заголовок і рівно
+стільки бітів, скільки займає секрет. Старий формат lab_3_kozhan.py
+(текст UTF-8 + END_MARKER) розпізнається автоматично; з legacy=True
+PNG на виході побайтно збігається з результатом lab_3_kozhan.hide_message.
+
+Відмінності від версії з циклами:
+  * біти отримуються через np.unpackbits / np.packbits, без списків Python;
+  * при вбудовуванні змінюється лише потрібний префікс пікселів;
+  * для старого формату молодші біти читаються блоками, і читання
+    зупиняється, щойно знайдено END_MARKER.
+
+Режими вбудовування (однакові параметри потрібні і для hide, і для extract):
+  * bits=1..4  - скільки молодших бітів кожного каналу використовувати;
+  * alpha=True - використовувати також канал прозорості (зображення зберігається як RGBA);
+  * key="..."  - порядок пікселів визначається псевдовипадковою перестановкою,
+                 згенерованою з ключа (без ключа - звичайний порядок рядків).
+Режим за замовчуванням (bits=1, alpha=False, key=None) збігається з lab_3_kozhan.py.
+"""
+import argparse
+import hashlib
+
+import numpy as np
+from PIL import Image
+
+from lab_3_kozhan import END_MARKER
+from payload_format import FLAG_TEXT, HEADER_SIZE, check_payload, pack_payload, parse_header
+
+# Скільки значень каналів обробляти за один крок при пошуку маркера (кратне 8)
+EXTRACT_BLOCK = 1 << 20
+
+MAX_BITS = 4
+
+
+def _check_mode(bits):
+    if not 1 <= bits <= MAX_BITS:
+        raise ValueError(f"Помилка: Кількість бітів на канал має бути від 1 до {MAX_BITS}, отримано {bits}.")
+
+
+def load_channels(path, alpha=False):
+    """
+    Відкриває зображення в режимі RGB (або RGBA при alpha=True).
+    Повертає (img, плаский масив каналів uint8, кількість каналів на піксель).
+    """
+    img = Image.open(path).convert('RGBA' if alpha else 'RGB')
+    flat = np.asarray(img, dtype=np.uint8).reshape(-1)
+    return img, flat, len(img.getbands())
+
+
+def load_rgb(path):
+    """Відкриває зображення в режимі RGB. Повертає (img, плаский масив каналів uint8)."""
+    img, flat, _ = load_channels(path)
+    return img, flat
+
+
+def pixel_order(n_pixels, key):
+    """Перестановка індексів пікселів за ключем (None - звичайний порядок)."""
+    if key is None:
+        return None
+    seed = int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:8], 'big')
+    # Уся перестановка генерується одним викликом, а не попіксельно
+    return np.random.default_rng(seed).permutation(n_pixels)
+
+
+def slot_indices(start, stop, channels, order=None):
+    """Індекси в плаского масиві каналів для "комірок" з номерами start..stop-1."""
+    slots = np.arange(start, stop, dtype=np.int64)
+    if order is None:
+        return slots
+    pixels, channel = np.divmod(slots, channels)
+    return order[pixels] * channels + channel
+
+
+def embed_bits(flat, bits, depth=1, order=None, channels=3):
+    """
+    Записує масив бітів у молодші depth бітів комірок flat (на місці).
+    Кожна комірка (значення каналу) вміщує depth бітів, старший біт першим.
+    """
+    n_slots = -(-len(bits) // depth)
+    if order is None and depth == 1:
+        # (val & ~1) | bit - та сама операція, що й у циклі, але над усім префіксом одразу
+        flat[:n_slots] &= 0xFE
+        flat[:n_slots] |= bits
+        return
+    padded = np.zeros(n_slots * depth, dtype=np.uint8)
+    padded[:len(bits)] = bits
+    weights = (1 << np.arange(depth - 1, -1, -1)).astype(np.uint8)
+    values = (padded.reshape(-1, depth) * weights).sum(axis=1, dtype=np.uint8)
+    idx = slot_indices(0, n_slots, channels, order)
+    mask = (1 << depth) - 1
+    flat[idx] = (flat[idx] & (0xFF ^ mask)) | values
+
+
+def read_bytes(flat, start_bit, nbytes, depth=1, order=None, channels=3):
+    """Читає nbytes байтів з молодших бітів, починаючи з біта start_bit потоку."""
+    if order is None and depth == 1:
+        chunk = flat[start_bit:start_bit + nbytes * 8] & 1
+        return np.packbits(chunk).tobytes()
+    stop_bit = start_bit + nbytes * 8
+    first, last = start_bit // depth, -(-stop_bit // depth)
+    values = flat[slot_indices(first, last, channels, order)] & ((1 << depth) - 1)
+    shifts = np.arange(depth - 1, -1, -1, dtype=np.uint8)
+    bits = ((values[:, None] >> shifts) & 1).reshape(-1)
+    offset = start_bit - first * depth
+    return np.packbits(bits[offset:offset + nbytes * 8]).tobytes()
+
+
+def capacity_bits(n_pixels, channels, depth=1):
+    """Скільки бітів вміщує зображення в заданому режимі."""
+    return n_pixels * channels * depth
+
+
+def capacity(cover_path, bits=1, alpha=False):
+    """
+    Планувальник ємності: скільки байтів секрету (без заголовка) вміститься
+    в зображення в заданому режимі. Пікселі не декодуються - лише розміри.
+    """
+    _check_mode(bits)
+    with Image.open(cover_path) as img:
+        w, h = img.size
+    channels = 4 if alpha else 3
+    return max(0, capacity_bits(w * h, channels, bits) // 8 - HEADER_SIZE)
+
+
+def capacity_table(cover_path):
+    """Ємність для всіх режимів: список (bits, alpha, байтів)."""
+    return [(bits, alpha, capacity(cover_path, bits, alpha))
+            for alpha in (False, True) for bits in range(1, MAX_BITS + 1)]
+
+
+def hide_bytes(cover_path, stego_path, payload, bits=1, alpha=False, key=None):
+    """
+    Вбудовує готовий payload (bytes) у зображення та зберігає PNG.
+    Повертає (використано біт, ємність у бітах).
+    """
+    _check_mode(bits)
+    img, flat, channels = load_channels(cover_path, alpha)
+    payload_bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+    n_pixels = flat.size // channels
+    total_bits = capacity_bits(n_pixels, channels, bits)
+
+    if len(payload_bits) > total_bits:
+        raise ValueError(f"Помилка: Текст завеликий! Потрібно {len(payload_bits)} біт, а доступно {total_bits}.")
+
+    flat = flat.copy()
+    embed_bits(flat, payload_bits, bits, pixel_order(n_pixels, key), channels)
+    # Записуємо пікселі назад у той самий об'єкт Image, щоб PNG збігався побайтно
+    img.frombytes(flat.tobytes())
+    img.save(stego_path, format='PNG')
+    return len(payload_bits), total_bits
+
+
+def extract_marked(flat, marker=END_MARKER):
+    """
+    Шукає marker у потоці байтів з молодших бітів, читаючи блоками.
+    Повертає байти до маркера або None, якщо маркер не знайдено.
+    """
+    data = bytearray()
+    total_bytes = flat.size // 8  # неповний останній байт ігнорується, як у _from_bits
+    step = EXTRACT_BLOCK // 8
+    for start in range(0, total_bytes, step):
+        count = min(step, total_bytes - start)
+        # Маркер може бути розрізаний між блоками - шукаємо з невеликим перекриттям
+        search_from = max(0, len(data) - len(marker) + 1)
+        data += read_bytes(flat, start * 8, count)
+        stop_index = data.find(marker, search_from)
+        if stop_index != -1:
+            return bytes(data[:stop_index])
+    return None
+
+
+def extract_payload(flat, bits=1, order=None, channels=3):
+    """
+    Витягує дані з автоматичним визначенням формату.
+    Повертає (дані, прапорці) або None, якщо секрету не знайдено.
+    """
+    total_bits = flat.size * bits
+    header = None
+    if total_bits >= HEADER_SIZE * 8:
+        header = parse_header(read_bytes(flat, 0, HEADER_SIZE, bits, order, channels))
+    if header is not None:
+        flags, length, crc = header
+        if (HEADER_SIZE + length) * 8 > total_bits:
+            raise ValueError("Помилка: Довжина даних у заголовку перевищує ємність зображення.")
+        data = read_bytes(flat, HEADER_SIZE * 8, length, bits, order, channels)
+        check_payload(data, crc)
+        return data, flags
+
+    # Старий формат (текст + END_MARKER) існує лише в режимі за замовчуванням
+    if bits != 1 or order is not None or channels != 3:
+        return None
+    data = extract_marked(flat)
+    if data is None:
+        return None
+    return data, FLAG_TEXT
+
+
+def hide_data(cover_path, stego_path, data, flags=0, bits=1, alpha=False, key=None):
+    """Вбудовує довільні байти у форматі з заголовком. Повертає (використано біт, ємність)."""
+    return hide_bytes(cover_path, stego_path, pack_payload(data, flags), bits, alpha, key)
+
+
+def extract_data(stego_path, bits=1, alpha=False, key=None):
+    """Витягує приховані байти. Повертає (дані, прапорці)."""
+    _check_mode(bits)
+    _, flat, channels = load_channels(stego_path, alpha)
+    order = pixel_order(flat.size // channels, key)
+    found = extract_payload(flat, bits, order, channels)
+    if found is None:
+        raise ValueError("Помилка: Приховані дані не знайдено. Можливо, файл пошкоджено або там немає секрету.")
+    return found
+
+
+def hide_message(cover_path, stego_path, message_text, legacy=False, bits=1, alpha=False, key=None):
+    """
+    Вбудовує текст у зображення методом LSB (векторна версія).
+    legacy=True - старий формат з END_MARKER (сумісний з lab_3_kozhan.py).
+    """
+    data = message_text.encode('utf-8')
+    if legacy:
+        used, total_bits = hide_bytes(cover_path, stego_path, data + END_MARKER)
+    else:
+        used, total_bits = hide_data(cover_path, stego_path, data, FLAG_TEXT, bits, alpha, key)
+    print(f"[+] Успіх! Дані приховано у файлі: {stego_path}")
+    print(f"[i] Статистика: використано {used} з {total_bits} доступних біт.")
+
+
+def extract_text(stego_path, bits=1, alpha=False, key=None):
+    """Витягує прихований текст і повертає його рядком."""
+    data, flags = extract_data(stego_path, bits, alpha, key)
+    if not flags & FLAG_TEXT:
+        raise ValueError("Помилка: Приховані дані не є текстом.")
+    return data.decode('utf-8')
+
+
+def extract_message(stego_path, bits=1, alpha=False, key=None):
+    """Витягує приховані дані із зображення та виводить їх."""
+    extracted_text = extract_text(stego_path, bits, alpha, key)
+    print("\n--- ЗНАЙДЕНО ПОВІДОМЛЕННЯ ---")
+    print(extracted_text)
+    print("-------------------------------")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LSB-стеганографія (векторна версія)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_mode(p):
+        p.add_argument("--bits", type=int, default=1, help="молодших бітів на канал (1-4)")
+        p.add_argument("--alpha", action="store_true", help="використовувати канал прозорості")
+        p.add_argument("--key", help="ключ псевдовипадкового порядку пікселів")
+
+    p_hide = sub.add_parser("hide", help="приховати текст")
+    p_hide.add_argument("cover")
+    p_hide.add_argument("stego")
+    p_hide.add_argument("message")
+    add_mode(p_hide)
+
+    p_extract = sub.add_parser("extract", help="витягти текст")
+    p_extract.add_argument("stego")
+    add_mode(p_extract)
+
+    p_capacity = sub.add_parser("capacity", help="ємність зображення для всіх режимів")
+    p_capacity.add_argument("cover")
+
+    args = parser.parse_args(argv)
+    if args.command == "hide":
+        hide_message(args.cover, args.stego, args.message, bits=args.bits, alpha=args.alpha, key=args.key)
+    elif args.command == "extract":
+        extract_message(args.stego, args.bits, args.alpha, args.key)
+    else:
+        print(f"{'БІТІВ':>5} | {'ALPHA':>5} | {'ЄМНІСТЬ, байт':>14}")
+        for bits, alpha, size in capacity_table(args.cover):
+            print(f"{bits:>5} | {'так' if alpha else 'ні':>5} | {size:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Версійований формат корисного навантаження для LSB-стеганографії.
+
+Замість стоп-маркера END_MARKER у кінці даних на початку записується
+невеликий заголовок:
+
+    MAGIC   3 байти  b'\\x89KS' - сигнатура формату
+    VERSION 1 байт   версія формату (зараз 1)
+    FLAGS   1 байт   прапорці (FLAG_TEXT - дані є текстом UTF-8,
+                     FLAG_FRAGMENT - дані є фрагментом більшого файлу)
+    LENGTH  4 байти  довжина даних у байтах (big-endian)
+    CRC32   4 байти  контрольна сума даних (zlib.crc32)
+
+Переваги перед END_MARKER:
+  * при витяганні читається лише заголовок + рівно LENGTH байтів,
+    тобто робота пропорційна розміру секрету, а не зображення;
+  * дані можуть містити будь-які байти (зокрема FF 00 FF 00);
+  * пошкодження виявляється за контрольною сумою.
+
+Байт 0x89 ніколи не буває першим байтом коректного UTF-8 тексту, тому
+старий формат (текст + END_MARKER) не можна сплутати з новим.
+"""
+import struct
+import zlib
+
+MAGIC = b'\x89KS'
+VERSION = 1
+
+FLAG_TEXT = 0x01
+FLAG_FRAGMENT = 0x02
+
+_HEADER = struct.Struct('>3sBBII')
+HEADER_SIZE = _HEADER.size  # 13 байтів
+
+
+def pack_payload(data, flags=0):
+    """Додає до даних заголовок. Повертає байти для вбудовування."""
+    return _HEADER.pack(MAGIC, VERSION, flags, len(data), zlib.crc32(data)) + data
+
+
+def parse_header(header):
+    """
+    Розбирає заголовок (перші HEADER_SIZE байтів).
+    Повертає (flags, length, crc) або None, якщо це не новий формат.
+    """
+    if len(header) < HEADER_SIZE or not header.startswith(MAGIC):
+        return None
+    _, version, flags, length, crc = _HEADER.unpack(header[:HEADER_SIZE])
+    if version != VERSION:
+        raise ValueError(f"Помилка: Непідтримувана версія формату даних: {version}.")
+    return flags, length, crc
+
+
+def check_payload(data, crc):
+    """Перевіряє контрольну суму витягнутих даних."""
+    if zlib.crc32(data) != crc:
+        raise ValueError("Помилка: Контрольна сума не збігається. Дані пошкоджено.")
@@ -0,0 +1,285 @@
+"""
+Стеганоаналіз LSB: чи містить довільне зображення вбудовані дані та яку частку ємності вони займають.
+
+Два класичні методи, обидва - операції NumPy над цілими масивами каналів:
+  * хі-квадрат пар значень (Westfeld, Pfitzmann): запис у молодший біт вирівнює
+    частоти значень 2k та 2k+1. Гістограми рахуються для послідовних префіксів
+    потоку каналів (у тому порядку, в якому пише lab_3_kozhan.hide_message),
+    тому довжину послідовного повідомлення видно як префікс з p-значенням близько 1.
+    Метод розрахований на біти, схожі на випадкові (стиснені або зашифровані дані);
+    у тексті UTF-8 старші біти байтів майже завжди однакові, і пари не вирівнюються;
+  * RS-аналіз (Fridrich, Goljan, Du): частки "регулярних" та "сингулярних" груп
+    пікселів для масок M та -M; з них розв'язується квадратне рівняння на частку
+    змінених значень. Працює і для псевдовипадкового порядку пікселів (key=...).
+
+analyze_image(path) повертає словник з оцінками; scan_directory(папка) обробляє
+зображення в пулі процесів і віддає результати по мірі готовності.
+
+Приклади:
+    python steganalysis.py hidden.png
+    python steganalysis.py uploads/ --workers 4 --threshold 0.05 --jsonl
+"""
+import argparse
+import json
+import math
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+from PIL import Image
+
+from batch_stego import IMAGE_EXTENSIONS
+
+# Кількість префіксів потоку для послідовного хі-квадрат
+CHI_SEGMENTS = 100
+# Префікс вважається заповненим, якщо p-значення перевищує цей поріг
+CHI_P_THRESHOLD = 0.5
+# Пару (2k, 2k+1) враховуємо, лише якщо в ній достатньо значень
+CHI_MIN_COUNT = 5
+
+# Маска RS-аналізу для груп з 4 сусідніх пікселів рядка
+RS_MASK = np.array([0, 1, 1, 0], dtype=bool)
+
+# Оцінка частки ємності, вище якої зображення вважається підозрілим
+DEFAULT_THRESHOLD = 0.05
+
+
+def _gammaincc(a, x):
+    """Регуляризована верхня неповна гамма-функція Q(a, x) (Numerical Recipes, 6.2)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Ряд для P(a, x)
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-12:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Ланцюговий дріб для Q(a, x) (метод Лентца)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def chi_square_p(hist):
+    """
+    p-значення хі-квадрат пар значень для гістограми з 256 елементів:
+    близько 1 - частоти в парах вирівняні (ознака LSB-запису), близько 0 - природне зображення.
+    """
+    hist = np.asarray(hist, dtype=np.float64)
+    even, odd = hist[0::2], hist[1::2]
+    expected = (even + odd) / 2
+    used = expected * 2 >= CHI_MIN_COUNT
+    dof = int(used.sum()) - 1
+    if dof < 1:
+        return 0.0
+    chi2 = float((((even[used] - expected[used]) ** 2) / expected[used]).sum())
+    return _gammaincc(dof / 2, chi2 / 2)
+
+
+def chi_square_sequential(flat, segments=CHI_SEGMENTS):
+    """
+    Послідовний хі-квадрат. flat - плаский масив каналів uint8 у порядку запису.
+    Повертає (p-значення для кожного з segments префіксів, оцінена частка заповнення).
+    """
+    segments = max(1, min(segments, flat.size))
+    bounds = np.linspace(0, flat.size, segments + 1).astype(np.int64)
+    hists = np.stack([np.bincount(flat[start:stop], minlength=256)
+                      for start, stop in zip(bounds[:-1], bounds[1:])])
+    prefix_hists = np.cumsum(hists, axis=0)
+    p_values = np.array([chi_square_p(h) for h in prefix_hists])
+
+    # Заповнений префікс - найдовший початок потоку, де p тримається вище порога
+    below = np.flatnonzero(p_values < CHI_P_THRESHOLD)
+    filled = segments if below.size == 0 else int(below[0])
+    return p_values, filled / segments
+
+
+def _flip(values, direction):
+    """Інвертування LSB: F1 міняє 2k<->2k+1, F-1 міняє 2k-1<->2k."""
+    if direction > 0:
+        return values ^ 1
+    return ((values + 1) ^ 1) - 1
+
+
+def _rs_counts(groups, mask):
+    """Частки регулярних та сингулярних груп для масок mask та -mask."""
+    smooth = np.abs(np.diff(groups, axis=1)).sum(axis=1)
+    result = []
+    for direction in (1, -1):
+        flipped = groups.copy()
+        flipped[:, mask] = _flip(groups[:, mask], direction)
+        changed = np.abs(np.diff(flipped, axis=1)).sum(axis=1)
+        result.append((np.count_nonzero(changed > smooth) / len(groups),
+                       np.count_nonzero(changed < smooth) / len(groups)))
+    return result
+
+
+def rs_rate(channel, mask=RS_MASK):
+    """
+    RS-оцінка частки значень каналу, що несуть вбудовані дані (0..1).
+    channel - двовимірний масив одного каналу кольору.
+    """
+    n = len(mask)
+    height, width = channel.shape
+    width -= width % n
+    if height == 0 or width == 0:
+        return 0.0
+    groups = channel[:, :width].astype(np.int16).reshape(-1, n)
+
+    (rm, sm), (rm_neg, sm_neg) = _rs_counts(groups, mask)
+    (rm1, sm1), (rm1_neg, sm1_neg) = _rs_counts(groups ^ 1, mask)
+
+    d0, d1 = rm - sm, rm1 - sm1
+    dn0, dn1 = rm_neg - sm_neg, rm1_neg - sm1_neg
+    a = 2 * (d1 + d0)
+    b = dn0 - dn1 - d1 - 3 * d0
+    c = d0 - dn0
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        # Майже повне заповнення: R_M ~ S_M, і рівняння стає нестійким.
+        # Лінійна оцінка: різниця R_M - S_M зникає, а R_-M - S_-M зберігається
+        return min(1.0, max(0.0, 1 - abs(d0) / abs(dn0))) if dn0 else 0.0
+    if abs(a) < 1e-12:
+        z = -c / b if abs(b) > 1e-12 else 0.0
+    else:
+        roots = ((-b + math.sqrt(disc)) / (2 * a), (-b - math.sqrt(disc)) / (2 * a))
+        z = min(roots, key=abs)
+    if abs(z - 0.5) < 1e-12:
+        return 1.0
+    return min(1.0, max(0.0, z / (z - 0.5)))
+
+
+def analyze_pixels(pixels):
+    """
+    Аналіз масиву пікселів (висота, ширина, 3) uint8.
+    Повертає словник: rate - оцінка частки ємності з вбудованими даними (RS, середнє по каналах;
+    основна оцінка, бо не залежить від порядку пікселів і вмісту повідомлення),
+    rs - оцінки по каналах R, G, B, chi_p - p-значення хі-квадрат для всього потоку,
+    chi_rate - частка послідовно заповненого префікса потоку.
+    """
+    rs = [rs_rate(pixels[:, :, i]) for i in range(3)]
+    p_values, chi_rate = chi_square_sequential(pixels.reshape(-1))
+    return {
+        "rate": float(np.mean(rs)),
+        "rs": [round(float(r), 4) for r in rs],
+        "chi_p": float(p_values[-1]),
+        "chi_rate": chi_rate,
+    }
+
+
+def analyze_image(path):
+    """Аналіз файлу зображення (конвертується в RGB, як у hide_message)."""
+    with Image.open(path) as img:
+        pixels = np.asarray(img.convert('RGB'), dtype=np.uint8)
+    result = analyze_pixels(pixels)
+    result["path"] = path
+    result["size"] = [pixels.shape[1], pixels.shape[0]]
+    return result
+
+
+def _scan_job(path):
+    """
+    Аналіз одного файлу в процесі-працівнику; помилки декодування повертаються в результаті.
+    DecompressionBombError (зображення понад ліміт пікселів PIL) - теж помилка цього файлу,
+    а не всього сканування.
+    """
+    try:
+        return analyze_image(path)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        return {"path": path, "error": str(exc)}
+
+
+def _scan_batch(paths):
+    """Пакет шляхів для одного завдання пулу."""
+    return [_scan_job(path) for path in paths]
+
+
+def iter_images(directory, recursive=False):
+    """Генератор шляхів зображень папки (без накопичення списку при recursive=True)."""
+    if not recursive:
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield os.path.join(directory, name)
+        return
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield os.path.join(root, name)
+
+
+def scan_directory(directory, workers=None, recursive=False, chunksize=4):
+    """
+    Аналізує всі зображення папки в ProcessPoolExecutor.
+    Генератор: результати analyze_image віддаються в порядку файлів, щойно готові.
+    Шляхи читаються пакетами по chunksize, і в черзі одночасно не більше
+    2*workers пакетів, тому список усіх файлів папки не створюється.
+    """
+    paths = iter_images(directory, recursive)
+    if workers == 1:
+        yield from map(_scan_job, paths)
+        return
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch in iter(lambda: list(islice(paths, chunksize)), []):
+            pending.append(pool.submit(_scan_batch, batch))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Виявлення LSB-стеганографії (хі-квадрат та RS-аналіз)")
+    parser.add_argument("paths", nargs="+", help="зображення або папки")
+    parser.add_argument("--workers", type=int, help="кількість процесів (за замовчуванням - усі ядра)")
+    parser.add_argument("--recursive", action="store_true", help="обходити вкладені папки")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="оцінка частки ємності, вище якої зображення позначається як підозріле")
+    parser.add_argument("--jsonl", action="store_true", help="виводити результати як JSON-рядки")
+    args = parser.parse_args(argv)
+
+    found = 0
+    for target in args.paths:
+        results = (scan_directory(target, args.workers, args.recursive) if os.path.isdir(target)
+                   else [_scan_job(target)])
+        for result in results:
+            if "error" not in result:
+                result["suspicious"] = result["rate"] > args.threshold
+                found += result["suspicious"]
+            if args.jsonl:
+                print(json.dumps(result, ensure_ascii=False), flush=True)
+            elif "error" in result:
+                print(f"[!] {result['path']}: {result['error']}", flush=True)
+            else:
+                mark = "[+]" if result["suspicious"] else "[-]"
+                print(f"{mark} {result['path']}: RS {result['rate']:.1%}, "
+                      f"хі-квадрат p={result['chi_p']:.3f} (префікс {result['chi_rate']:.0%})", flush=True)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Пакетне підписання та перевірка дерева каталогів.
+
+Файли хешуються паралельно в пулі потоків (hashlib звільняє GIL на великих
+буферах, тому потоки справді працюють одночасно). Результат - маніфест JSON
+із записом для кожного файлу: шлях, розмір, час зміни, SHA-256 і підпис.
+
+Під час перевірки файли, у яких не змінилися розмір і час модифікації,
+не перехешовуються (перевіряється лише підпис збереженого хешу).
+Прапорець --strict примушує перехешувати все.
+
+Приклади:
+    python batch_sign.py sign docs/ -m docs.manifest.json
+    python batch_sign.py verify docs/ -m docs.manifest.json --strict
+"""
+import argparse
+import getpass
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from lab_4_kozhan import derive_private_key, file_hasher, public_key_from_private, xor_bytes
+
+MANIFEST_VERSION = 1
+
+# Статуси перевірки
+OK = "OK"
+MODIFIED = "ЗМІНЕНО"
+MISSING = "ВІДСУТНІЙ"
+BAD_SIGNATURE = "ПІДРОБКА"
+NEW = "НОВИЙ"
+
+
+def walk_files(root: str) -> list:
+    # Усі файли дерева у вигляді відносних шляхів (з '/' як роздільником)
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            files.append(os.path.relpath(full, root).replace(os.sep, "/"))
+    files.sort()
+    return files
+
+
+def _sign_one(root: str, rel: str, private_key_bytes: bytes) -> dict:
+    # Хешування та підписання одного файлу (виконується в потоці пулу)
+    full = os.path.join(root, rel)
+    st = os.stat(full)
+    digest = file_hasher(full).digest()
+    return {
+        "path": rel,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": digest.hex(),
+        "signature": xor_bytes(digest, private_key_bytes).hex(),
+    }
+
+
+def sign_tree(root: str, private_key_bytes: bytes, workers: int = None, exclude: tuple = ()) -> dict:
+    # Підписує всі файли каталогу root. Повертає маніфест (dict)
+    files = [rel for rel in walk_files(root) if rel not in exclude]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        entries = list(pool.map(lambda rel: _sign_one(root, rel, private_key_bytes), files))
+    return {
+        "version": MANIFEST_VERSION,
+        "public_key": public_key_from_private(private_key_bytes),
+        "files": entries,
+    }
+
+
+def _verify_one(root: str, entry: dict, private_key_bytes: bytes, strict: bool) -> tuple:
+    # Перевірка одного запису маніфесту. Повертає (шлях, статус, чи перехешовано)
+    full = os.path.join(root, entry["path"])
+    try:
+        st = os.stat(full)
+    except FileNotFoundError:
+        return entry["path"], MISSING, False
+
+    # 1) Підпис має відповідати збереженому хешу
+    recovered_hash = xor_bytes(bytes.fromhex(entry["signature"]), private_key_bytes)
+    if recovered_hash.hex() != entry["sha256"]:
+        return entry["path"], BAD_SIGNATURE, False
+
+    # 2) Файл не змінювався (розмір і час) - перехешування не потрібне
+    unchanged = st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+    if unchanged and not strict:
+        return entry["path"], OK, False
+
+    # 3) Інакше - актуальний хеш файлу
+    current_hash = file_hasher(full).digest()
+    return entry["path"], OK if current_hash == recovered_hash else MODIFIED, True
+
+
+def verify_tree(root: str, manifest: dict, private_key_bytes: bytes, public_key: int,
+                strict: bool = False, workers: int = None, exclude: tuple = ()) -> list:
+    # Перевіряє каталог за маніфестом. Повертає список (шлях, статус, чи перехешовано)
+    if public_key_from_private(private_key_bytes) != public_key:
+        raise ValueError("Ключі математично не пов'язані.")
+    if manifest.get("public_key") != public_key:
+        raise ValueError("Маніфест підписано іншим ключем.")
+
+    entries = manifest["files"]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda e: _verify_one(root, e, private_key_bytes, strict), entries))
+
+    known = {entry["path"] for entry in entries}
+    results += [(rel, NEW, False) for rel in walk_files(root) if rel not in known and rel not in exclude]
+    return results
+
+
+def add_key_arguments(parser: argparse.ArgumentParser):
+    # Спільні параметри для генерації ключів (як у діалозі lab_4_kozhan.py)
+    parser.add_argument("--lastname", help="прізвище")
+    parser.add_argument("--birthday", help="дата народження (ДДММРРРР)")
+    parser.add_argument("--secret", help="секретне слово (якщо не задано - буде запитано)")
+
+
+def keys_from_args(args: argparse.Namespace) -> tuple:
+    # Приватний і публічний ключі з аргументів; відсутні значення запитуються інтерактивно
+    lastname = args.lastname if args.lastname is not None else input("Ваше прізвище: ").strip()
+    birthday = args.birthday if args.birthday is not None else input("Дата народження (ДДММРРРР): ").strip()
+    secret = args.secret if args.secret is not None else getpass.getpass("Секретне слово-пароль: ")
+    priv = derive_private_key(lastname, birthday, secret)
+    return priv, public_key_from_private(priv)
+
+
+def _manifest_exclude(root: str, manifest_path: str) -> tuple:
+    # Якщо маніфест лежить усередині каталогу, він не повинен підписувати сам себе
+    rel = os.path.relpath(os.path.abspath(manifest_path), os.path.abspath(root))
+    return (rel.replace(os.sep, "/"),)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетне підписання/перевірка каталогу")
+    parser.add_argument("command", choices=["sign", "verify"])
+    parser.add_argument("root", help="каталог з файлами")
+    parser.add_argument("-m", "--manifest", required=True, help="шлях до маніфесту JSON")
+    add_key_arguments(parser)
+    parser.add_argument("--strict", action="store_true", help="перехешувати всі файли")
+    parser.add_argument("--workers", type=int, help="кількість потоків")
+    args = parser.parse_args(argv)
+
+    priv, pub = keys_from_args(args)
+    exclude = _manifest_exclude(args.root, args.manifest)
+
+    if args.command == "sign":
+        manifest = sign_tree(args.root, priv, args.workers, exclude)
+        with open(args.manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        print(f"Підписано файлів: {len(manifest['files'])}. Маніфест: {args.manifest}")
+        return
+
+    with open(args.manifest, encoding="utf-8") as f:
+        manifest = json.load(f)
+    try:
+        results = verify_tree(args.root, manifest, priv, pub, args.strict, args.workers, exclude)
+    except ValueError as e:
+        raise SystemExit(f"Помилка: {e}")
+
+    problems = [(path, status) for path, status, _ in results if status != OK]
+    for path, status in problems:
+        print(f"{status:<10} {path}")
+    rehashed = sum(1 for _, _, r in results if r)
+    print(f"Перевірено: {len(results)}, перехешовано: {rehashed}, проблем: {len(problems)}")
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Порівняння пам'яті та швидкості хешування файлу:
+  * "старий" спосіб - Path(path).read_bytes() + sha256 (весь файл у пам'яті);
+  * потоковий file_hasher з lab_4_kozhan.py (буфер CHUNK_SIZE, readinto).
+Окремо вимірюється тест на цілісність: content + b"X" проти hasher.copy().update(b"X").
+
+Запуск:
+    python bench_hashing.py
+    python bench_hashing.py --sizes 10M 1G
+"""
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from lab_4_kozhan import file_hasher
+
+UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text):
+    """'10M' -> 10485760."""
+    text = text.strip().upper()
+    if text[-1] in UNITS:
+        return int(text[:-1]) * UNITS[text[-1]]
+    return int(text)
+
+
+def make_file(path, size):
+    """Створює файл заданого розміру блоками випадкових байтів."""
+    block = os.urandom(1 << 20)
+    with open(path, "wb") as f:
+        left = size
+        while left > 0:
+            f.write(block[:min(left, len(block))])
+            left -= len(block)
+
+
+def legacy_tamper(path):
+    content = Path(path).read_bytes()
+    original = hashlib.sha256(content).digest()
+    fake = hashlib.sha256(content + b"X").digest()
+    return original, fake
+
+
+def streaming_tamper(path):
+    hasher = file_hasher(path)
+    fake = hasher.copy()
+    fake.update(b"X")
+    return hasher.digest(), fake.digest()
+
+
+def measure(func, path):
+    """Повертає (час, пік пам'яті Python у байтах, результат)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк потокового хешування")
+    parser.add_argument("--sizes", nargs="+", default=["1M", "100M", "1G"])
+    args = parser.parse_args()
+
+    print(f"{'РОЗМІР':>7} | {'СПОСІБ':<10} | {'ЧАС, c':>8} | {'MB/c':>8} | {'ПІК ПАМ., MB':>12}")
+    print("-" * 58)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.bin")
+        for label in args.sizes:
+            size = parse_size(label)
+            make_file(path, size)
+            results = []
+            for name, func in (("старий", legacy_tamper), ("потоковий", streaming_tamper)):
+                elapsed, peak, result = measure(func, path)
+                results.append(result)
+                mbps = size / (1024 ** 2) / elapsed if elapsed else float("inf")
+                print(f"{label:>7} | {name:<10} | {elapsed:>8.3f} | {mbps:>8.1f} | {peak / 1024 ** 2:>12.2f}")
+            if results[0] != results[1]:
+                raise SystemExit(f"[!] Хеші не збігаються для {label}")
+
+
+if __name__ == "__main__":
+    main()
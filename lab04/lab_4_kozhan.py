@@ -1,8 +1,8 @@
 import hashlib
-from pathlib import Path
 
 MOD = 1_000_007
 PUB_MULT = 7  # константа для спрощеної математичної моделі публічного ключа
+CHUNK_SIZE = 1 << 20  # розмір буфера для потокового хешування (1 MB)
 
 def sha256_bytes(data: bytes) -> bytes:
     # Генерує SHA-256 хеш у вигляді байтового рядка (32 байти)
@@ -12,6 +12,25 @@ def sha256_hex(data: bytes) -> str:
     # Повертає хеш у шістнадцятковому (hex) форматі для зручного читання
     return hashlib.sha256(data).hexdigest()
 
+def file_hasher(path: str, chunk_size: int = CHUNK_SIZE):
+    # Потокове хешування: файл читається частинами в один і той самий буфер,
+    # тому пам'ять не залежить від розміру файлу.
+    # Повертає об'єкт hashlib, який можна доповнити (update) або скопіювати (copy)
+    h = hashlib.sha256()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h
+
+def sha256_file(path: str) -> bytes:
+    # SHA-256 вмісту файлу без завантаження його в пам'ять цілком
+    return file_hasher(path).digest()
+
 def derive_private_key(lastname: str, birthday: str, secret: str) -> bytes:
     # Генерація приватного ключа через хешування об'єднаних особистих даних
     # Приклад вхідних даних: Прізвище, Дата народження, Секретне слово
@@ -32,8 +51,7 @@ def xor_bytes(a: bytes, b: bytes) -> bytes:
 
 def sign_file(path: str, private_key_bytes: bytes) -> bytes:
     # Процес підписання: Хеш вмісту файлу XOR Приватний ключ
-    content = Path(path).read_bytes()
-    h = sha256_bytes(content)
+    h = sha256_file(path)
     return xor_bytes(h, private_key_bytes)
 
 def verify_file(path: str, signature: bytes, public_key: int, private_key_bytes: bytes) -> bool:
@@ -43,8 +61,7 @@ def verify_file(path: str, signature: bytes, public_key: int, private_key_bytes:
         return False  # помилка: ключі математично не пов'язані
     
     # 2) Обчислення актуального хешу файлу та дешифрування підпису
-    content = Path(path).read_bytes()
-    current_hash = sha256_bytes(content)
+    current_hash = sha256_file(path)
     recovered_hash = xor_bytes(signature, private_key_bytes)
     
     # 3) Порівняння: якщо хеші ідентичні, підпис вважається вірним
@@ -98,12 +115,13 @@ def main():
         elif choice == "3":
             # Демонстрація чутливості алгоритму до змін у файлі
             try:
-                signature = sign_file(doc_path, priv)          # отримання еталонного підпису
+                hasher = file_hasher(doc_path)                 # файл читається лише один раз
+                signature = xor_bytes(hasher.digest(), priv)   # отримання еталонного підпису
                 recovered_hash = xor_bytes(signature, priv)    # відновлення оригінального хешу
 
-                content = Path(doc_path).read_bytes()
-                fake_content = content + b"X"                  # вносимо зміни у вміст файлу (атака)
-                fake_hash = hashlib.sha256(fake_content).digest()
+                fake_hasher = hasher.copy()                    # стан хешу після оригінального вмісту
+                fake_hasher.update(b"X")                       # вносимо зміни у вміст файлу (атака) без копіювання файлу
+                fake_hash = fake_hasher.digest()
 
                 print(f"Еталонний підпис (hex): {signature.hex()}")
                 print("Результат перевірки зміненого файлу:",
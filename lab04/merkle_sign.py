@@ -0,0 +1,218 @@
+"""
+Підпис файлу на основі дерева Меркла.
+
+Файл ділиться на частини фіксованого розміру, кожна частина хешується окремо
+(паралельно в пулі потоків), з хешів будується дерево, а корінь дерева
+підписується тією самою схемою, що й у lab_4_kozhan.py: корінь XOR приватний ключ.
+
+Можливості, яких немає у звичайного sign_file:
+  * перевірка окремого діапазону байтів читає лише цей діапазон,
+    а решту дерева відновлює з хешів-"сусідів" (доказ включення);
+  * при невдалій перевірці всього файлу повідомляється, які саме частини змінено.
+
+Документ підпису (JSON): розмір частини, розмір файлу, хеші листків, підпис кореня.
+
+Приклади:
+    python merkle_sign.py sign big.iso -s big.iso.merkle.json
+    python merkle_sign.py verify big.iso -s big.iso.merkle.json
+    python merkle_sign.py verify-range big.iso -s big.iso.merkle.json --offset 1048576 --length 4096
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from batch_sign import add_key_arguments, keys_from_args
+from lab_4_kozhan import public_key_from_private, xor_bytes
+
+MERKLE_CHUNK_SIZE = 1 << 20  # 1 MB на листок
+SIGNATURE_VERSION = 1
+
+# Префікси розділяють хеші листків і внутрішніх вузлів (захист від підміни рівнів)
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def leaf_hash(chunk: bytes) -> bytes:
+    return hashlib.sha256(_LEAF + chunk).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def _parent_level(level: list) -> list:
+    # Рівень вище: пари вузлів хешуються разом, непарний останній вузол переноситься без змін
+    parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def build_levels(leaves: list) -> list:
+    # Усі рівні дерева: levels[0] - листки, levels[-1] - [корінь]
+    levels = [list(leaves) or [leaf_hash(b"")]]
+    while len(levels[-1]) > 1:
+        levels.append(_parent_level(levels[-1]))
+    return levels
+
+
+def chunk_count(size: int, chunk_size: int) -> int:
+    return max(1, -(-size // chunk_size))
+
+
+def hash_chunks(path: str, chunk_size: int = MERKLE_CHUNK_SIZE, first: int = 0,
+                last: int = None, workers: int = None) -> list:
+    # Хеші листків first..last (включно). Кожен потік відкриває файл один раз і читає
+    # свої частини через seek + readinto у власний буфер (os.pread недоступний у Windows),
+    # тож одночасно в пам'яті лише кілька частин
+    size = os.path.getsize(path)
+    if last is None:
+        last = chunk_count(size, chunk_size) - 1
+    local = threading.local()
+    handles = []
+    lock = threading.Lock()
+
+    def work(index):
+        if not hasattr(local, "file"):
+            local.file = open(path, "rb")
+            local.buffer = bytearray(chunk_size)
+            with lock:
+                handles.append(local.file)
+        local.file.seek(index * chunk_size)
+        n = local.file.readinto(local.buffer)
+        digest = hashlib.sha256(_LEAF)
+        digest.update(memoryview(local.buffer)[:n])
+        return digest.digest()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(work, range(first, last + 1)))
+    finally:
+        for f in handles:
+            f.close()
+
+
+def range_proof(levels: list, first: int, last: int) -> list:
+    # Доказ для листків first..last: на кожному рівні - лівий і/або правий сусід діапазону
+    proof = []
+    lo, hi = first, last
+    for level in levels[:-1]:
+        left = level[lo - 1] if lo % 2 else None
+        right = level[hi + 1] if hi % 2 == 0 and hi + 1 < len(level) else None
+        proof.append((left, right))
+        lo, hi = lo // 2, hi // 2
+    return proof
+
+
+def root_from_range(range_leaves: list, proof: list) -> bytes:
+    # Відновлює корінь з хешів діапазону та доказу (без решти файлу)
+    nodes = list(range_leaves)
+    for left, right in proof:
+        if left is not None:
+            nodes.insert(0, left)
+        if right is not None:
+            nodes.append(right)
+        # Тепер перший вузол має парний індекс, тож пари утворюються з початку списку
+        parents = [node_hash(nodes[i], nodes[i + 1]) for i in range(0, len(nodes) - 1, 2)]
+        if len(nodes) % 2:
+            parents.append(nodes[-1])  # останній вузол рівня без пари
+        nodes = parents
+    return nodes[0]
+
+
+def sign_file_merkle(path: str, private_key_bytes: bytes, chunk_size: int = MERKLE_CHUNK_SIZE,
+                     workers: int = None) -> dict:
+    # Підписання: хеші частин -> дерево -> корінь XOR приватний ключ
+    leaves = hash_chunks(path, chunk_size, workers=workers)
+    root = build_levels(leaves)[-1][0]
+    return {
+        "version": SIGNATURE_VERSION,
+        "chunk_size": chunk_size,
+        "size": os.path.getsize(path),
+        "leaves": [h.hex() for h in leaves],
+        "signature": xor_bytes(root, private_key_bytes).hex(),
+    }
+
+
+def _signed_levels(doc: dict, private_key_bytes: bytes, public_key: int) -> list:
+    # Перевіряє ключі та те, що збережені хеші листків дають підписаний корінь
+    if public_key_from_private(private_key_bytes) != public_key:
+        raise ValueError("Ключі математично не пов'язані.")
+    levels = build_levels([bytes.fromhex(h) for h in doc["leaves"]])
+    recovered_root = xor_bytes(bytes.fromhex(doc["signature"]), private_key_bytes)
+    if levels[-1][0] != recovered_root:
+        raise ValueError("Підпис не відповідає хешам частин (документ підпису підроблено).")
+    return levels
+
+
+def verify_file_merkle(path: str, doc: dict, private_key_bytes: bytes, public_key: int,
+                       workers: int = None) -> list:
+    # Повна перевірка. Повертає список номерів змінених частин (порожній - файл цілий)
+    levels = _signed_levels(doc, private_key_bytes, public_key)
+    stored = levels[0]
+    current = hash_chunks(path, doc["chunk_size"], workers=workers)
+    tampered = [i for i, (a, b) in enumerate(zip(stored, current)) if a != b]
+    # Частини, яких з'явилося більше або менше, ніж було
+    tampered += range(min(len(stored), len(current)), max(len(stored), len(current)))
+    return tampered
+
+
+def verify_range_merkle(path: str, doc: dict, offset: int, length: int,
+                        private_key_bytes: bytes, public_key: int) -> bool:
+    # Перевірка діапазону байтів: читаються лише частини, що його покривають
+    if length <= 0 or offset < 0 or offset + length > doc["size"]:
+        raise ValueError("Діапазон виходить за межі підписаного файлу.")
+    levels = _signed_levels(doc, private_key_bytes, public_key)
+    chunk_size = doc["chunk_size"]
+    first, last = offset // chunk_size, (offset + length - 1) // chunk_size
+
+    range_leaves = hash_chunks(path, chunk_size, first, last)
+    proof = range_proof(levels, first, last)
+    return root_from_range(range_leaves, proof) == levels[-1][0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Підпис файлу деревом Меркла")
+    parser.add_argument("command", choices=["sign", "verify", "verify-range"])
+    parser.add_argument("path", help="файл")
+    parser.add_argument("-s", "--signature", required=True, help="документ підпису (JSON)")
+    parser.add_argument("--chunk-size", type=int, default=MERKLE_CHUNK_SIZE)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--length", type=int)
+    parser.add_argument("--workers", type=int, help="кількість потоків")
+    add_key_arguments(parser)
+    args = parser.parse_args(argv)
+
+    priv, pub = keys_from_args(args)
+
+    if args.command == "sign":
+        doc = sign_file_merkle(args.path, priv, args.chunk_size, args.workers)
+        with open(args.signature, "w", encoding="utf-8") as f:
+            json.dump(doc, f, indent=1)
+        print(f"Успішно підписано. Частин: {len(doc['leaves'])}, підпис кореня (hex): {doc['signature']}")
+        return
+
+    with open(args.signature, encoding="utf-8") as f:
+        doc = json.load(f)
+    try:
+        if args.command == "verify":
+            tampered = verify_file_merkle(args.path, doc, priv, pub, args.workers)
+            if tampered:
+                print("ПІДПИС НЕВАЛІДНИЙ / ПІДРОБКА. Змінено частини:", ", ".join(map(str, tampered)))
+                raise SystemExit(1)
+            print("ПІДПИС ВІРНИЙ")
+        else:
+            length = args.length if args.length is not None else doc["size"] - args.offset
+            ok = verify_range_merkle(args.path, doc, args.offset, length, priv, pub)
+            print("ДІАПАЗОН ВІРНИЙ" if ok else "ДІАПАЗОН ЗМІНЕНО")
+            if not ok:
+                raise SystemExit(1)
+    except ValueError as e:
+        raise SystemExit(f"Помилка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import argparse
+import asyncio
+import json
+import os
+import struct
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from kdf_backends import HkdfKdf, calibrate
+from lab_5_kozan import MessageEncryptor
+
+# Кадр протоколу: 4 байти довжини (big-endian) + JSON у UTF-8
+_LENGTH = struct.Struct('>I')
+MAX_FRAME_SIZE = 1 << 20
+
+# Обов'язкові текстові поля кожної операції
+REQUEST_FIELDS = {
+    "encrypt": ("text", "passphrase"),
+    "decrypt": ("token", "passphrase"),
+    "stats": (),
+}
+
+
+async def read_body(reader: asyncio.StreamReader):
+    """Читає тіло одного кадру (bytes). Повертає None, якщо з'єднання закрито."""
+    try:
+        header = await reader.readexactly(_LENGTH.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Запит завеликий: {length} байтів")
+    return await reader.readexactly(length)
+
+
+async def read_frame(reader: asyncio.StreamReader):
+    """Читає один кадр. Повертає розібраний JSON або None, якщо з'єднання закрито."""
+    body = await read_body(reader)
+    return None if body is None else json.loads(body)
+
+
+async def write_frame(writer: asyncio.StreamWriter, message: dict):
+    """Записує кадр і чекає, поки буфер сокета звільниться (зворотний тиск)."""
+    body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    writer.write(_LENGTH.pack(len(body)) + body)
+    await writer.drain()
+
+
+class EncryptionService:
+    """
+    Асинхронний сервер шифрування/дешифрування повідомлень на локальному сокеті.
+
+    Запити (JSON у кадрах з префіксом довжини):
+        {"op": "encrypt", "text": "...", "passphrase": "..."}
+        {"op": "decrypt", "token": "...", "passphrase": "..."}
+        {"op": "stats"}
+    Відповідь: {"ok": true, "result": ...} або {"ok": false, "error": "..."}.
+
+    Повільна генерація ключа (KDF) та Fernet виконуються в обмеженому пулі потоків,
+    тому цикл подій не блокується. Кількість одночасних операцій обмежена семафором:
+    коли пул зайнятий, сервер перестає читати нові запити (зворотний тиск),
+    а клієнти чекають у черзі TCP, замість того щоб переповнювати пам'ять.
+    """
+
+    def __init__(self, workers: int = 4, max_in_flight: int = 64, max_connections: int = 256,
+                 encryptor: MessageEncryptor = None):
+        self.encryptor = encryptor if encryptor is not None else MessageEncryptor()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.in_flight = asyncio.Semaphore(max_in_flight)
+        self.connections = asyncio.Semaphore(max_connections)
+        # Лічильники
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.active = 0
+        self.latencies = deque(maxlen=10000)  # останні затримки, мс
+
+    @staticmethod
+    def validate_request(request) -> str:
+        """Перевіряє структуру запиту до виконання. Повертає операцію або кидає ValueError."""
+        if not isinstance(request, dict):
+            raise ValueError("Запит має бути JSON-об'єктом.")
+        op = request.get("op")
+        if op not in REQUEST_FIELDS:
+            raise ValueError(f"Невідома операція: {op}")
+        for field in REQUEST_FIELDS[op]:
+            if not isinstance(request.get(field), str):
+                raise ValueError(f"Поле {field} має бути рядком.")
+        return op
+
+    def _run(self, op: str, request: dict):
+        """Синхронна частина запиту (виконується в пулі потоків)."""
+        if op == "encrypt":
+            return self.encryptor.encrypt(request["text"], request["passphrase"]).decode('ascii')
+        if op == "decrypt":
+            result = self.encryptor.decrypt(request["token"].encode('ascii'), request["passphrase"])
+            if result is None:
+                raise ValueError("Невірний пароль або дані пошкоджено.")
+            return result
+        raise ValueError(f"Невідома операція: {op}")
+
+    def stats(self) -> dict:
+        """Лічильники затримки та пропускної здатності."""
+        ordered = sorted(self.latencies)
+
+        def percentile(p):
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+        uptime = time.monotonic() - self.started
+        stats = {
+            "requests": self.requests,
+            "errors": self.errors,
+            "active": self.active,
+            "uptime_s": round(uptime, 3),
+            "throughput_rps": round(self.requests / uptime, 2) if uptime else 0.0,
+            "latency_p50_ms": round(percentile(0.50), 3),
+            "latency_p99_ms": round(percentile(0.99), 3),
+        }
+        if self.encryptor.key_cache is not None:
+            stats["key_cache"] = self.encryptor.key_cache.stats()
+        return stats
+
+    async def handle_request(self, request) -> dict:
+        try:
+            op = self.validate_request(request)
+        except ValueError as e:
+            self.errors += 1
+            self.requests += 1
+            return {"ok": False, "error": str(e)}
+        if op == "stats":
+            return {"ok": True, "result": self.stats()}
+
+        start = time.perf_counter()
+        async with self.in_flight:
+            self.active += 1
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.executor, self._run, op, request)
+                response = {"ok": True, "result": result}
+            except (KeyError, ValueError, TypeError) as e:
+                self.errors += 1
+                response = {"ok": False, "error": str(e)}
+            finally:
+                self.active -= 1
+        self.requests += 1
+        self.latencies.append((time.perf_counter() - start) * 1000)
+        return response
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async with self.connections:
+            try:
+                while True:
+                    try:
+                        body = await read_body(reader)
+                        if body is None:
+                            break
+                        # JSON null, масив чи число - теж запит, на нього відповідає handle_request
+                        request = json.loads(body)
+                    except (ValueError, asyncio.IncompleteReadError) as e:
+                        self.errors += 1
+                        await write_frame(writer, {"ok": False, "error": str(e)})
+                        break
+                    await write_frame(writer, await self.handle_request(request))
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, path: str = None):
+        if path:
+            server = await asyncio.start_unix_server(self.handle_connection, path=path)
+            print(f"[+] Сервер слухає unix-сокет {path}")
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+            print(f"[+] Сервер слухає {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Асинхронний сервер шифрування повідомлень")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="шлях до unix-сокета замість TCP")
+    parser.add_argument("--workers", type=int, default=4, help="потоків для KDF та Fernet")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="одночасних операцій")
+    parser.add_argument("--max-connections", type=int, default=256)
+    parser.add_argument("--kdf", choices=["pbkdf2", "scrypt", "hkdf"],
+                        help="KDF для нових шифрограм (за замовчуванням PBKDF2 з 600 000 ітерацій)")
+    parser.add_argument("--target-ms", type=float, default=250,
+                        help="цільова затримка KDF для калібрування pbkdf2/scrypt")
+    parser.add_argument("--max-kdf-iterations", type=int,
+                        help="найбільша кількість ітерацій PBKDF2 у шифрограмах для розшифрування")
+    parser.add_argument("--max-kdf-memory-mb", type=int,
+                        help="найбільша вартість scrypt (128*n*r*p) у шифрограмах для розшифрування, МіБ")
+    args = parser.parse_args(argv)
+
+    # Головний ключ HKDF (hex) - з середовища, щоб не потрапляв в історію команд
+    master_key = os.environ.get("LAB5_MASTER_KEY")
+    master_key = bytes.fromhex(master_key) if master_key else None
+    if args.kdf == "hkdf":
+        if master_key is None:
+            parser.error("для --kdf hkdf задайте LAB5_MASTER_KEY (щонайменше 16 байтів у hex)")
+        kdf = HkdfKdf(master_key)
+    elif args.kdf:
+        kdf = calibrate(args.kdf, args.target_ms)
+    else:
+        kdf = None
+    max_memory = args.max_kdf_memory_mb << 20 if args.max_kdf_memory_mb else None
+    encryptor = MessageEncryptor(kdf=kdf, master_key=master_key,
+                                 max_kdf_iterations=args.max_kdf_iterations, max_kdf_memory=max_memory)
+    print(f"[+] KDF: {encryptor.kdf.spec}")
+
+    service = EncryptionService(args.workers, args.max_in_flight, args.max_connections, encryptor)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\nСервер зупинено.")
+
+
+if __name__ == "__main__":
+    main()
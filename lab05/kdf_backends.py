@@ -0,0 +1,238 @@
+"""
+Функції формування ключа (KDF) для шифрограм lab_5_kozan.py.
+
+Три варіанти зі спільним інтерфейсом KdfBackend: PBKDF2 (ітерації),
+scrypt (n, r, p; додатково навантажує пам'ять) та HKDF від головного ключа
+сервісу. Параметри кожного записуються в шифрограму як текстова специфікація
+і відновлюються parse_spec з обмеженням вартості. calibrate підбирає параметри
+під цільову затримку на поточному комп'ютері.
+
+Приклади:
+    python kdf_backends.py --target-ms 250
+    python kdf_backends.py --target-ms 100 --rounds 5
+"""
+import abc
+import argparse
+import hashlib
+import time
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+KEY_LENGTH = 32
+
+
+class KdfBackend(abc.ABC):
+    """
+    Базовий клас функції формування ключа (KDF).
+
+    Кожен варіант має текстову специфікацію (spec), яка записується в шифрограму,
+    тому розшифрування на іншому комп'ютері використовує ті самі параметри,
+    навіть якщо там калібрування дало б інші.
+    """
+
+    name = ""
+
+    @property
+    @abc.abstractmethod
+    def spec(self) -> str:
+        """Рядок параметрів для шифрограми, наприклад 'pbkdf2-sha256-600000'."""
+
+    @property
+    def cache_params(self) -> str:
+        """Рядок для кешу ключів (може містити більше, ніж spec)."""
+        return self.spec
+
+    @abc.abstractmethod
+    def derive(self, passphrase: str, salt: bytes) -> bytes:
+        """Повертає KEY_LENGTH байтів ключа."""
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.spec}>"
+
+
+class Pbkdf2Kdf(KdfBackend):
+    """PBKDF2-HMAC-SHA256: вартість задається кількістю ітерацій."""
+
+    name = "pbkdf2-sha256"
+    DEFAULT_ITERATIONS = 600000
+    # Захист від шифрограм з навмисно завеликою вартістю (удвічі-втричі більше за DEFAULT_ITERATIONS)
+    MAX_ITERATIONS = 2_000_000
+
+    def __init__(self, iterations: int = DEFAULT_ITERATIONS):
+        if not 0 < iterations <= self.MAX_ITERATIONS:
+            raise ValueError(f"Недопустима кількість ітерацій: {iterations}")
+        self.iterations = iterations
+
+    @property
+    def spec(self) -> str:
+        return f"{self.name}-{self.iterations}"
+
+    def derive(self, passphrase: str, salt: bytes) -> bytes:
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=KEY_LENGTH, salt=salt, iterations=self.iterations)
+        return kdf.derive(passphrase.encode('utf-8'))
+
+
+class ScryptKdf(KdfBackend):
+    """
+    Scrypt: вартість задається параметром n (степінь двійки), а також r та p.
+    Крім часу CPU вимагає n * r * 128 байтів пам'яті, що ускладнює перебір на GPU.
+    Оцінка вартості (пам'ять і час) - 128 * n * r * p байтів, вона обмежена MAX_MEMORY.
+    """
+
+    name = "scrypt"
+    MAX_N = 1 << 20
+    MAX_R = 32
+    MAX_P = 16
+    MAX_MEMORY = 128 << 20  # 128 МіБ: scrypt-131072-8-1 або scrypt-16384-8-8
+
+    def __init__(self, n: int = 1 << 14, r: int = 8, p: int = 1):
+        if n < 2 or n & (n - 1) or n > self.MAX_N:
+            raise ValueError(f"Параметр n має бути степенем двійки не більше {self.MAX_N}: {n}")
+        if not 0 < r <= self.MAX_R or not 0 < p <= self.MAX_P:
+            raise ValueError(f"Недопустимі параметри scrypt: r={r}, p={p}")
+        if self.cost(n, r, p) > self.MAX_MEMORY:
+            raise ValueError(f"Параметри scrypt потребують понад {self.MAX_MEMORY >> 20} МіБ: n={n}, r={r}, p={p}")
+        self.n, self.r, self.p = n, r, p
+
+    @staticmethod
+    def cost(n: int, r: int, p: int) -> int:
+        """Вартість параметрів scrypt у байтах пам'яті (128 * n * r * p)."""
+        return 128 * n * r * p
+
+    @property
+    def spec(self) -> str:
+        return f"{self.name}-{self.n}-{self.r}-{self.p}"
+
+    def derive(self, passphrase: str, salt: bytes) -> bytes:
+        kdf = Scrypt(salt=salt, length=KEY_LENGTH, n=self.n, r=self.r, p=self.p)
+        return kdf.derive(passphrase.encode('utf-8'))
+
+
+class HkdfKdf(KdfBackend):
+    """
+    HKDF-SHA256 від головного ключа сервісу (для великих обсягів повідомлень).
+
+    Пароль тут - лише контекст (наприклад, ідентифікатор отримувача), а вся
+    стійкість забезпечується випадковим головним ключем master_key, тому
+    формування ключа займає мікросекунди. Головний ключ не записується
+    в шифрограму: для розшифрування потрібен той самий master_key.
+    """
+
+    name = "hkdf-sha256"
+
+    def __init__(self, master_key: bytes):
+        if not master_key or len(master_key) < 16:
+            raise ValueError("Головний ключ HKDF має містити щонайменше 16 байтів.")
+        self.master_key = master_key
+
+    @property
+    def spec(self) -> str:
+        return self.name
+
+    @property
+    def cache_params(self) -> str:
+        # Різні головні ключі не повинні змішуватися в одному кеші
+        return f"{self.name}:{hashlib.sha256(self.master_key).hexdigest()[:16]}"
+
+    def derive(self, passphrase: str, salt: bytes) -> bytes:
+        kdf = HKDF(algorithm=hashes.SHA256(), length=KEY_LENGTH, salt=salt, info=passphrase.encode('utf-8'))
+        return kdf.derive(self.master_key)
+
+
+def parse_spec(spec: str, master_key: bytes = None, max_iterations: int = None,
+               max_memory: int = None) -> KdfBackend:
+    """
+    Відновлює KDF зі специфікації, записаної в шифрограмі.
+    max_iterations та max_memory - стеля вартості, заданої викликачем
+    (за замовчуванням Pbkdf2Kdf.MAX_ITERATIONS та ScryptKdf.MAX_MEMORY):
+    сильніші параметри відхиляються до будь-якого формування ключа.
+    """
+    parts = spec.split('-')
+    try:
+        if spec.startswith(Pbkdf2Kdf.name + '-') and len(parts) == 3:
+            iterations = int(parts[2])
+            if max_iterations is not None and iterations > max_iterations:
+                raise ValueError(f"понад {max_iterations} ітерацій")
+            return Pbkdf2Kdf(iterations)
+        if parts[0] == ScryptKdf.name and len(parts) == 4:
+            n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+            if max_memory is not None and ScryptKdf.cost(n, r, p) > max_memory:
+                raise ValueError(f"понад {max_memory} байтів пам'яті")
+            return ScryptKdf(n, r, p)
+    except ValueError as e:
+        raise ValueError(f"Непідтримувані параметри KDF: {spec} ({e})") from None
+    if spec == HkdfKdf.name:
+        if master_key is None:
+            raise ValueError("Для розшифрування потрібен головний ключ HKDF.")
+        return HkdfKdf(master_key)
+    raise ValueError(f"Непідтримувані параметри KDF: {spec}")
+
+
+def measure_ms(backend: KdfBackend, rounds: int = 3) -> float:
+    """Середній час одного формування ключа, мс."""
+    salt = b'\x00' * 16
+    start = time.perf_counter()
+    for _ in range(rounds):
+        backend.derive("calibration", salt)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def calibrate_pbkdf2(target_ms: float, min_iterations: int = 10_000) -> Pbkdf2Kdf:
+    """
+    Підбирає кількість ітерацій PBKDF2 під цільову затримку на цьому комп'ютері.
+    Вартість PBKDF2 лінійна за ітераціями, тому достатньо одного пробного заміру.
+    """
+    probe = 50_000
+    ms = measure_ms(Pbkdf2Kdf(probe), rounds=2)
+    iterations = int(probe * target_ms / ms) if ms else Pbkdf2Kdf.MAX_ITERATIONS
+    # Округлення до тисяч, щоб параметри в шифрограмах виглядали охайно
+    iterations = max(min_iterations, min(Pbkdf2Kdf.MAX_ITERATIONS, iterations // 1000 * 1000))
+    return Pbkdf2Kdf(iterations)
+
+
+def calibrate_scrypt(target_ms: float, r: int = 8, p: int = 1, min_n: int = 1 << 14) -> ScryptKdf:
+    """
+    Підбирає n для scrypt: подвоює n, доки наступне подвоєння не перевищить цільову затримку
+    або ScryptKdf.MAX_MEMORY.
+    """
+    n = min_n
+    ms = measure_ms(ScryptKdf(n, r, p), rounds=1)
+    while n < ScryptKdf.MAX_N and ScryptKdf.cost(n * 2, r, p) <= ScryptKdf.MAX_MEMORY and ms * 2 <= target_ms:
+        n *= 2
+        ms = measure_ms(ScryptKdf(n, r, p), rounds=1)
+    return ScryptKdf(n, r, p)
+
+
+def calibrate(kind: str, target_ms: float) -> KdfBackend:
+    """Калібрований KDF заданого типу ('pbkdf2' або 'scrypt')."""
+    if kind == "pbkdf2":
+        return calibrate_pbkdf2(target_ms)
+    if kind == "scrypt":
+        return calibrate_scrypt(target_ms)
+    raise ValueError(f"Калібрування недоступне для: {kind}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Калібрування та порівняння KDF")
+    parser.add_argument("--target-ms", type=float, default=250, help="цільова затримка формування ключа")
+    parser.add_argument("--rounds", type=int, default=3, help="замірів на кожен KDF")
+    args = parser.parse_args(argv)
+
+    backends = [
+        Pbkdf2Kdf(),
+        calibrate_pbkdf2(args.target_ms),
+        calibrate_scrypt(args.target_ms),
+        HkdfKdf(b'\x00' * 32),
+    ]
+    print(f"{'KDF':<28} | {'мс/ключ':>9} | {'ключів/с':>9}")
+    print("-" * 52)
+    for backend in backends:
+        ms = measure_ms(backend, args.rounds)
+        print(f"{backend.spec:<28} | {ms:>9.3f} | {1000 / ms if ms else float('inf'):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
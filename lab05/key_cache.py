@@ -0,0 +1,108 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class DerivedKeyCache:
+    """
+    Кеш похідних ключів (результатів KDF) у пам'яті процесу.
+
+    PBKDF2 з 600 000 ітерацій займає сотні мілісекунд, тому повторне
+    шифрування/дешифрування з тим самим паролем варто обслуговувати з кешу.
+
+    - ключ запису - SHA-256 від (сіль, параметри KDF, пароль), сам пароль не зберігається;
+    - розмір обмежений (LRU: при переповненні витісняється найдавніше використаний запис);
+    - кожен запис має час життя (TTL), після якого вважається простроченим;
+    - при витісненні байти ключа перезаписуються нулями (наскільки це можливо в Python:
+      копії, вже передані назовні як bytes, очистити неможливо).
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # digest -> (bytearray ключа, час створення)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _cache_key(passphrase: str, salt: bytes, params: str = "") -> bytes:
+        """Відбиток запису: пароль у відкритому вигляді в кеші не зберігається."""
+        h = hashlib.sha256()
+        for part in (salt, params.encode('utf-8'), passphrase.encode('utf-8')):
+            # Довжина перед кожною частиною - щоб межі частин не можна було зсунути
+            h.update(len(part).to_bytes(4, 'big'))
+            h.update(part)
+        return h.digest()
+
+    @staticmethod
+    def _wipe(buf: bytearray):
+        """Перезаписує байти ключа нулями."""
+        for i in range(len(buf)):
+            buf[i] = 0
+
+    def _drop(self, digest: bytes):
+        buf, _ = self._entries.pop(digest)
+        self._wipe(buf)
+
+    def lookup(self, passphrase: str, salt: bytes, params: str = ""):
+        """Повертає ключ з кешу або None (прострочені записи видаляються)."""
+        digest = self._cache_key(passphrase, salt, params)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                buf, created = entry
+                if now - created <= self.ttl:
+                    self._entries.move_to_end(digest)
+                    self.hits += 1
+                    return bytes(buf)
+                self._drop(digest)
+                self.expirations += 1
+            self.misses += 1
+        return None
+
+    def store(self, passphrase: str, salt: bytes, key: bytes, params: str = ""):
+        """Зберігає обчислений ключ, витісняючи найдавніші записи при переповненні."""
+        digest = self._cache_key(passphrase, salt, params)
+        with self._lock:
+            if digest in self._entries:
+                self._drop(digest)
+            self._entries[digest] = (bytearray(key), time.monotonic())
+            while len(self._entries) > self.max_size:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_derive(self, passphrase: str, salt: bytes, derive, params: str = "") -> bytes:
+        """
+        Повертає ключ з кешу або обчислює його викликом derive() і зберігає.
+        params - рядок з параметрами KDF (щоб різні налаштування не змішувались).
+        """
+        key = self.lookup(passphrase, salt, params)
+        if key is None:
+            # KDF виконується поза блокуванням, щоб не зупиняти інші потоки
+            key = derive()
+            self.store(passphrase, salt, key, params)
+        return key
+
+    def clear(self):
+        """Очищує кеш, затираючи всі ключі."""
+        with self._lock:
+            for digest in list(self._entries):
+                self._drop(digest)
+
+    def stats(self) -> dict:
+        """Метрики кешу: влучання, промахи, витіснення, частка влучань."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
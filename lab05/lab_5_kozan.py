@@ -1,62 +1,205 @@
 import base64
 import getpass
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 
+from kdf_backends import KdfBackend, Pbkdf2Kdf, HkdfKdf, parse_spec
+from key_cache import DerivedKeyCache
+
+
+def derive_fernet_key(passphrase: str, salt: bytes, kdf: KdfBackend) -> bytes:
+    """
+    Генерація ключа Fernet з пароля: KDF -> 32 байти -> URL-safe base64.
+    Функція рівня модуля, щоб її можна було виконувати в окремих процесах.
+    """
+    # Кодування ключа у формат URL-safe base64, який вимагає Fernet
+    return base64.urlsafe_b64encode(kdf.derive(passphrase, salt))
+
+
+def _derive_job(job: tuple) -> bytes:
+    return derive_fernet_key(*job)
+
+
 class MessageEncryptor:
     """
     Клас для обробки шифрування та дешифрування повідомлень
     з використанням симетричного алгоритму Fernet (AES).
+
+    Формат шифрограми (версія 2):
+        ks2.<сіль у base64>.<параметри KDF>.<токен Fernet>
+    Кожне повідомлення отримує власну випадкову сіль, а параметри KDF
+    (pbkdf2-sha256-<ітерації>, scrypt-<n>-<r>-<p> або hkdf-sha256)
+    записані в самій шифрограмі, тому розшифрування не залежить від налаштувань
+    отримувача. Старі токени Fernet (без префікса) розшифровуються
+    зі статичною сіллю, як і раніше.
     """
     
     # Статична сіль для навчальних цілей. 
-    # У реальних системах сіль має бути унікальною для кожного користувача.
+    # Використовується лише для розшифрування старих токенів без префікса ks2.
     STATIC_SALT = b'lab_assignment_static_salt_2025'
+    ITERATIONS = Pbkdf2Kdf.DEFAULT_ITERATIONS # Збільшено кількість ітерацій для надійності
+    SALT_SIZE = 16
+    TOKEN_PREFIX = b'ks2.'
 
-    def __init__(self):
+    def __init__(self, use_key_cache: bool = True, key_cache: DerivedKeyCache = None,
+                 kdf: KdfBackend = None, master_key: bytes = None,
+                 max_kdf_iterations: int = None, max_kdf_memory: int = None):
+        """
+        use_key_cache=False вимикає кешування похідних ключів
+        (кожна операція знову виконує KDF).
+        key_cache - власний екземпляр кешу (наприклад, спільний для кількох об'єктів).
+        kdf - KDF для нових шифрограм (за замовчуванням PBKDF2 з ITERATIONS ітераціями;
+        див. kdf_backends.calibrate для підбору під цільову затримку).
+        master_key - головний ключ сервісу: без kdf вмикає HKDF, а також потрібен
+        для розшифрування шифрограм hkdf-sha256.
+        max_kdf_iterations, max_kdf_memory - стеля вартості KDF для чужих шифрограм
+        (див. kdf_backends.parse_spec); сильніші параметри відхиляються без формування ключа.
+        """
         self.backend = default_backend()
+        if kdf is None:
+            kdf = HkdfKdf(master_key) if master_key is not None else Pbkdf2Kdf(self.ITERATIONS)
+        self.kdf = kdf
+        self.master_key = master_key if master_key is not None else getattr(kdf, 'master_key', None)
+        self.max_kdf_iterations = max_kdf_iterations
+        self.max_kdf_memory = max_kdf_memory
+        if use_key_cache:
+            self.key_cache = key_cache if key_cache is not None else DerivedKeyCache()
+        else:
+            self.key_cache = None
 
-    def _derive_key(self, passphrase: str) -> bytes:
+    def _parse_kdf_params(self, params: str) -> KdfBackend:
+        """Відновлює KDF з рядка параметрів шифрограми."""
+        if params == self.kdf.spec:
+            return self.kdf
+        return parse_spec(params, self.master_key, self.max_kdf_iterations, self.max_kdf_memory)
+
+    def _derive_key(self, passphrase: str, salt: bytes = None, kdf: KdfBackend = None) -> bytes:
         """
         Внутрішній метод генерації криптографічного ключа з пароля.
-        Використовує алгоритм PBKDF2HMAC для перетворення рядка в 32-байтний ключ.
+        Якщо кеш увімкнено, повторні виклики з тим самим паролем і сіллю не запускають KDF.
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.STATIC_SALT,
-            iterations=600000, # Збільшено кількість ітерацій для надійності
-            backend=self.backend
+        salt = self.STATIC_SALT if salt is None else salt
+        kdf = self.kdf if kdf is None else kdf
+        if self.key_cache is None:
+            return derive_fernet_key(passphrase, salt, kdf)
+        return self.key_cache.get_or_derive(
+            passphrase, salt,
+            lambda: derive_fernet_key(passphrase, salt, kdf),
+            params=kdf.cache_params
         )
-        # Кодування ключа у формат URL-safe base64, який вимагає Fernet
-        return base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
 
-    def encrypt(self, plain_text: str, passphrase: str) -> bytes:
+    def _parse_token(self, cipher_data: bytes) -> tuple:
+        """
+        Розбирає шифрограму (bytes або str). Повертає (сіль, KDF, токен Fernet).
+        Для старих токенів - статична сіль та PBKDF2 зі стандартною кількістю ітерацій.
+        """
+        if isinstance(cipher_data, str):
+            cipher_data = cipher_data.encode('ascii')
+        if not cipher_data.startswith(self.TOKEN_PREFIX):
+            return self.STATIC_SALT, Pbkdf2Kdf(self.ITERATIONS), cipher_data
+        parts = cipher_data[len(self.TOKEN_PREFIX):].split(b'.', 2)
+        if len(parts) != 3:
+            raise ValueError("Пошкоджена шифрограма.")
+        salt_b64, params, token = parts
+        salt = base64.urlsafe_b64decode(salt_b64)
+        return salt, self._parse_kdf_params(params.decode('ascii')), token
+
+    def encrypt(self, plain_text: str, passphrase: str, salt: bytes = None) -> bytes:
         """
         Шифрує текст, використовуючи ключ, згенерований з пароля.
+        salt - сіль (за замовчуванням нова випадкова для кожного повідомлення).
+        Спільна сіль для серії повідомлень дозволяє decrypt_many обчислити ключ один раз.
         """
-        key = self._derive_key(passphrase)
+        salt = os.urandom(self.SALT_SIZE) if salt is None else salt
+        key = self._derive_key(passphrase, salt, self.kdf)
         cipher_suite = Fernet(key)
         
         encrypted_bytes = cipher_suite.encrypt(plain_text.encode('utf-8'))
-        return encrypted_bytes
+        return b'.'.join([
+            self.TOKEN_PREFIX + base64.urlsafe_b64encode(salt),
+            self.kdf.spec.encode('ascii'),
+            encrypted_bytes,
+        ])
 
-    def decrypt(self, cipher_data: bytes, passphrase: str) -> str:
+    def decrypt(self, cipher_data, passphrase: str) -> str:
         """
-        Розшифровує дані, використовуючи ключ, згенерований з пароля.
+        Розшифровує дані (bytes або str), використовуючи ключ, згенерований з пароля.
         """
-        key = self._derive_key(passphrase)
+        try:
+            salt, kdf, token = self._parse_token(cipher_data)
+        except (ValueError, TypeError):
+            return None
+        key = self._derive_key(passphrase, salt, kdf)
         cipher_suite = Fernet(key)
         
         try:
-            decrypted_bytes = cipher_suite.decrypt(cipher_data)
+            decrypted_bytes = cipher_suite.decrypt(token)
             return decrypted_bytes.decode('utf-8')
         except InvalidToken:
             return None
 
+    def decrypt_many(self, tokens: list, passphrases, workers: int = None) -> list:
+        """
+        Пакетне розшифрування.
+        passphrases - один пароль або список паролів-кандидатів (для скриньок зі змішаними ключами).
+        Шифрограми групуються за (сіль, параметри KDF), і для кожної групи
+        ключ обчислюється рівно один раз для кожного пароля.
+        workers > 1 - різні ключі обчислюються паралельно в ProcessPoolExecutor.
+        Повертає список текстів (None для шифрограм, які не вдалося розшифрувати).
+        """
+        if isinstance(passphrases, str):
+            passphrases = [passphrases]
+
+        groups = {}
+        kdfs = {}
+        results = [None] * len(tokens)
+        for i, cipher_data in enumerate(tokens):
+            try:
+                salt, kdf, token = self._parse_token(cipher_data)
+            except (ValueError, TypeError):
+                continue
+            kdfs.setdefault(kdf.cache_params, kdf)
+            groups.setdefault((salt, kdf.cache_params), []).append((i, token))
+
+        # Ключі, яких немає в кеші, обчислюються один раз (за потреби - паралельно)
+        keys = {}
+        missing = []
+        for salt, params in groups:
+            for pwd in passphrases:
+                cached = None
+                if self.key_cache is not None:
+                    cached = self.key_cache.lookup(pwd, salt, params)
+                if cached is None:
+                    missing.append((pwd, salt, params))
+                else:
+                    keys[(pwd, salt, params)] = cached
+
+        jobs = [(pwd, salt, kdfs[params]) for pwd, salt, params in missing]
+        if workers and workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                derived = list(pool.map(_derive_job, jobs))
+        else:
+            derived = [_derive_job(job) for job in jobs]
+        for job, key in zip(missing, derived):
+            keys[job] = key
+            if self.key_cache is not None:
+                pwd, salt, params = job
+                self.key_cache.store(pwd, salt, key, params)
+
+        for (salt, params), items in groups.items():
+            suites = [Fernet(keys[(pwd, salt, params)]) for pwd in passphrases]
+            for i, token in items:
+                for suite in suites:
+                    try:
+                        results[i] = suite.decrypt(token).decode('utf-8')
+                        break
+                    except InvalidToken:
+                        continue
+        return results
+
 def run_application():
     encryptor = MessageEncryptor()
 
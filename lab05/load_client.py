@@ -0,0 +1,99 @@
+"""
+Генератор навантаження для async_service.py.
+
+Запускає N одночасних клієнтів, кожен з яких надсилає M запитів
+(шифрування, а потім дешифрування отриманого токена), і виводить
+затримки p50/p99 та пропускну здатність.
+
+Приклади:
+    python async_service.py --workers 4 &
+    python load_client.py --clients 32 --requests 50
+    python load_client.py --clients 8 --requests 10 --unique-passphrases
+"""
+import argparse
+import asyncio
+import time
+
+from async_service import read_frame, write_frame
+
+
+async def _call(reader, writer, request: dict, latencies: list):
+    """Один запит-відповідь із вимірюванням затримки."""
+    start = time.perf_counter()
+    await write_frame(writer, request)
+    response = await read_frame(reader)
+    latencies.append((time.perf_counter() - start) * 1000)
+    return response
+
+
+async def _client(client_id: int, args, latencies: list, errors: list):
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        for i in range(args.requests):
+            # Унікальні паролі примушують сервер щоразу виконувати KDF (без кешу)
+            passphrase = f"pwd-{client_id}-{i}" if args.unique_passphrases else "pwd"
+            encrypt = {"op": "encrypt", "text": f"Повідомлення {client_id}/{i}", "passphrase": passphrase}
+            response = await _call(reader, writer, encrypt, latencies)
+            if not response or not response.get("ok"):
+                errors.append(response)
+                continue
+
+            decrypt = {"op": "decrypt", "token": response["result"], "passphrase": passphrase}
+            response = await _call(reader, writer, decrypt, latencies)
+            if not response or not response.get("ok"):
+                errors.append(response)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _stats(args) -> dict:
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    await write_frame(writer, {"op": "stats"})
+    response = await read_frame(reader)
+    writer.close()
+    await writer.wait_closed()
+    return response["result"]
+
+
+def percentile(ordered: list, p: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run(args):
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(i, args, latencies, errors) for i in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    print(f"Клієнтів: {args.clients}, запитів: {len(latencies)}, помилок: {len(errors)}")
+    print(f"Час: {elapsed:.3f} c, пропускна здатність: {len(latencies) / elapsed:.1f} запитів/с")
+    print(f"Затримка, мс: p50 = {percentile(ordered, 0.50):.2f}, p99 = {percentile(ordered, 0.99):.2f}, "
+          f"макс = {ordered[-1] if ordered else 0:.2f}")
+    print("Лічильники сервера:", await _stats(args))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Навантажувальний тест сервера шифрування")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="шлях до unix-сокета замість TCP")
+    parser.add_argument("--clients", type=int, default=16, help="одночасних клієнтів")
+    parser.add_argument("--requests", type=int, default=20, help="пар encrypt/decrypt на клієнта")
+    parser.add_argument("--unique-passphrases", action="store_true",
+                        help="окремий пароль для кожного запиту (без влучань у кеш ключів)")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import getpass
+import os
+import struct
+import sys
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from kdf_backends import Pbkdf2Kdf
+from lab_5_kozan import MessageEncryptor
+
+
+class StreamEncryptor:
+    """
+    Потокове автентифіковане шифрування файлів (AES-256-GCM по сегментах).
+
+    Fernet потребує всього тексту в пам'яті та збільшує його на третину (base64),
+    тому для великих файлів дані діляться на сегменти фіксованого розміру,
+    кожен з яких шифрується окремо. Пам'ять не залежить від розміру файлу.
+
+    Формат контейнера (усі числа big-endian):
+        MAGIC         4 байти  b'KSE1'
+        SEGMENT_SIZE  4 байти  розмір сегмента відкритого тексту
+        ITERATIONS    4 байти  кількість ітерацій PBKDF2
+        SALT         16 байтів випадкова сіль для ключа
+        NONCE_PREFIX  7 байтів випадковий префікс nonce
+        далі сегменти: шифротекст + тег GCM (16 байтів)
+
+    Nonce сегмента = NONCE_PREFIX || номер сегмента (4 байти) || прапорець останнього (1 байт),
+    а заголовок подається як додаткові автентифіковані дані. Тому перестановка,
+    видалення чи дописування сегментів, обрізання файлу або зміна заголовка
+    виявляються на першому ж некоректному сегменті.
+    """
+
+    MAGIC = b'KSE1'
+    DEFAULT_SEGMENT_SIZE = 256 * 1024
+    MAX_SEGMENT_SIZE = 64 * 1024 * 1024
+    TAG_SIZE = 16
+    _HEADER = struct.Struct('>4sII16s7s')
+    HEADER_SIZE = _HEADER.size
+
+    def __init__(self, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 iterations: int = MessageEncryptor.ITERATIONS):
+        if not 0 < segment_size <= self.MAX_SEGMENT_SIZE:
+            raise ValueError(f"Помилка: Розмір сегмента має бути від 1 до {self.MAX_SEGMENT_SIZE} байтів.")
+        self.kdf = self._kdf(iterations)
+        self.segment_size = segment_size
+        self.iterations = iterations
+
+    @staticmethod
+    def _kdf(iterations: int) -> Pbkdf2Kdf:
+        """
+        PBKDF2-SHA256 з kdf_backends (32-байтний ключ AES-256, сіль випадкова для кожного файлу).
+        Кількість ітерацій обмежена Pbkdf2Kdf.MAX_ITERATIONS (захист від завеликої вартості).
+        """
+        try:
+            return Pbkdf2Kdf(iterations)
+        except ValueError:
+            raise ValueError(f"Помилка: Кількість ітерацій PBKDF2 має бути від 1 до {Pbkdf2Kdf.MAX_ITERATIONS}.") from None
+
+    @staticmethod
+    def _nonce(prefix: bytes, index: int, last: bool) -> bytes:
+        return prefix + struct.pack('>IB', index, 1 if last else 0)
+
+    @staticmethod
+    def _read_exact(src, size: int) -> bytes:
+        """Читає рівно size байтів (або менше лише в кінці потоку)."""
+        parts = []
+        while size:
+            part = src.read(size)
+            if not part:
+                break
+            parts.append(part)
+            size -= len(part)
+        return b''.join(parts)
+
+    def _segments(self, src, size: int):
+        """Генератор (сегмент, чи останній) з попереднім читанням на один сегмент уперед."""
+        current = self._read_exact(src, size)
+        while True:
+            following = self._read_exact(src, size)
+            last = not following
+            yield current, last
+            if last:
+                return
+            current = following
+
+    def encrypt_stream(self, src, dst, passphrase: str) -> int:
+        """
+        Шифрує бінарний потік src у dst. Повертає кількість сегментів.
+        """
+        salt = os.urandom(16)
+        prefix = os.urandom(7)
+        header = self._HEADER.pack(self.MAGIC, self.segment_size, self.iterations, salt, prefix)
+        aead = AESGCM(self.kdf.derive(passphrase, salt))
+
+        dst.write(header)
+        count = 0
+        for index, (segment, last) in enumerate(self._segments(src, self.segment_size)):
+            if index >= 2 ** 32:
+                raise ValueError("Помилка: Файл завеликий для одного контейнера.")
+            dst.write(aead.encrypt(self._nonce(prefix, index, last), segment, header))
+            count += 1
+        dst.flush()
+        return count
+
+    def decrypt_stream(self, src, dst, passphrase: str) -> int:
+        """
+        Розшифровує контейнер із src у dst. Повертає кількість сегментів.
+        При першому пошкодженому сегменті (або невірному паролі) виникає ValueError;
+        сегменти до нього вже записані в dst, тому для файлів використовуйте decrypt_file.
+        """
+        header = self._read_exact(src, self.HEADER_SIZE)
+        if len(header) != self.HEADER_SIZE or not header.startswith(self.MAGIC):
+            raise ValueError("Помилка: Це не зашифрований контейнер (невідомий формат).")
+        _, segment_size, iterations, salt, prefix = self._HEADER.unpack(header)
+        if not 0 < segment_size <= self.MAX_SEGMENT_SIZE:
+            raise ValueError("Помилка: Некоректний розмір сегмента в заголовку.")
+        aead = AESGCM(self._kdf(iterations).derive(passphrase, salt))
+
+        count = 0
+        for index, (segment, last) in enumerate(self._segments(src, segment_size + self.TAG_SIZE)):
+            try:
+                dst.write(aead.decrypt(self._nonce(prefix, index, last), segment, header))
+            except InvalidTag:
+                raise ValueError(f"Помилка: Сегмент {index} пошкоджено, або пароль невірний.") from None
+            count += 1
+        dst.flush()
+        return count
+
+    def encrypt_file(self, src_path: str, dst_path: str, passphrase: str) -> int:
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            return self.encrypt_stream(src, dst, passphrase)
+
+    def decrypt_file(self, src_path: str, dst_path: str, passphrase: str) -> int:
+        """
+        Розшифровує у тимчасовий файл і перейменовує його лише після успішної перевірки
+        всіх сегментів - частково розшифрований результат не залишається на диску.
+        """
+        tmp_path = dst_path + '.part'
+        try:
+            with open(src_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                count = self.decrypt_stream(src, dst, passphrase)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, dst_path)
+        return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Потокове шифрування файлів (AES-256-GCM)")
+    parser.add_argument("command", choices=["encrypt", "decrypt"])
+    parser.add_argument("-i", "--input", default="-", help="вхідний файл (за замовчуванням stdin)")
+    parser.add_argument("-o", "--output", default="-", help="вихідний файл (за замовчуванням stdout)")
+    parser.add_argument("--segment-size", type=int, default=StreamEncryptor.DEFAULT_SEGMENT_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        encryptor = StreamEncryptor(segment_size=args.segment_size)
+    except ValueError as e:
+        parser.error(str(e))
+    passphrase = os.environ.get("LAB5_PASSPHRASE") or getpass.getpass("Введіть пароль-ключ: ")
+
+    try:
+        if args.command == "decrypt" and args.output != "-" and args.input != "-":
+            encryptor.decrypt_file(args.input, args.output, passphrase)
+            return
+        src = sys.stdin.buffer if args.input == "-" else open(args.input, 'rb')
+        dst = sys.stdout.buffer if args.output == "-" else open(args.output, 'wb')
+        try:
+            if args.command == "encrypt":
+                encryptor.encrypt_stream(src, dst, passphrase)
+            else:
+                encryptor.decrypt_stream(src, dst, passphrase)
+        finally:
+            if src is not sys.stdin.buffer:
+                src.close()
+            if dst is not sys.stdout.buffer:
+                dst.close()
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Тести MessageEncryptor: шифрограми у вигляді bytes та str.
+
+Запуск (з папки lab05): python -m unittest test_lab_5_kozan
+"""
+import unittest
+
+from cryptography.fernet import Fernet
+
+from kdf_backends import Pbkdf2Kdf
+from lab_5_kozan import MessageEncryptor, derive_fernet_key
+
+
+class StrTokenTest(unittest.TestCase):
+    """decrypt та decrypt_many приймають шифрограму як рядок, так само як і bytes."""
+
+    def setUp(self):
+        # Мала кількість ітерацій лише для швидкості тестів
+        self.encryptor = MessageEncryptor(kdf=Pbkdf2Kdf(1000))
+
+    def test_decrypt_str_token(self):
+        token = self.encryptor.encrypt("Привіт, КОЖАН", "пароль")
+        self.assertEqual(self.encryptor.decrypt(token, "пароль"), "Привіт, КОЖАН")
+        self.assertEqual(self.encryptor.decrypt(token.decode('ascii'), "пароль"), "Привіт, КОЖАН")
+
+    def test_decrypt_str_token_wrong_passphrase(self):
+        token = self.encryptor.encrypt("текст", "пароль").decode('ascii')
+        self.assertIsNone(self.encryptor.decrypt(token, "інший"))
+
+    def test_decrypt_legacy_str_token(self):
+        # Старий формат: голий токен Fernet зі статичною сіллю
+        legacy = MessageEncryptor(use_key_cache=False)
+        key = derive_fernet_key("пароль", MessageEncryptor.STATIC_SALT, Pbkdf2Kdf(MessageEncryptor.ITERATIONS))
+        token = Fernet(key).encrypt("старий".encode('utf-8')).decode('ascii')
+        self.assertEqual(legacy.decrypt(token, "пароль"), "старий")
+
+    def test_decrypt_non_ascii_str_token(self):
+        self.assertIsNone(self.encryptor.decrypt("ks2.сіль.pbkdf2-sha256-1000.токен", "пароль"))
+
+    def test_decrypt_many_mixed_types(self):
+        tokens = [self.encryptor.encrypt(f"повідомлення {i}", "пароль") for i in range(3)]
+        mixed = [tokens[0], tokens[1].decode('ascii'), tokens[2]]
+        self.assertEqual(self.encryptor.decrypt_many(mixed, "пароль"),
+                         ["повідомлення 0", "повідомлення 1", "повідомлення 2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Точність та швидкість детектора SQL-ін'єкцій (sqli_detector.py):
+  * точність - на розміченому корпусі sqli_corpus.tsv (влучання, хибні тривоги);
+  * швидкість - рядків/с на синтетичному журналі, де --attack-rate рядків є атаками з корпусу,
+    для порядкової перевірки is_injection та блокової scan_stream (з поясненнями і без).
+
+Запуск:
+    python bench_detector.py
+    python bench_detector.py --lines 5000000 --attack-rate 0.001
+"""
+import argparse
+import io
+import os
+import random
+import time
+
+from sqli_detector import detect, is_injection, scan_stream
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sqli_corpus.tsv")
+NAMES = ["Ivanenko", "Petrenko", "Sydorenko", "Kovalenko", "Shevchenko", "Bondarenko",
+         "Tkachenko", "Melnyk", "O'Brien", "Orlov", "Andriienko", "Anna-Maria"]
+
+
+def load_corpus(path=CORPUS):
+    """[(мітка, контекст, текст), ...] з TSV-файлу (рядки з # пропускаються)."""
+    with open(path, encoding="utf-8") as f:
+        return [tuple(line.rstrip("\n").split("\t", 2)) for line in f if line.strip() and not line.startswith("#")]
+
+
+def evaluate(corpus):
+    tp = fp = fn = tn = 0
+    misses = []
+    for label, context, text in corpus:
+        flagged = bool(detect(text, context))
+        attack = label == "attack"
+        tp += flagged and attack
+        fp += flagged and not attack
+        fn += attack and not flagged
+        tn += not attack and not flagged
+        if flagged != attack:
+            misses.append((label, text))
+    return tp, fp, fn, tn, misses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк детектора SQL-ін'єкцій")
+    parser.add_argument("--lines", type=int, default=2_000_000, help="рядків у синтетичному журналі")
+    parser.add_argument("--attack-rate", type=float, default=0.01, help="частка атак у журналі")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    tp, fp, fn, tn, misses = evaluate(corpus)
+    print(f"Корпус: {len(corpus)} зразків, виявлено атак {tp}/{tp + fn}, хибних тривог {fp}/{fp + tn}")
+    for label, text in misses:
+        print(f"   помилка ({label}): {text}")
+
+    rng = random.Random(1)
+    attacks = [text for label, context, text in corpus if label == "attack" and context == "term"]
+    lines = [rng.choice(attacks) if rng.random() < args.attack_rate
+             else f"{rng.choice(NAMES)}{rng.randrange(1000)}" for _ in range(args.lines)]
+    log = "\n".join(lines) + "\n"
+
+    print(f"\nЖурнал: {args.lines} рядків, атак {args.attack_rate:.1%}")
+    print(f"{'СПОСІБ':<28} | {'ЧАС, c':>7} | {'рядків/с':>12} | {'ЗНАЙДЕНО':>8}")
+    print("-" * 64)
+
+    start = time.perf_counter()
+    found = sum(1 for line in lines if is_injection(line))
+    elapsed = time.perf_counter() - start
+    print(f"{'is_injection по рядках':<28} | {elapsed:>7.2f} | {args.lines / elapsed:>12,.0f} | {found:>8}")
+
+    for explain in (True, False):
+        start = time.perf_counter()
+        found = sum(1 for _ in scan_stream(io.StringIO(log), explain=explain))
+        elapsed = time.perf_counter() - start
+        name = "scan_stream" + (" з поясненнями" if explain else "")
+        print(f"{name:<28} | {elapsed:>7.2f} | {args.lines / elapsed:>12,.0f} | {found:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Порівняння пропускної здатності пошуку (запитів/с) при різній кількості потоків:
+  * "старий" шлях - sqlite3.connect + execute + close на кожен запит, як у secure_search;
+  * пул - ConnectionPool.search (з'єднання потоку та кеш підготовлених запитів);
+  * пакетний - ConnectionPool.search_many пакетами по --batch прізвищ;
+  * кеш - SearchResultCache.search (LRU-кеш результатів поверх пулу).
+
+Запуск:
+    python bench_search.py
+    python bench_search.py --rows 10000 --queries 20000 --threads 1 4 16
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from db_pool import ConnectionPool, SEARCH_SQL
+from result_cache import SearchResultCache
+
+
+def make_database(path, rows):
+    """БД зі схемою setup_database та rows синтетичними співробітниками."""
+    conn = sqlite3.connect(path)
+    conn.execute('''
+    CREATE TABLE employees (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        position TEXT,
+        salary INTEGER,
+        personal_info TEXT
+    )
+    ''')
+    conn.executemany('INSERT INTO employees VALUES (?,?,?,?,?)', (
+        (i, f"Name{i}", "Developer", 20000 + i % 1000, f"Passport: XX{i:06d}") for i in range(rows)
+    ))
+    conn.commit()
+    conn.close()
+
+
+def legacy_search(path, term):
+    conn = sqlite3.connect(path)
+    rows = conn.execute(SEARCH_SQL, (term,)).fetchall()
+    conn.close()
+    return rows
+
+
+def run_threads(threads, tasks, worker):
+    """Розподіляє tasks між потоками; повертає час виконання."""
+    chunks = [tasks[i::threads] for i in range(threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, chunks))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк пулу з'єднань SQLite")
+    parser.add_argument("--rows", type=int, default=1000, help="співробітників у тестовій БД")
+    parser.add_argument("--queries", type=int, default=5000, help="запитів на кожен замір")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--batch", type=int, default=100, help="прізвищ в одному виклику search_many")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    terms = [f"Name{rng.randrange(args.rows * 2)}" for _ in range(args.queries)]  # ~50% влучань
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite")
+        make_database(path, args.rows)
+        pool = ConnectionPool(path)
+        cache = SearchResultCache(pool)
+
+        def legacy_worker(chunk):
+            for term in chunk:
+                legacy_search(path, term)
+
+        def pool_worker(chunk):
+            for term in chunk:
+                pool.search(term)
+
+        def batch_worker(chunk):
+            for i in range(0, len(chunk), args.batch):
+                pool.search_many(chunk[i:i + args.batch])
+
+        def cache_worker(chunk):
+            for term in chunk:
+                cache.search(term)
+
+        print(f"Рядків: {args.rows}, запитів: {args.queries}, пакет: {args.batch}")
+        print(f"{'ПОТОКИ':>6} | {'СТАРИЙ, запит/с':>16} | {'ПУЛ, запит/с':>14} | {'ПАКЕТ, запит/с':>15} | "
+              f"{'КЕШ, запит/с':>13} | {'ПРИСКОРЕННЯ':>11}")
+        print("-" * 91)
+        for threads in args.threads:
+            legacy = args.queries / run_threads(threads, terms, legacy_worker)
+            pooled = args.queries / run_threads(threads, terms, pool_worker)
+            batched = args.queries / run_threads(threads, terms, batch_worker)
+            cached = args.queries / run_threads(threads, terms, cache_worker)
+            print(f"{threads:>6} | {legacy:>16.0f} | {pooled:>14.0f} | {batched:>15.0f} | "
+                  f"{cached:>13.0f} | {pooled / legacy:>10.1f}x")
+        print("Кеш результатів:", cache.stats())
+        cache.close()
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
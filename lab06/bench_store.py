@@ -0,0 +1,71 @@
+"""
+Швидкість масового завантаження та затримка пошуку на великій таблиці employees:
+  * завантаження - рядків/с для bulk_load (executemany порціями в одній транзакції);
+  * точний пошук WHERE name = ? - з індексом та без нього (NOT INDEXED, повний перегляд);
+  * пошук за префіксом та нечіткий пошук через FTS5.
+
+Запуск:
+    python bench_store.py
+    python bench_store.py --sizes 10000 100000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from employees_store import bulk_load, fuzzy_search, prefix_search
+
+EXACT_SQL = "SELECT * FROM employees WHERE name = ?"
+SCAN_SQL = "SELECT * FROM employees NOT INDEXED WHERE name = ?"
+
+
+def latency_ms(func, args_list):
+    """Медіана затримки виклику func(*args) у мілісекундах."""
+    times = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк великої таблиці employees")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--lookups", type=int, default=200, help="пошуків на кожен вид запиту")
+    parser.add_argument("--scans", type=int, default=5, help="повних переглядів (вони повільні)")
+    args = parser.parse_args()
+
+    print(f"{'РЯДКІВ':>10} | {'ЗАВАНТ., рядків/с':>17} | {'ІНДЕКС, мс':>10} | {'БЕЗ ІНДЕКСУ, мс':>15} | "
+          f"{'ПРЕФІКС, мс':>11} | {'НЕЧІТКИЙ, мс':>12}")
+    print("-" * 91)
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "store.sqlite")
+            start = time.perf_counter()
+            bulk_load(path, size)
+            load_rate = size / (time.perf_counter() - start)
+
+            conn = sqlite3.connect(path)
+            rng = random.Random(7)
+            max_id = conn.execute("SELECT MAX(id) FROM employees").fetchone()[0]
+            names = [conn.execute("SELECT name FROM employees WHERE id = ?",
+                                  (rng.randint(1, max_id),)).fetchone()[0] for _ in range(args.lookups)]
+            # Нечіткий пошук - прізвище з однією заміненою літерою
+            typos = [n[:len(n) // 2] + "x" + n[len(n) // 2 + 1:] for n in names]
+
+            exact = latency_ms(lambda n: conn.execute(EXACT_SQL, (n,)).fetchall(), [(n,) for n in names])
+            scan = latency_ms(lambda n: conn.execute(SCAN_SQL, (n,)).fetchall(),
+                              [(n,) for n in names[:args.scans]])
+            prefix = latency_ms(lambda n: prefix_search(conn, n[:4]), [(n,) for n in names])
+            fuzzy = latency_ms(lambda n: fuzzy_search(conn, n), [(n,) for n in typos])
+            conn.close()
+
+        print(f"{size:>10} | {load_rate:>17,.0f} | {exact:>10.3f} | {scan:>15.3f} | {prefix:>11.3f} | {fuzzy:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DB_PATH = 'demo_db.sqlite'
+
+# Налаштування з'єднання: WAL дозволяє читачам не блокувати один одного і запис,
+# решта прагм зменшує кількість системних викликів на запит
+PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -16000",   # 16 МБ кешу сторінок на з'єднання
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 МБ файлу БД читаються через mmap
+)
+
+SEARCH_SQL = "SELECT * FROM employees WHERE name = ?"
+
+# Розміри пакетів для IN (...): кількість плейсхолдерів округлюється вгору до одного з них,
+# тож у кеші підготовлених запитів залишається кілька текстів SQL, а не один на кожну довжину
+IN_BUCKETS = (1, 8, 32, 128, 512)
+# Більші пакети йдуть через тимчасову таблицю та JOIN
+TEMP_TABLE_THRESHOLD = IN_BUCKETS[-1]
+
+
+class ConnectionPool:
+    """
+    Потокобезпечний пул з'єднань SQLite: одне з'єднання на потік.
+
+    sqlite3.connect для кожного запиту відкриває файл, читає схему та заново
+    компілює SQL - це займає більше часу, ніж сам пошук за індексом.
+    Пул закріплює з'єднання за потоком при першому зверненні і далі повторно
+    використовує його разом з кешем підготовлених запитів (cached_statements),
+    тому параметризований запит компілюється один раз на з'єднання.
+    З'єднання завершених потоків передаються новим потокам, а не накопичуються.
+    """
+
+    def __init__(self, path: str = DB_PATH, cached_statements: int = 256, timeout: float = 5.0):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._owners = {}  # ідентифікатор потоку -> його з'єднання
+        self._closed = False
+
+        # Режим WAL зберігається у файлі БД, тому достатньо ввімкнути його один раз
+        conn = sqlite3.connect(path, timeout=timeout)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread=False потрібен, щоб з'єднання завершеного потоку могло перейти
+        # до нового, а close() - закрити всі з'єднання; одночасно з'єднання використовує один потік
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        """
+        З'єднання для поточного потоку: вже закріплене за ним, звільнене завершеним потоком
+        (пули потоків постійно створюють нові потоки) або нове.
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Пул з'єднань закрито.")
+            conn = self._owners.pop(ident, None)
+            if conn is None:
+                alive = {thread.ident for thread in threading.enumerate()}
+                dead = next((owner for owner in self._owners if owner not in alive), None)
+                if dead is not None:
+                    conn = self._owners.pop(dead)
+            if conn is not None:
+                self._owners[ident] = conn
+        if conn is None:
+            conn = self._connect()
+            with self._lock:
+                self._owners[ident] = conn
+        elif conn.in_transaction:
+            # Транзакцію, яку завершений потік залишив відкритою, скасовуємо
+            conn.rollback()
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """З'єднання поточного потоку (закріплюється при першому виклику)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._acquire()
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Транзакція на з'єднанні поточного потоку (commit або rollback при помилці)."""
+        conn = self.connection()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def close(self):
+        """Закриває всі з'єднання пулу."""
+        with self._lock:
+            self._closed = True
+            connections, self._owners = list(self._owners.values()), {}
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def search(self, search_term: str) -> list:
+        """Параметризований пошук співробітників за прізвищем."""
+        return self.connection().execute(SEARCH_SQL, (search_term,)).fetchall()
+
+    def search_many(self, search_terms) -> dict:
+        """
+        Пакетний пошук: {прізвище: [рядки]} для кожного з search_terms.
+        Невеликі пакети виконуються через WHERE name IN (?, ...),
+        великі - через тимчасову таблицю з прізвищами та JOIN.
+        Усі значення передаються як параметри, тому пакетний пошук так само захищений від ін'єкцій.
+        """
+        terms = list(dict.fromkeys(search_terms))
+        found = {term: [] for term in terms}
+        if not terms:
+            return found
+        conn = self.connection()
+        if len(terms) > TEMP_TABLE_THRESHOLD:
+            rows = self._search_temp_table(conn, terms)
+        else:
+            rows = self._search_in(conn, terms)
+        for row in rows:
+            found[row[1]].append(row)
+        return found
+
+    @staticmethod
+    def _search_in(conn: sqlite3.Connection, terms: list) -> list:
+        size = next(b for b in IN_BUCKETS if b >= len(terms))
+        # Доповнення останнім значенням не змінює результат, але дає сталий текст SQL
+        params = terms + [terms[-1]] * (size - len(terms))
+        sql = f"SELECT * FROM employees WHERE name IN ({','.join('?' * size)})"
+        return conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _search_temp_table(conn: sqlite3.Connection, terms: list) -> list:
+        # Тимчасова таблиця належить з'єднанню, а отже й потоку - конфліктів між потоками немає
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS search_terms (name TEXT PRIMARY KEY)")
+        own_transaction = not conn.in_transaction
+        try:
+            conn.execute("DELETE FROM temp.search_terms")
+            conn.executemany("INSERT INTO temp.search_terms VALUES (?)", ((t,) for t in terms))
+            return conn.execute(
+                "SELECT e.* FROM temp.search_terms AS t JOIN employees AS e ON e.name = t.name"
+            ).fetchall()
+        finally:
+            # Вставка в тимчасову таблицю відкрила транзакцію; її скасування звільняє
+            # знімок WAL (чужу відкриту транзакцію не чіпаємо)
+            if own_transaction:
+                conn.rollback()
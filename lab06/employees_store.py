@@ -0,0 +1,238 @@
+import argparse
+import difflib
+import random
+import sqlite3
+import time
+
+from db_pool import DB_PATH
+
+TABLE_SQL = '''
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    position TEXT,
+    salary INTEGER,
+    personal_info TEXT
+)
+'''
+
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_employees_name ON employees(name)",
+    "CREATE INDEX IF NOT EXISTS idx_employees_position ON employees(position)",
+)
+
+# Повнотекстовий індекс прізвищ (триграми): пошук за префіксом, підрядком та з помилками.
+# Таблиця з зовнішнім вмістом - самі рядки зберігаються лише в employees
+FTS_SQL = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5(
+    name, content='employees', content_rowid='id', tokenize='trigram'
+)
+'''
+
+# Тригери синхронізують FTS-індекс зі звичайними змінами таблиці
+TRIGGERS = (
+    '''CREATE TRIGGER IF NOT EXISTS employees_ai AFTER INSERT ON employees BEGIN
+        INSERT INTO employees_fts(rowid, name) VALUES (new.id, new.name);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS employees_ad AFTER DELETE ON employees BEGIN
+        INSERT INTO employees_fts(employees_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS employees_au AFTER UPDATE OF name ON employees BEGIN
+        INSERT INTO employees_fts(employees_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO employees_fts(rowid, name) VALUES (new.id, new.name);
+    END''',
+)
+
+DROP_FOR_LOAD = (
+    "DROP INDEX IF EXISTS idx_employees_name",
+    "DROP INDEX IF EXISTS idx_employees_position",
+    "DROP TRIGGER IF EXISTS employees_ai",
+    "DROP TRIGGER IF EXISTS employees_ad",
+    "DROP TRIGGER IF EXISTS employees_au",
+)
+
+# Складові синтетичних прізвищ: 40^2 основ * 8 закінчень ~ 12 800 унікальних,
+# з третім складом - понад пів мільйона
+SYLLABLES = (
+    "Bo", "Da", "Ha", "Ko", "Ly", "Ma", "Ne", "Pa", "Ro", "Sa", "Ta", "Va", "Za", "Ku", "Le",
+    "Mo", "Pe", "Sy", "Te", "Ho", "Kra", "Bi", "Dy", "Fe", "Hu", "Ia", "Lo", "Mi", "Ni", "Ol",
+    "Pry", "Ru", "Sto", "Tu", "Ve", "Ya", "Zo", "Che", "Shy", "Ste",
+)
+SUFFIXES = ("nko", "chuk", "iuk", "ko", "shyn", "vych", "skyi", "ak")
+POSITIONS = (
+    "Manager", "Developer", "Accountant", "Analyst", "Designer", "Tester", "Engineer",
+    "Administrator", "Lawyer", "Recruiter", "Support", "Architect",
+)
+
+
+def create_schema(conn: sqlite3.Connection):
+    """Таблиця employees з індексами, FTS5-таблицею та тригерами синхронізації."""
+    conn.execute(TABLE_SQL)
+    for sql in INDEXES:
+        conn.execute(sql)
+    conn.execute(FTS_SQL)
+    for sql in TRIGGERS:
+        conn.execute(sql)
+
+
+def generate_employees(count: int, start_id: int = 1, seed: int = 2025):
+    """Генератор синтетичних рядків (id, name, position, salary, personal_info)."""
+    rng = random.Random(seed)
+    choice, randrange = rng.choice, rng.randrange
+    for i in range(start_id, start_id + count):
+        stem = choice(SYLLABLES) + choice(SYLLABLES).lower()
+        if randrange(2):
+            stem += choice(SYLLABLES).lower()
+        yield (
+            i,
+            stem + choice(SUFFIXES),
+            choice(POSITIONS),
+            10000 + randrange(90) * 500,
+            f"Passport: {chr(65 + randrange(26))}{chr(65 + randrange(26))}{randrange(1000000):06d}",
+        )
+
+
+def _chunks(rows, size: int):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def bulk_load(path: str, count: int, chunk_size: int = 50_000, seed: int = 2025,
+              replace: bool = True, progress=None) -> dict:
+    """
+    Масове завантаження count синтетичних співробітників.
+
+    Усі рядки вставляються в одній транзакції порціями по chunk_size через executemany
+    (пам'ять обмежена однією порцією). Індекси та тригери FTS на час завантаження
+    видаляються, а потім будуються один раз по всій таблиці - це в рази швидше,
+    ніж оновлювати B-дерева та FTS-індекс на кожну вставку.
+    Повертає тривалості етапів у секундах.
+    """
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA cache_size = -262144")  # 256 МБ кешу для побудови індексів
+    conn.execute("PRAGMA temp_store = MEMORY")
+    timings = {}
+    try:
+        conn.execute("BEGIN")
+        conn.execute(TABLE_SQL)
+        conn.execute(FTS_SQL)
+        for sql in DROP_FOR_LOAD:
+            conn.execute(sql)
+        start_id = 1
+        if replace:
+            conn.execute("DELETE FROM employees")
+        else:
+            start_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM employees").fetchone()[0]
+
+        start = time.perf_counter()
+        loaded = 0
+        for chunk in _chunks(generate_employees(count, start_id, seed), chunk_size):
+            conn.executemany("INSERT INTO employees VALUES (?,?,?,?,?)", chunk)
+            loaded += len(chunk)
+            if progress:
+                progress(loaded, count)
+        timings["insert"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for sql in INDEXES:
+            conn.execute(sql)
+        timings["indexes"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        conn.execute("INSERT INTO employees_fts(employees_fts) VALUES ('rebuild')")
+        for sql in TRIGGERS:
+            conn.execute(sql)
+        timings["fts"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        conn.execute("COMMIT")
+        timings["commit"] = time.perf_counter() - start
+        conn.execute("ANALYZE")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    return timings
+
+
+def prefix_search(conn: sqlite3.Connection, prefix: str, limit: int = 20) -> list:
+    """
+    Співробітники, чиє прізвище починається з prefix (без урахування регістру).
+    Для префікса від 3 символів LIKE обслуговується триграмним FTS-індексом.
+    """
+    # CROSS JOIN фіксує порядок: спершу FTS-індекс, потім рядки за id
+    # (на малих таблицях планувальник інакше обирає повний перегляд employees)
+    sql = "SELECT e.* FROM employees_fts AS f CROSS JOIN employees AS e ON e.id = f.rowid WHERE f.name LIKE ?"
+    if '%' in prefix or '_' in prefix:
+        # З ESCAPE FTS5 не використовує індекс для LIKE, тому лише коли в префіксі є символи шаблону
+        prefix = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        sql += " ESCAPE '\\'"
+    return conn.execute(sql + " LIMIT ?", (prefix + '%', limit)).fetchall()
+
+
+def fuzzy_search(conn: sqlite3.Connection, term: str, limit: int = 20, candidates: int = 2000) -> list:
+    """
+    Нечіткий пошук прізвища, стійкий до однієї помилки (заміна, пропуск або зайва літера).
+
+    Прізвище ділиться на 3 частини (на 2 для коротких): одна помилка псує лише одну з них,
+    тож шукаються рядки, що містять будь-які дві частини, - FTS5 перетинає списки
+    документів, і кандидатів небагато. Кандидати впорядковуються за схожістю (difflib).
+    """
+    term = term.lower()
+    parts = 3 if len(term) >= 9 else 2
+    size = len(term) // parts
+    if size < 3:
+        return prefix_search(conn, term, limit)
+    segments = [term[i * size:(i + 1) * size] for i in range(parts - 1)] + [term[(parts - 1) * size:]]
+    # Кожна частина в лапках - службові символи FTS5 у введенні не інтерпретуються
+    quoted = ['"' + s.replace('"', '""') + '"' for s in segments]
+    if parts == 3:
+        a, b, c = quoted
+        query = f"({a} {b}) OR ({a} {c}) OR ({b} {c})"
+    else:
+        query = " OR ".join(quoted)
+
+    names = [row[0] for row in conn.execute(
+        "SELECT DISTINCT e.name FROM employees_fts AS f CROSS JOIN employees AS e ON e.id = f.rowid "
+        "WHERE employees_fts MATCH ? LIMIT ?", (query, candidates))]
+    names.sort(key=lambda name: difflib.SequenceMatcher(None, term, name.lower()).ratio(), reverse=True)
+
+    rows = []
+    for name in names:
+        rows.extend(conn.execute("SELECT * FROM employees WHERE name = ? LIMIT ?", (name, limit - len(rows))))
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генератор великої таблиці employees")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="рядків в одному executemany")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--append", action="store_true", help="додати до наявних рядків замість заміни")
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f"\r[-] Вставлено {done}/{total}", end="", flush=True)
+
+    start = time.perf_counter()
+    timings = bulk_load(args.db, args.rows, args.chunk_size, args.seed, not args.append, progress)
+    total = time.perf_counter() - start
+    print(f"\n[-] {args.rows} рядків за {total:.2f} c ({args.rows / total:,.0f} рядків/с)")
+    print("    " + ", ".join(f"{stage}: {t:.2f} c" for stage, t in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 import sqlite3
 
+from db_pool import DB_PATH, ConnectionPool
+from employees_store import create_schema
+from result_cache import SearchResultCache
+from sqli_detector import detect
+
 def setup_database():
     """Створення БД та наповнення тестовими даними"""
-    conn = sqlite3.connect('demo_db.sqlite')
+    conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
     # Створення таблиці
@@ -18,6 +23,10 @@ def setup_database():
     
     # Очищення таблиці перед новим запуском (для чистоти експерименту)
     cursor.execute('DELETE FROM employees')
+
+    # Індекси за прізвищем і посадою та FTS5-індекс прізвищ (див. employees_store.py)
+    create_schema(conn)
+    cursor.execute("INSERT INTO employees_fts(employees_fts) VALUES ('rebuild')")
     
     # Додавання даних
     employees = [
@@ -32,9 +41,16 @@ def setup_database():
     conn.close()
     print("[-] База даних успішно створена та наповнена.")
 
-def vulnerable_search(search_term):
+def vulnerable_search(search_term, pool=None, guard=False):
     """Вразлива функція пошуку (String Concatenation)"""
-    conn = sqlite3.connect('demo_db.sqlite')
+    # pool - пул з'єднань (ConnectionPool); без нього з'єднання відкривається для кожного запиту
+    # guard=True - перед запитом ввід перевіряється детектором SQL-ін'єкцій (sqli_detector.py)
+    if guard:
+        reasons = detect(search_term)
+        if reasons:
+            print(f"\n[GUARD] Запит заблоковано: ознаки SQL-ін'єкції ({', '.join(reasons)})")
+            return
+    conn = pool.connection() if pool else sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
     print(f"\n[!] Виконується ВРАЗЛИВИЙ пошук...")
@@ -56,11 +72,15 @@ def vulnerable_search(search_term):
     except sqlite3.Error as e:
         print(f"   [SQL Error]: {e}")
         
-    conn.close()
+    if not pool:
+        conn.close()
 
-def secure_search(search_term):
+def secure_search(search_term, pool=None, cache=None):
     """Захищена функція пошуку (Prepared Statements)"""
-    conn = sqlite3.connect('demo_db.sqlite')
+    # cache - кеш результатів (SearchResultCache); повторні пошуки того самого прізвища не звертаються до БД
+    if cache:
+        pool = cache.pool
+    conn = pool.connection() if pool else sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
     print(f"\n[+] Виконується ЗАХИЩЕНИЙ пошук...")
@@ -72,40 +92,56 @@ def secure_search(search_term):
     
     try:
         # Параметри передаються окремим аргументом (tuple)
-        cursor.execute(sql_query, (search_term,))
-        results = cursor.fetchall()
-        
-        if results:
-            for row in results:
-                print(f"   Знайдено: {row[1]} | Посада: {row[2]} | Інфо: {row[4]}")
+        if cache:
+            results = cache.iter_search(search_term)
         else:
+            results = cursor.execute(sql_query, (search_term,))
+        
+        # Рядки читаються з курсора по одному, без fetchall() для всієї вибірки
+        found = False
+        for row in results:
+            found = True
+            print(f"   Знайдено: {row[1]} | Посада: {row[2]} | Інфо: {row[4]}")
+        if not found:
             print("   Нічого не знайдено.")
+        if cache:
+            stats = cache.stats()
+            print(f"[DEBUG] Кеш результатів: влучань {stats['hits']}, промахів {stats['misses']}, "
+                  f"частка влучань {stats['hit_rate']:.0%}")
     except sqlite3.Error as e:
         print(f"   [SQL Error]: {e}")
         
-    conn.close()
+    if not pool:
+        conn.close()
 
 def main():
     setup_database()
+    pool = ConnectionPool(DB_PATH)
+    cache = SearchResultCache(pool)
     
     while True:
         print("\n" + "="*40)
         print("МЕНЮ ДЕМОНСТРАЦІЇ SQL INJECTION")
         print("1. Вразливий пошук")
         print("2. Захищений пошук")
-        print("3. Вихід")
+        print("3. Вразливий пошук з детектором SQL-ін'єкцій")
+        print("4. Вихід")
         
-        choice = input("Обери варіант (1-3): ")
+        choice = input("Обери варіант (1-4): ")
         
-        if choice == '3':
+        if choice == '4':
+            cache.close()
+            pool.close()
             break
             
         search_input = input("Введи прізвище для пошуку: ")
         
         if choice == '1':
-            vulnerable_search(search_input)
+            vulnerable_search(search_input, pool)
         elif choice == '2':
-            secure_search(search_input)
+            secure_search(search_input, cache=cache)
+        elif choice == '3':
+            vulnerable_search(search_input, pool, guard=True)
         else:
             print("Невірний вибір.")
 
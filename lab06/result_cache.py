@@ -0,0 +1,120 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from db_pool import ConnectionPool, SEARCH_SQL
+
+
+class SearchResultCache:
+    """
+    LRU-кеш результатів параметризованого пошуку за прізвищем.
+
+    Записи стають недійсними, щойно таблиця змінюється:
+    - кеш тримає власне з'єднання-спостерігач, у якого PRAGMA data_version
+      змінюється після кожної фіксації змін будь-яким іншим з'єднанням
+      (з пулу, іншого потоку чи іншого процесу);
+    - total_changes з'єднання потоку зростає після його власних, ще не зафіксованих змін.
+    Перед кожним пошуком перевіряються обидва значення, і якщо вони змінилися -
+    кеш повністю очищується. Перевірка коштує одну прагму без звернення до таблиці.
+    Рядки, прочитані всередині незафіксованої транзакції, не кешуються.
+
+    Результати віддаються ітератором курсора: великі вибірки (більше max_rows рядків)
+    не накопичуються в пам'яті та не кешуються.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_entries: int = 1024, max_rows: int = 1000):
+        self.pool = pool
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._entries = OrderedDict()  # прізвище -> кортеж рядків
+        self._lock = threading.Lock()
+        # Спостерігач використовується лише під self._lock
+        self._watcher = sqlite3.connect(pool.path, check_same_thread=False)
+        self._data_version = self._read_data_version()
+        self._seen = {}  # id(з'єднання) -> total_changes на момент останньої перевірки
+        self._generation = 0  # зростає при кожному очищенні
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.uncacheable = 0
+
+    def _read_data_version(self) -> int:
+        return self._watcher.execute("PRAGMA data_version").fetchone()[0]
+
+    def _clear(self):
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+        self._generation += 1
+
+    def _validate(self, conn) -> int:
+        """Очищує кеш, якщо БД змінилася. Повертає поточне покоління кешу."""
+        changes = conn.total_changes
+        with self._lock:
+            version = self._read_data_version()
+            previous = self._seen.get(id(conn), changes)
+            self._seen[id(conn)] = changes
+            if version != self._data_version or previous != changes:
+                self._data_version = version
+                self._clear()
+            return self._generation
+
+    def invalidate(self):
+        """Примусове очищення (наприклад, після зміни схеми)."""
+        with self._lock:
+            self._clear()
+
+    def iter_search(self, search_term: str):
+        """Ітератор рядків співробітників з прізвищем search_term."""
+        conn = self.pool.connection()
+        generation = self._validate(conn)
+        with self._lock:
+            rows = self._entries.get(search_term)
+            if rows is not None:
+                self._entries.move_to_end(search_term)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if rows is not None:
+            yield from rows
+            return
+
+        buffer = []
+        for row in conn.execute(SEARCH_SQL, (search_term,)):
+            if buffer is not None:
+                buffer.append(row)
+                if len(buffer) > self.max_rows:
+                    buffer = None
+                    with self._lock:
+                        self.uncacheable += 1
+            yield row
+        # Незафіксовані зміни власної транзакції не повинні потрапити до інших потоків
+        if buffer is None or conn.in_transaction:
+            return
+        with self._lock:
+            # Якщо за час запиту кеш очищено, результат міг застаріти - не зберігаємо
+            if generation == self._generation:
+                self._entries[search_term] = tuple(buffer)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def search(self, search_term: str) -> list:
+        return list(self.iter_search(search_term))
+
+    def close(self):
+        with self._lock:
+            self._entries.clear()
+            self._watcher.close()
+
+    def stats(self) -> dict:
+        """Метрики кешу: влучання, промахи, очищення, частка влучань."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "uncacheable": self.uncacheable,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
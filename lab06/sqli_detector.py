@@ -0,0 +1,277 @@
+import argparse
+import re
+import sys
+import time
+
+# Сигнатури відомих прийомів SQL-ін'єкцій (без урахування регістру).
+# Окремі вирази потрібні лише для пояснення причини; перевірка виконується одним
+# об'єднаним виразом COMBINED[context], тобто за один прохід рядка в C-коді модуля re.
+SIGNATURES = {
+    "union-select": r"\bunion\b(?:\s|/\*.*?\*/)+(?:all\s+|distinct\s+)?select\b",
+    "tautology": r"\b(?:or|and)\b\s*(?P<q>['\"]?)(?P<v>[\w.]+)(?P=q)\s*(?:==?|\blike\b|\bis\b)\s*(?P=q)(?P=v)\b",
+    "constant-comparison": r"\b(?:or|and)\s+\d+(?:\.\d+)?\s*(?:[<>=!]=?|<>)\s*\d+(?:\.\d+)?\b",
+    "quote-keyword": r"['\"]\s*\)*\s*(?:\b(?:or|and|union|select|having|order\s+by|group\s+by)\b|\|\|)",
+    "stacked-query": r";\s*(?:drop|delete|insert|update|alter|create|truncate|exec|attach|pragma|replace)\b",
+    "quote-comment": r"['\"]\s*\)*\s*(?:--|#|/\*)",
+    "time-based": r"\b(?:sleep|benchmark|pg_sleep|randomblob|waitfor\s+delay)\b\s*[('\"]",
+    "schema-probe": r"\b(?:sqlite_master|sqlite_schema|sqlite_version|information_schema|sysobjects|pg_catalog)\b",
+    "dangerous-function": r"\b(?:load_extension|group_concat|extractvalue|updatexml|xp_cmdshell)\s*\(",
+    "order-by-probe": r"\border\s+by\s+\d+\s*(?:--|#|/\*|$)",
+}
+# У повних SQL-запитах лапки перед AND/OR - звичайна річ, тому ця сигнатура лише для значень параметрів
+TERM_ONLY = {"quote-keyword"}
+
+_FLAGS = re.IGNORECASE | re.DOTALL
+_SIGNATURE_RES = {name: re.compile(pattern, _FLAGS) for name, pattern in SIGNATURES.items()}
+COMBINED = {
+    "term": re.compile("|".join(f"(?:{p})" for p in SIGNATURES.values()), _FLAGS),
+    "query": re.compile("|".join(f"(?:{p})" for n, p in SIGNATURES.items() if n not in TERM_ONLY), _FLAGS),
+}
+
+# Швидкий попередній фільтр: рядки без жодного з цих символів чи слів не можуть бути ін'єкцією
+# (звичайні прізвища відсіюються за один прохід по всьому блоку тексту).
+# Застосовується до тексту в нижньому регістрі: без IGNORECASE, слова згруповані
+# за першою літерою, а випереджальна перевірка першого символу дозволяє модулю re
+# швидко пропускати позиції, з яких не починається жодна гілка
+TRIGGER = re.compile(
+    r"(?=[-'\";#/abegilopruswx])(?:['\";#]|--|/\*|\b(?:"
+    r"a(?:nd)|b(?:enchmark)|e(?:xtractvalue)|g(?:roup_concat)|i(?:nformation_schema)|l(?:oad_extension)"
+    r"|o(?:r|rder)|p(?:g_sleep|g_catalog)|r(?:andomblob)|u(?:nion|pdatexml)"
+    r"|s(?:elect|leep|ysobjects|qlite_\w+)|w(?:aitfor)|x(?:p_cmdshell))\b)"
+)
+
+_TOKEN = re.compile(r"""
+    (?P<str>'(?:[^']|'')*'?|"(?:[^"]|"")*"?)
+  | (?P<comment>--|\#|/\*)
+  | (?P<num>\d+(?:\.\d+)?)
+  | (?P<word>[A-Za-z_][\w$]*)
+  | (?P<op>[=<>!]=?|<>|\|\||[();,*+])
+  | (?P<other>\S)
+""", re.VERBOSE)
+
+STRONG_KEYWORDS = {"union", "select", "insert", "update", "delete", "drop", "exec", "having",
+                   "sleep", "attach", "pragma", "truncate", "alter", "create"}
+LOGIC_KEYWORDS = {"or", "and", "not", "like", "is", "between", "in"}
+COMPARISONS = {"=", "==", "!=", "<>", "<", ">", "<=", ">=", "like", "is"}
+
+THRESHOLD = 3
+
+# Без жодного ключового слова, коментаря, ";" чи порівняння евристика не набирає THRESHOLD
+# (максимум 1 бал за вихід з літерала), тому лексичний розбір для таких рядків пропускається
+HEURISTIC_GATE = re.compile(
+    r"--|#|/\*|;|[=<>]|\b(?:" + "|".join(sorted(STRONG_KEYWORDS | LOGIC_KEYWORDS)) + r")\b"
+)
+
+
+def tokenize(text: str) -> list:
+    """Розбиває рядок на лексеми SQL: [(вид, значення), ...]."""
+    return [(m.lastgroup, m.group()) for m in _TOKEN.finditer(text)]
+
+
+def _literal(kind: str, value: str):
+    if kind == "num":
+        return float(value)
+    if kind == "str":
+        return value[1:-1] if len(value) > 1 and value[-1] == value[0] else value[1:]
+    if kind == "word":
+        return ("id", value.lower())
+    return None
+
+
+def _is_tautology(left, op: str, right) -> bool:
+    """Чи є порівняння двох літералів (або однакових імен) завжди істинним."""
+    a, b = _literal(*left), _literal(*right)
+    if a is None or b is None:
+        return False
+    if op in ("=", "==", "like", "is"):
+        return a == b
+    if isinstance(a, float) and isinstance(b, float):
+        return {"!=": a != b, "<>": a != b, "<": a < b, ">": a > b, "<=": a <= b, ">=": a >= b}[op]
+    return False
+
+
+def heuristic_score(text: str, context: str = "term") -> int:
+    """
+    Оцінка підозрілості за лексемами.
+
+    context="term" - значення, яке підставляється в запит як рядок
+    (WHERE name = '<значення>'): ввід обгортається в лапки, і все, що після
+    розбору опиняється поза рядковим літералом, означає вихід з літерала.
+    context="query" - повний текст SQL-запиту (ключові слова тут нормальні,
+    підозрілими є коментарі після літералів, кілька інструкцій та тавтології).
+    """
+    if context == "term":
+        text = "'" + text + "'"
+    tokens = tokenize(text)
+    score = 0
+    seen_string = False
+    outside = 0
+    for i, (kind, value) in enumerate(tokens):
+        lower = value.lower()
+        if kind == "str":
+            if seen_string and context == "term":
+                outside += 1
+            seen_string = True
+            continue
+        if context == "term" and seen_string:
+            outside += 1
+            if kind == "word":
+                score += 2 if lower in STRONG_KEYWORDS else 1 if lower in LOGIC_KEYWORDS else 0
+        if kind == "comment" and seen_string:
+            score += 2
+        elif kind == "op" and value == ";" and i + 1 < len(tokens):
+            score += 2
+        elif (kind == "op" or lower in ("like", "is")) and lower in COMPARISONS and 0 < i < len(tokens) - 1:
+            before = tokens[i - 2][1].lower() if i >= 2 else ""
+            if before in ("or", "and", "||") and _is_tautology(tokens[i - 1], lower, tokens[i + 1]):
+                score += 3
+    if context == "term" and outside:
+        score += 1
+    return score
+
+
+def detect(text: str, context: str = "term") -> list:
+    """
+    Перелік причин, з яких text схожий на SQL-ін'єкцію (порожній - вхід безпечний).
+    Спершу об'єднана сигнатура, потім евристика за лексемами.
+    """
+    lower = text.lower()
+    if not TRIGGER.search(lower):
+        return []
+    reasons = []
+    if COMBINED[context].search(text):
+        reasons = [name for name, rx in _SIGNATURE_RES.items()
+                   if not (context == "query" and name in TERM_ONLY) and rx.search(text)]
+    if HEURISTIC_GATE.search(lower):
+        score = heuristic_score(text, context)
+        if score >= THRESHOLD:
+            reasons.append(f"heuristic:{score}")
+    return reasons
+
+
+def is_injection(text: str, context: str = "term") -> bool:
+    """Швидка перевірка без пояснень."""
+    lower = text.lower()
+    if not TRIGGER.search(lower):
+        return False
+    if COMBINED[context].search(text):
+        return True
+    return bool(HEURISTIC_GATE.search(lower)) and heuristic_score(text, context) >= THRESHOLD
+
+
+def _classify(line: str, context: str, explain: bool) -> list:
+    if explain:
+        return detect(line, context)
+    return ["injection"] if is_injection(line, context) else []
+
+
+def scan_lines(lines, context: str = "term", explain: bool = True):
+    """Порядкова перевірка (для інтерактивного потоку): (номер рядка, рядок, причини)."""
+    for lineno, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        reasons = _classify(line, context, explain)
+        if reasons:
+            yield lineno, line, reasons
+
+
+def scan_stream(stream, context: str = "term", block_size: int = 1 << 20, stats: dict = None,
+                explain: bool = True):
+    """
+    Перевірка великого текстового потоку блоками по block_size символів.
+
+    TRIGGER шукається по всьому блоку одним викликом finditer, тому рядки без
+    жодного підозрілого символу (переважна більшість трафіку) не обробляються
+    в Python взагалі; повна класифікація виконується лише для рядків-кандидатів.
+    Повертає генератор (номер рядка, рядок, причини); stats отримує лічильник рядків.
+    explain=False пропускає пояснення причин (лише так/ні) - швидше на трафіку з атаками.
+    """
+    lineno = 0
+    tail = ""
+    while True:
+        chunk = stream.read(block_size)
+        if not chunk:
+            block, tail = tail, ""
+            if not block:
+                break
+        else:
+            block = tail + chunk
+            cut = block.rfind("\n") + 1
+            if cut == 0:
+                tail = block
+                continue
+            block, tail = block[:cut], block[cut:]
+
+        lower = block.lower()
+        if len(lower) != len(block):
+            # Рідкісні символи змінюють довжину в нижньому регістрі - позиції не збігаються,
+            # тому такий блок перевіряється порядково
+            for offset, line, reasons in scan_lines(block.splitlines(), context, explain):
+                yield lineno + offset, line, reasons
+            lineno += block.count("\n") + (0 if block.endswith("\n") else 1)
+            if not chunk:
+                break
+            continue
+
+        pos = 0  # позиція, до якої рядки вже пораховані
+        line_end = -1
+        for m in TRIGGER.finditer(lower):
+            start = m.start()
+            if start < line_end:
+                continue  # ще один збіг у рядку, який уже перевірено
+            line_start = block.rfind("\n", 0, start) + 1
+            line_end = block.find("\n", start)
+            if line_end == -1:
+                line_end = len(block)
+            lineno += block.count("\n", pos, line_start)
+            pos = line_start
+            line = block[line_start:line_end].rstrip("\r")
+            reasons = _classify(line, context, explain)
+            if reasons:
+                yield lineno + 1, line, reasons
+        lineno += block.count("\n", pos)
+        if block and not block.endswith("\n"):
+            lineno += 1
+        if not chunk:
+            break
+    if stats is not None:
+        stats["lines"] = stats.get("lines", 0) + lineno
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Детектор SQL-ін'єкцій для пошукових запитів та журналів")
+    parser.add_argument("files", nargs="*", default=["-"], help="файли журналів (за замовчуванням stdin)")
+    parser.add_argument("--context", choices=["term", "query"], default="term",
+                        help="term - значення параметра пошуку, query - повні SQL-запити")
+    parser.add_argument("--line-buffered", action="store_true",
+                        help="перевіряти stdin порядково (для інтерактивного потоку)")
+    parser.add_argument("--count", action="store_true", help="лише підсумок без виводу рядків")
+    args = parser.parse_args(argv)
+
+    flagged = 0
+    stats = {}
+    start = time.perf_counter()
+    for name in args.files:
+        if name == "-":
+            stream = sys.stdin
+            results = (scan_lines(stream, args.context, not args.count) if args.line_buffered
+                       else scan_stream(stream, args.context, stats=stats, explain=not args.count))
+        else:
+            stream = open(name, encoding="utf-8", errors="replace")
+            results = scan_stream(stream, args.context, stats=stats, explain=not args.count)
+        try:
+            for lineno, line, reasons in results:
+                flagged += 1
+                if not args.count:
+                    print(f"{name}:{lineno}: [{', '.join(reasons)}] {line[:200]}", flush=args.line_buffered)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+    elapsed = time.perf_counter() - start
+    lines = stats.get("lines", 0)
+    rate = f", {lines / elapsed:,.0f} рядків/с" if lines and elapsed else ""
+    print(f"[-] Підозрілих рядків: {flagged} з {lines or '?'}{rate}", file=sys.stderr)
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
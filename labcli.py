@@ -0,0 +1,358 @@
+"""
+Єдиний неінтерактивний запуск лабораторних: шифри (lab02), стеганографія (lab03),
+підпис файлів (lab04), шифрування (lab05) та пошук співробітників (lab06).
+
+Модулі лабораторних і важкі залежності (NumPy, Pillow, cryptography) імпортуються
+лише для підкоманди, яка справді виконується. Параметри задаються прапорцями або
+JSON-рядками на stdin (--jsonl): один процес обробляє багато завдань, а модулі,
+пул з'єднань SQLite та кеш ключів шифрування створюються один раз.
+
+Приклади:
+    python labcli.py cipher --method vigenere --key КОЖАН --text "Привіт світ"
+    python labcli.py sign --action sign --path lab04/test.txt --lastname Кожан --birthday 01012000 --secret s
+    python labcli.py stego --action extract --stego lab03/hidden.png
+    python labcli.py encrypt --action encrypt --text "Секрет" --passphrase КОЖАН
+    python labcli.py sqlsearch --db lab06/demo_db.sqlite --term Petrenko --guard
+    python labcli.py cipher --method caesar --shift 8 --jsonl < texts.jsonl   # {"text": ...} у кожному рядку
+    python labcli.py --jsonl < jobs.jsonl                                      # {"cmd": "sign", ...}
+    python labcli.py startup                                                   # вартість запуску підкоманд
+"""
+import os
+import sys
+import time
+
+_START = time.perf_counter()
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# З такої довжини тексту шифри виконує fast_cipher (з NumPy), коротші - lab2.py без залежностей
+FAST_CIPHER_MIN = 1 << 16
+
+# Модулі, які підкоманда імпортує (для --import-only та startup)
+PRELOAD = {
+    "cipher": [("lab02", "lab2")],
+    "stego": [("lab03", "fast_stego"), ("lab03", "payload_format")],
+    "sign": [("lab04", "lab_4_kozhan")],
+    "encrypt": [("lab05", "lab_5_kozan")],
+    "sqlsearch": [("lab06", "db_pool")],
+}
+# Підкоманди без важких залежностей: для них ціль - до 50 мс на імпорт
+LIGHT_COMMANDS = ("cipher", "sign", "sqlsearch")
+STARTUP_TARGET_MS = 50
+
+IMPORT_TIMES = {}  # модуль -> мс на перший імпорт
+
+_pools = {}  # шлях до БД -> ConnectionPool
+_encryptor = None
+
+
+def _load(lab, module):
+    """Імпортує module з папки лабораторної lab при першому зверненні."""
+    if module in sys.modules:
+        return sys.modules[module]
+    path = os.path.join(ROOT, lab)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    start = time.perf_counter()
+    __import__(module)
+    IMPORT_TIMES[module] = (time.perf_counter() - start) * 1000
+    return sys.modules[module]
+
+
+def _require(job, name):
+    value = job.get(name)
+    if value is None or value == "":
+        raise ValueError(f"Помилка: Не задано параметр {name}.")
+    return value
+
+
+# --- Підкоманди: кожна приймає словник параметрів і повертає словник результату ---
+
+def run_cipher(job):
+    text = _require(job, "text")
+    method = job.get("method", "caesar")
+    decrypt = bool(job.get("decrypt"))
+    if len(text) >= FAST_CIPHER_MIN:
+        fast = _load("lab02", "fast_cipher")
+        caesar, vigenere = fast.fast_caesar, fast.fast_vigenere
+    else:
+        lab = _load("lab02", "lab2")
+        caesar, vigenere = lab.caesar_cipher, lab.vigenere_cipher
+    if method == "caesar":
+        return {"text": caesar(text, int(_require(job, "shift")), decrypt)}
+    if method == "vigenere":
+        return {"text": vigenere(text, _require(job, "key"), decrypt)}
+    raise ValueError(f"Помилка: Невідомий шифр {method} (caesar або vigenere).")
+
+
+def run_stego(job):
+    action = job.get("action", "hide")
+    fast_stego = _load("lab03", "fast_stego")
+    bits = int(job.get("bits", 1))
+    alpha = bool(job.get("alpha"))
+    key = job.get("key")
+    if action == "hide":
+        flag_text = _load("lab03", "payload_format").FLAG_TEXT
+        stego = _require(job, "stego")
+        used, total = fast_stego.hide_data(_require(job, "cover"), stego, _require(job, "message").encode("utf-8"),
+                                           flag_text, bits, alpha, key)
+        return {"stego": stego, "used_bits": used, "capacity_bits": total}
+    if action == "extract":
+        return {"message": fast_stego.extract_text(_require(job, "stego"), bits, alpha, key)}
+    if action == "capacity":
+        return {"bytes": fast_stego.capacity(_require(job, "cover"), bits, alpha)}
+    raise ValueError(f"Помилка: Невідома дія {action} (hide, extract або capacity).")
+
+
+def run_sign(job):
+    action = job.get("action", "sign")
+    lab = _load("lab04", "lab_4_kozhan")
+    private_key = lab.derive_private_key(_require(job, "lastname"), _require(job, "birthday"),
+                                         _require(job, "secret"))
+    public_key = lab.public_key_from_private(private_key)
+    path = _require(job, "path")
+    if action == "sign":
+        return {"signature": lab.sign_file(path, private_key).hex(), "public_key": public_key}
+    if action == "verify":
+        signature = bytes.fromhex(_require(job, "signature"))
+        expected = int(job.get("public_key", public_key))
+        return {"valid": lab.verify_file(path, signature, expected, private_key)}
+    raise ValueError(f"Помилка: Невідома дія {action} (sign або verify).")
+
+
+def run_encrypt(job):
+    global _encryptor
+    action = job.get("action", "encrypt")
+    if _encryptor is None:
+        # Один екземпляр на процес: кеш похідних ключів спільний для всіх завдань
+        _encryptor = _load("lab05", "lab_5_kozan").MessageEncryptor()
+    passphrase = _require(job, "passphrase")
+    if action == "encrypt":
+        return {"token": _encryptor.encrypt(_require(job, "text"), passphrase).decode("ascii")}
+    if action == "decrypt":
+        text = _encryptor.decrypt(_require(job, "token").encode("ascii"), passphrase)
+        if text is None:
+            raise ValueError("Помилка: Невірний пароль або пошкоджена шифрограма.")
+        return {"text": text}
+    raise ValueError(f"Помилка: Невідома дія {action} (encrypt або decrypt).")
+
+
+def run_sqlsearch(job):
+    db_pool = _load("lab06", "db_pool")
+    path = job.get("db") or db_pool.DB_PATH
+    term = _require(job, "term")
+    if job.get("guard"):
+        reasons = _load("lab06", "sqli_detector").detect(term)
+        if reasons:
+            return {"blocked": reasons, "rows": []}
+    pool = _pools.get(path)
+    if pool is None:
+        # ConnectionPool створив би порожню БД на місці неіснуючого файлу
+        if not os.path.exists(path):
+            raise ValueError(f"Помилка: Базу даних {path} не знайдено (створіть її, запустивши lab_6_kozhan.py).")
+        pool = _pools[path] = db_pool.ConnectionPool(path)
+    columns = ("id", "name", "position", "salary", "personal_info")
+    return {"rows": [dict(zip(columns, row)) for row in pool.search(term)]}
+
+
+COMMANDS = {
+    "cipher": run_cipher,
+    "stego": run_stego,
+    "sign": run_sign,
+    "encrypt": run_encrypt,
+    "sqlsearch": run_sqlsearch,
+}
+
+
+def run_job(command, job):
+    handler = COMMANDS.get(command)
+    if handler is None:
+        raise ValueError(f"Помилка: Невідома команда {command} ({', '.join(COMMANDS)}).")
+    return handler(job)
+
+
+def run_jsonl(stream, out, command=None, defaults=None):
+    """
+    Виконує завдання з JSON-рядків stream; результати - по одному JSON-рядку в out.
+    Поле cmd рядка задає підкоманду (за замовчуванням command), defaults - параметри прапорців.
+    Повертає кількість невдалих завдань.
+    """
+    import json
+
+    failed = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        job = None
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("Помилка: Кожен рядок має бути JSON-об'єктом.")
+            params = dict(defaults or {}, **job)
+            reply = {"ok": True, **run_job(params.pop("cmd", command), params)}
+        except Exception as exc:  # одне невдале завдання не зупиняє решту пакета
+            failed += 1
+            reply = {"ok": False, "error": str(exc)}
+        if isinstance(job, dict) and "id" in job:
+            reply = {"id": job["id"], **reply}
+        out.write(json.dumps(reply, ensure_ascii=False) + "\n")
+        out.flush()
+    return failed
+
+
+def _print_plain(result):
+    if len(result) == 1:
+        value, = result.values()
+        if isinstance(value, list):
+            for item in value:
+                print(item)
+        else:
+            print(value)
+        return
+    for name, value in result.items():
+        print(f"{name}: {value}")
+
+
+def report_timings(jobs_start):
+    """Час у stderr: розбір аргументів, перші імпорти модулів лабораторних, завдання, CPU процесу."""
+    imports = ", ".join(f"{name} {ms:.1f}" for name, ms in IMPORT_TIMES.items()) or "-"
+    print(f"[timing] labcli до першого завдання: {(jobs_start - _START) * 1000:.1f} мс, "
+          f"імпорт модулів: {imports} мс, завдання (разом з імпортом): "
+          f"{(time.perf_counter() - jobs_start) * 1000:.1f} мс, "
+          f"CPU процесу від старту інтерпретатора: {time.process_time() * 1000:.0f} мс", file=sys.stderr)
+
+
+def measure_startup(runs=5):
+    """Час запуску нового процесу для кожної підкоманди (лише імпорт модулів)."""
+    import json
+    import statistics
+    import subprocess
+
+    def wall(cmd):
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            times.append((time.perf_counter() - start) * 1000)
+        return statistics.median(times), proc.stdout
+
+    bare, _ = wall([sys.executable, "-c", "pass"])
+    print(f"Порожній інтерпретатор: {bare:.0f} мс (медіана з {runs})")
+    print(f"{'ПІДКОМАНДА':<10} | {'ПРОЦЕС, мс':>10} | {'БЕЗ ІНТЕРПРЕТАТОРА':>18} | {'ІМПОРТ, мс':>10} | ЦІЛЬ")
+    print("-" * 68)
+    for command in COMMANDS:
+        total, out = wall([sys.executable, os.path.abspath(__file__), command, "--import-only"])
+        imported = json.loads(out)["import_ms"]
+        if command in LIGHT_COMMANDS:
+            verdict = "ok" if imported <= STARTUP_TARGET_MS else f"> {STARTUP_TARGET_MS} мс"
+        else:
+            verdict = "важка"
+        print(f"{command:<10} | {total:>10.0f} | {total - bare:>18.0f} | {imported:>10.1f} | {verdict}")
+
+
+def build_parser():
+    import argparse
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--jsonl", action="store_true", default=argparse.SUPPRESS,
+                        help="читати завдання JSON-рядками зі stdin; прапорці задають значення за замовчуванням")
+    common.add_argument("--json", action="store_true", default=argparse.SUPPRESS,
+                        help="вивести результат як JSON")
+    common.add_argument("--timings", action="store_true", default=argparse.SUPPRESS,
+                        help="вивести в stderr час імпорту та виконання")
+
+    parser = argparse.ArgumentParser(description="Неінтерактивний запуск лабораторних 2-6", parents=[common])
+    sub = parser.add_subparsers(dest="command")
+
+    p = sub.add_parser("cipher", parents=[common], help="шифри Цезаря та Віженера (lab02)")
+    p.add_argument("--method", choices=["caesar", "vigenere"])
+    p.add_argument("--text", help="текст (без --text і --jsonl читається зі stdin)")
+    p.add_argument("--shift", type=int)
+    p.add_argument("--key")
+    p.add_argument("--decrypt", action="store_true", default=None)
+
+    p = sub.add_parser("stego", parents=[common], help="LSB-стеганографія (lab03)")
+    p.add_argument("--action", choices=["hide", "extract", "capacity"])
+    p.add_argument("--cover")
+    p.add_argument("--stego")
+    p.add_argument("--message")
+    p.add_argument("--bits", type=int)
+    p.add_argument("--alpha", action="store_true", default=None)
+    p.add_argument("--key")
+
+    p = sub.add_parser("sign", parents=[common], help="підпис та перевірка файлів (lab04)")
+    p.add_argument("--action", choices=["sign", "verify"])
+    p.add_argument("--path")
+    p.add_argument("--lastname")
+    p.add_argument("--birthday")
+    p.add_argument("--secret")
+    p.add_argument("--signature", help="підпис (hex) для verify")
+    p.add_argument("--public-key", type=int)
+
+    p = sub.add_parser("encrypt", parents=[common], help="шифрування повідомлень Fernet (lab05)")
+    p.add_argument("--action", choices=["encrypt", "decrypt"])
+    p.add_argument("--text")
+    p.add_argument("--token")
+    p.add_argument("--passphrase")
+
+    p = sub.add_parser("sqlsearch", parents=[common], help="захищений пошук співробітників (lab06)")
+    p.add_argument("--db", help="файл БД (за замовчуванням demo_db.sqlite у поточній папці)")
+    p.add_argument("--term")
+    p.add_argument("--guard", action="store_true", default=None, help="перевіряти ввід детектором SQL-ін'єкцій")
+
+    for command in COMMANDS:
+        sub.choices[command].add_argument("--import-only", action="store_true", help=argparse.SUPPRESS)
+
+    p = sub.add_parser("startup", help="виміряти час запуску кожної підкоманди")
+    p.add_argument("--runs", type=int, default=5)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    options = vars(args)
+    command = options.pop("command")
+    jsonl = options.pop("jsonl", False)
+    as_json = options.pop("json", False)
+    timings = options.pop("timings", False)
+
+    if command == "startup":
+        measure_startup(args.runs)
+        return 0
+    if options.pop("import_only", False):
+        for lab, module in PRELOAD[command]:
+            _load(lab, module)
+        print('{"import_ms": %.3f}' % sum(IMPORT_TIMES.values()))
+        return 0
+
+    # Прапорці, яких немає в командному рядку, не перекривають значень із JSON-рядків
+    job = {name: value for name, value in options.items() if value is not None}
+    start = time.perf_counter()
+    if jsonl:
+        failed = run_jsonl(sys.stdin, sys.stdout, command, job)
+        if timings:
+            report_timings(start)
+        return 1 if failed else 0
+    if command is None:
+        print("[!] Вкажіть підкоманду або --jsonl.", file=sys.stderr)
+        return 2
+    if command == "cipher" and "text" not in job:
+        job["text"] = sys.stdin.read().removesuffix("\n")
+
+    try:
+        result = run_job(command, job)
+    except (ValueError, OSError) as exc:
+        print(f"[!] {exc}", file=sys.stderr)
+        return 1
+    if as_json:
+        import json
+        print(json.dumps(result, ensure_ascii=False))
+    else:
+        _print_plain(result)
+    if timings:
+        report_timings(start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())